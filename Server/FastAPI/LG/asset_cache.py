@@ -0,0 +1,73 @@
+import hashlib
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+RigKey = Tuple[str, str]
+
+class RemoteAssetCache:
+    def __init__(self):
+        self._manifests: Dict[RigKey, Dict[str, dict]] = {}
+        self._local_digests: Dict[str, Tuple[float, int, str]] = {}
+        self._lock = threading.Lock()
+        self.upload_count = 0
+        self.skip_count = 0
+
+    def local_digest(self, local_path: str) -> str:
+        stat = os.stat(local_path)
+        with self._lock:
+            cached = self._local_digests.get(local_path)
+        if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+            return cached[2]
+
+        sha = hashlib.sha256()
+        with open(local_path, 'rb') as local_file:
+            for chunk in iter(lambda: local_file.read(65536), b''):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+
+        with self._lock:
+            self._local_digests[local_path] = (stat.st_mtime, stat.st_size, digest)
+        return digest
+
+    def is_uploaded(self, rig_key: RigKey, remote_path: str, digest: str, remote_stat) -> bool:
+        with self._lock:
+            entry = self._manifests.get(rig_key, {}).get(remote_path)
+            current = bool(
+                entry and remote_stat is not None and
+                entry['digest'] == digest and
+                entry['size'] == remote_stat.st_size and
+                entry['mtime'] == remote_stat.st_mtime
+            )
+            if current:
+                self.skip_count += 1
+            return current
+
+    def record(self, rig_key: RigKey, remote_path: str, digest: str, remote_stat):
+        with self._lock:
+            self._manifests.setdefault(rig_key, {})[remote_path] = {
+                'digest': digest,
+                'size': remote_stat.st_size,
+                'mtime': remote_stat.st_mtime,
+            }
+            self.upload_count += 1
+
+    def forget(self, rig_key: RigKey, remote_path: Optional[str] = None):
+        with self._lock:
+            if remote_path is None:
+                self._manifests.pop(rig_key, None)
+            else:
+                self._manifests.get(rig_key, {}).pop(remote_path, None)
+
+    def get_status(self) -> dict:
+        with self._lock:
+            return {
+                "uploads": self.upload_count,
+                "skips": self.skip_count,
+                "rigs": {
+                    f"{user}@{host}": sorted(manifest.keys())
+                    for (host, user), manifest in self._manifests.items()
+                },
+            }
+
+asset_cache = RemoteAssetCache()
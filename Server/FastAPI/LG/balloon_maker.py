@@ -1,40 +1,139 @@
-from typing import Dict, Any, List
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple, Union
 import time
 
+from .kml_templates import CompiledTemplate, TEMPLATE_SLOT
+
+BALLOON_TEMPLATE_CACHE_SIZE = 64
+COLOR_RULE_CACHE_SIZE = 512
+STATUS_COLOR_CACHE_SIZE = 1024
+
+DEFAULT_COLOR = "#F3F4F6"
+GOOD_COLOR = "#10B981"
+WARNING_COLOR = "#F59E0B"
+ERROR_COLOR = "#EF4444"
+INFO_COLOR = "#06B6D4"
+PURPLE_COLOR = "#8B5CF6"
+
+class ColorThresholds:
+    def __init__(self, bounds: List[float], colors: List[str]):
+        self.bounds = bounds
+        self.colors = colors
+
+    def color_for(self, value: float) -> str:
+        return self.colors[bisect_right(self.bounds, value)]
+
+TEMPERATURE_THRESHOLDS = ColorThresholds([40, 60, 75], [GOOD_COLOR, INFO_COLOR, WARNING_COLOR, ERROR_COLOR])
+MOTOR_TEMPERATURE_THRESHOLDS = ColorThresholds([50, 70], [GOOD_COLOR, WARNING_COLOR, ERROR_COLOR])
+
+LABEL_COLOR_RULES = {
+    'GPS Position': [
+        (('latitude', 'longitude'), INFO_COLOR),
+        (('altitude',), GOOD_COLOR),
+        (('speed',), PURPLE_COLOR),
+    ],
+    'IMU Sensors': [
+        (('gyroscope', 'gyro'), PURPLE_COLOR),
+        (('accelerometer', 'accel'), WARNING_COLOR),
+        (('magnetometer', 'mag'), INFO_COLOR),
+    ],
+    'Wheel Motors': [
+        (('speed', 'rpm'), PURPLE_COLOR),
+        (('temp',), MOTOR_TEMPERATURE_THRESHOLDS),
+        (('current', 'consumption'), INFO_COLOR),
+        (('voltage',), WARNING_COLOR),
+    ],
+    'LiDAR Status': [
+        (('camera',), PURPLE_COLOR),
+    ],
+}
+
+SENSOR_COLOR_RULES = {
+    'Temperature': TEMPERATURE_THRESHOLDS,
+}
+
+STATUS_KEYWORDS = [
+    ('good', ['connected', 'active', 'online', 'ok', 'good', 'operational', 'streaming']),
+    ('warning', ['warning', 'slow', 'degraded', 'high']),
+    ('error', ['error', 'failed', 'offline', 'bad', 'critical', 'disconnected']),
+    ('info', ['unknown', 'n/a', 'null', 'monitoring', 'normal']),
+]
+
+STATUS_COLORS = {
+    'good': GOOD_COLOR,
+    'warning': WARNING_COLOR,
+    'error': ERROR_COLOR,
+    'info': INFO_COLOR,
+}
+
+STATUS_COLOR_PATTERN = re.compile(
+    '|'.join(
+        f"(?=.*?(?:{'|'.join(re.escape(keyword) for keyword in keywords)}))(?P<{name}>)"
+        for name, keywords in STATUS_KEYWORDS
+    ),
+    re.IGNORECASE | re.DOTALL,
+)
+
 class BalloonMaker:
     
     @staticmethod
-    def generate_sensor_balloon(sensor_data: Dict[str, Any], selected_sensor: str) -> str:
+    def generate_sensor_balloon(sensor_name: str, sensor_items: List[Dict[str, Any]]) -> str:
 
-        data_list = sensor_data.get('data', [])
-        sensor_items = [item for item in data_list if item.get('category') == selected_sensor]
-        
-        if not sensor_items:
-            sensor_items = data_list
-        
-        html_content = BalloonMaker._generate_sensor_html(selected_sensor, sensor_items)
+        labels = tuple(item.get('label', 'Unknown') for item in sensor_items)
+        template = BalloonMaker._compile_sensor_balloon(sensor_name, labels)
         
-        return BalloonMaker.screenOverlayBalloon(html_content)
+        return template.render(BalloonMaker._row_values(sensor_name, sensor_items))
     
     @staticmethod
-    def generate_multi_sensor_balloon(sensor_data: Dict[str, Any], selected_sensors: List[str]) -> str:
+    def generate_multi_sensor_balloon(organized_data: Dict[str, List[Dict[str, Any]]]) -> str:
 
-        data_list = sensor_data.get('data', [])
+        layout = tuple(
+            (sensor_name, tuple(item.get('label', 'Unknown') for item in sensor_items))
+            for sensor_name, sensor_items in organized_data.items()
+        )
+        template = BalloonMaker._compile_multi_sensor_balloon(layout)
 
-        organized_data = {}
-        for sensor in selected_sensors:
-            if sensor == 'RGB Camera':
-                continue 
-            sensor_items = [item for item in data_list if item.get('category') == sensor]
-            if sensor_items:
-                organized_data[sensor] = sensor_items
+        values = []
+        for sensor_name, sensor_items in organized_data.items():
+            values.extend(BalloonMaker._row_values(sensor_name, sensor_items))
+        
+        return template.render(values)
 
-        if not organized_data and data_list:
-            organized_data['All Sensors'] = data_list
+    @staticmethod
+    def sensor_rows(sensor_name: str, sensor_items: List[Dict[str, Any]]) -> List[Tuple[str, str, str]]:
+        rows = []
+        for item in sensor_items:
+            label = item.get('label', 'Unknown')
+            value = item.get('value', 'N/A')
+            display_value = f"{value} {item.get('unit', '')}".strip()
+            rows.append((label, display_value, BalloonMaker._get_sensor_color(sensor_name, label, value)))
+        return rows
 
-        html_content = BalloonMaker._generate_multi_sensor_html(organized_data)
-        
-        return BalloonMaker.screenOverlayBalloon(html_content)
+    @staticmethod
+    def _row_values(sensor_name: str, sensor_items: List[Dict[str, Any]]) -> List[str]:
+        values = []
+        for item in sensor_items:
+            value = item.get('value', 'N/A')
+            values.append(BalloonMaker._get_sensor_color(sensor_name, item.get('label', 'Unknown'), value))
+            values.append(f"{value} {item.get('unit', '')}".strip())
+        return values
+
+    @staticmethod
+    @lru_cache(maxsize=BALLOON_TEMPLATE_CACHE_SIZE)
+    def _compile_sensor_balloon(sensor_name: str, labels: Tuple[str, ...]) -> CompiledTemplate:
+        rows = [(label, TEMPLATE_SLOT, TEMPLATE_SLOT) for label in labels]
+        return CompiledTemplate(BalloonMaker.screenOverlayBalloon(BalloonMaker._generate_sensor_html(sensor_name, rows)))
+
+    @staticmethod
+    @lru_cache(maxsize=BALLOON_TEMPLATE_CACHE_SIZE)
+    def _compile_multi_sensor_balloon(layout: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> CompiledTemplate:
+        sections = [
+            (sensor_name, [(label, TEMPLATE_SLOT, TEMPLATE_SLOT) for label in labels])
+            for sensor_name, labels in layout
+        ]
+        return CompiledTemplate(BalloonMaker.screenOverlayBalloon(BalloonMaker._generate_multi_sensor_html(sections)))
     
     @staticmethod
     def screenOverlayBalloon(html_content: str) -> str:
@@ -57,19 +156,9 @@ class BalloonMaker:
 </kml>'''
     
     @staticmethod
-    def _generate_sensor_html(sensor_name: str, sensor_items: List[Dict[str, Any]]) -> str:
-
-        data_rows = ""
-        for item in sensor_items:
-            label = item.get('label', 'Unknown')
-            value = item.get('value', 'N/A')
-            unit = item.get('unit', '')
+    def _generate_sensor_html(sensor_name: str, rows: List[Tuple[str, str, str]]) -> str:
 
-            display_value = f"{value} {unit}".strip()
-            
-            color = BalloonMaker._get_sensor_color(sensor_name, label, value)
-            
-            data_rows += f'''
+        data_rows = "".join(f'''
         <tr>
           <td style="padding: 14px; border-bottom: 1px solid #374151; color: #9CA3AF; font-size: 24px;">
             {label}
@@ -77,7 +166,7 @@ class BalloonMaker:
           <td style="padding: 14px; border-bottom: 1px solid #374151; color: {color}; font-size: 26px; font-weight: bold; text-align: right;">
             {display_value}
           </td>
-        </tr>'''
+        </tr>''' for label, color, display_value in rows)
         
         return f'''<div style="width: 700px; color: white; padding-left: 18px; padding-right: 18px;">
       <center>
@@ -91,20 +180,11 @@ class BalloonMaker:
     </div>'''
     
     @staticmethod
-    def _generate_multi_sensor_html(organized_data: Dict[str, List[Dict[str, Any]]]) -> str:
+    def _generate_multi_sensor_html(sections: List[Tuple[str, List[Tuple[str, str, str]]]]) -> str:
         
-        sections = ""
-        for sensor_name, sensor_items in organized_data.items():
-            data_rows = ""
-            for item in sensor_items:
-                label = item.get('label', 'Unknown')
-                value = item.get('value', 'N/A')
-                unit = item.get('unit', '')
-                
-                display_value = f"{value} {unit}".strip()
-                color = BalloonMaker._get_sensor_color(sensor_name, label, value)
-                
-                data_rows += f'''
+        section_markup = ""
+        for sensor_name, rows in sections:
+            data_rows = "".join(f'''
           <tr>
             <td style="padding: 10px 14px; color: #9CA3AF; font-size: 21px;">
               {label}
@@ -112,9 +192,9 @@ class BalloonMaker:
             <td style="padding: 10px 14px; color: {color}; font-size: 24px; font-weight: bold; text-align: right;">
               {display_value}
             </td>
-          </tr>'''
+          </tr>''' for label, color, display_value in rows)
 
-            sections += f'''
+            section_markup += f'''
         <h3 style="color: #F3F4F6; font-size: 30px; margin: 26px 0 14px 0; font-weight: 600;">
           {sensor_name}
         </h3>
@@ -125,7 +205,7 @@ class BalloonMaker:
         return f'''<div style="width: 800px; color: white; padding-left: 18px; padding-right: 18px;">
       <center>
         <h1 style="color:white; font-size: 46px;">Multi-Sensor Dashboard</h1>
-        {sections}
+        {section_markup}
         <br>
         <p style="color:white; font-size: 25px;">RoboStream | Liquid Galaxy | GSoC 2025</p>
       </center>
@@ -134,75 +214,28 @@ class BalloonMaker:
     @staticmethod
     def _get_sensor_color(sensor_name: str, label: str, value: Any) -> str:
 
-        default_color = "#F3F4F6"  
-        good_color = "#10B981"    
-        warning_color = "#F59E0B"  
-        error_color = "#EF4444"   
-        info_color = "#06B6D4"   
-        purple_color = "#8B5CF6"  
-
-        value_str = str(value).lower()
-        
-        if sensor_name == 'GPS Position':
-            if 'latitude' in label.lower() or 'longitude' in label.lower():
-                return info_color
-            elif 'altitude' in label.lower():
-                return good_color
-            elif 'speed' in label.lower():
-                return purple_color
-
-        elif sensor_name == 'IMU Sensors':
-            if 'gyroscope' in label.lower() or 'gyro' in label.lower():
-                return purple_color 
-            elif 'accelerometer' in label.lower() or 'accel' in label.lower():
-                return warning_color  
-            elif 'magnetometer' in label.lower() or 'mag' in label.lower():
-                return info_color  
-
-        elif sensor_name == 'Temperature':
+        rule = BalloonMaker._color_rule(sensor_name, label)
+        if isinstance(rule, str):
+            return rule
+        if rule is not None:
             try:
-                temp_val = float(value)
-                if temp_val < 40:
-                    return good_color   
-                elif temp_val < 60:
-                    return info_color   
-                elif temp_val < 75:
-                    return warning_color 
-                else:
-                    return error_color   
-            except:
+                return rule.color_for(float(value))
+            except (TypeError, ValueError):
                 pass
 
-        elif sensor_name == 'Wheel Motors':
-            if 'speed' in label.lower() or 'rpm' in label.lower():
-                return purple_color
-            elif 'temp' in label.lower():
-                try:
-                    temp_val = float(value)
-                    if temp_val < 50:
-                        return good_color
-                    elif temp_val < 70:
-                        return warning_color
-                    else:
-                        return error_color
-                except:
-                    pass
-            elif 'current' in label.lower() or 'consumption' in label.lower():
-                return info_color
-            elif 'voltage' in label.lower():
-                return warning_color
-
-        elif sensor_name == 'LiDAR Status':
-            if 'camera' in label.lower():
-                return purple_color
-        
-        if any(status in value_str for status in ['connected', 'active', 'online', 'ok', 'good', 'operational', 'streaming']):
-            return good_color
-        elif any(status in value_str for status in ['warning', 'slow', 'degraded', 'high']):
-            return warning_color
-        elif any(status in value_str for status in ['error', 'failed', 'offline', 'bad', 'critical', 'disconnected']):
-            return error_color
-        elif any(status in value_str for status in ['unknown', 'n/a', 'null', 'monitoring', 'normal']):
-            return info_color
-        
-        return default_color
+        return BalloonMaker._status_color(str(value))
+
+    @staticmethod
+    @lru_cache(maxsize=STATUS_COLOR_CACHE_SIZE)
+    def _status_color(value: str) -> str:
+        match = STATUS_COLOR_PATTERN.match(value)
+        return STATUS_COLORS[match.lastgroup] if match else DEFAULT_COLOR
+
+    @staticmethod
+    @lru_cache(maxsize=COLOR_RULE_CACHE_SIZE)
+    def _color_rule(sensor_name: str, label: str) -> Optional[Union[str, ColorThresholds]]:
+        label_lower = label.lower()
+        for keywords, rule in LABEL_COLOR_RULES.get(sensor_name, ()):
+            if any(keyword in label_lower for keyword in keywords):
+                return rule
+        return SENSOR_COLOR_RULES.get(sensor_name)
@@ -0,0 +1,109 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import List
+
+SSH_MAX_SESSIONS = 10
+SSH_CHANNEL_WAIT_TIMEOUT = 10.0
+SSH_CHANNEL_POLL_INTERVAL = 0.1
+
+class ChannelBudget:
+    def __init__(self, reserved: int = 0, max_sessions: int = SSH_MAX_SESSIONS):
+        self.reserved = reserved
+        self.limit = max_sessions - reserved
+        self._condition = threading.Condition()
+        self._active = 0
+        self._detached: List = []
+        self.opened_count = 0
+        self.peak_in_use = 0
+        self.wait_count = 0
+        self.total_wait_ms = 0.0
+
+    def _prune_locked(self):
+        self._detached = [channel for channel in self._detached if not channel.closed]
+
+    def _in_use_locked(self) -> int:
+        return self._active + len(self._detached)
+
+    def acquire(self, timeout: float = SSH_CHANNEL_WAIT_TIMEOUT):
+        with self._condition:
+            started = time.monotonic()
+            waited = False
+            while True:
+                self._prune_locked()
+                if self._in_use_locked() < self.limit:
+                    break
+                remaining = timeout - (time.monotonic() - started)
+                if remaining <= 0:
+                    raise TimeoutError(f"No SSH channel available within {timeout}s ({self.limit} in use)")
+                waited = True
+                self._condition.wait(min(remaining, SSH_CHANNEL_POLL_INTERVAL))
+
+            if waited:
+                self.wait_count += 1
+                self.total_wait_ms += (time.monotonic() - started) * 1000
+            self._active += 1
+            self.opened_count += 1
+            self.peak_in_use = max(self.peak_in_use, self._in_use_locked())
+
+    def release(self, detached_channel=None):
+        with self._condition:
+            self._active -= 1
+            if detached_channel is not None and not detached_channel.closed:
+                self._detached.append(detached_channel)
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self):
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def get_status(self) -> dict:
+        with self._condition:
+            self._prune_locked()
+            return {
+                "limit": self.limit,
+                "reserved": self.reserved,
+                "in_use": self._in_use_locked(),
+                "detached_open": len(self._detached),
+                "opened": self.opened_count,
+                "peak_in_use": self.peak_in_use,
+                "waits": self.wait_count,
+                "avg_wait_ms": round(self.total_wait_ms / self.wait_count, 2) if self.wait_count else 0.0,
+            }
+
+class LaneLock:
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.RLock()
+        self.acquire_count = 0
+        self.contended_count = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    def __enter__(self):
+        if not self._lock.acquire(blocking=False):
+            started = time.monotonic()
+            self._lock.acquire()
+            wait_ms = (time.monotonic() - started) * 1000
+            self.contended_count += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+        self.acquire_count += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._lock.release()
+        return False
+
+    def get_status(self) -> dict:
+        return {
+            "name": self.name,
+            "acquired": self.acquire_count,
+            "contended": self.contended_count,
+            "avg_wait_ms": round(self.total_wait_ms / self.contended_count, 2) if self.contended_count else 0.0,
+            "max_wait_ms": round(self.max_wait_ms, 2),
+        }
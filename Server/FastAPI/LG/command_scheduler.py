@@ -0,0 +1,137 @@
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional
+
+PRIORITY_NAVIGATION = 0
+PRIORITY_TELEMETRY = 1
+PRIORITY_HOUSEKEEPING = 2
+
+PRIORITY_NAMES = {
+    PRIORITY_NAVIGATION: "navigation",
+    PRIORITY_TELEMETRY: "telemetry",
+    PRIORITY_HOUSEKEEPING: "housekeeping",
+}
+
+SCHEDULER_GENERAL_WORKERS = 8
+
+class LGCommandExpired(Exception):
+    pass
+
+def deadline_in(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else time.monotonic() + seconds
+
+class LGCommandScheduler:
+    def __init__(self, name: str, general_workers: int = SCHEDULER_GENERAL_WORKERS):
+        self.name = name
+        self.general_workers = general_workers
+        self._queue: List[tuple] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._closed = False
+        self._stats: Dict[int, dict] = {
+            priority: {
+                "submitted": 0,
+                "completed": 0,
+                "failed": 0,
+                "expired": 0,
+                "total_wait_ms": 0.0,
+                "max_wait_ms": 0.0,
+            }
+            for priority in PRIORITY_NAMES
+        }
+
+    def _start_locked(self):
+        if self._threads:
+            return
+        lanes = [PRIORITY_NAVIGATION] + [PRIORITY_HOUSEKEEPING] * self.general_workers
+        for index, max_priority in enumerate(lanes):
+            thread = threading.Thread(
+                target=self._worker,
+                args=(max_priority,),
+                name=f"lg-sched-{self.name}-{index}",
+                daemon=True
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def submit(self, priority: int, func: Callable, *args, deadline: Optional[float] = None, **kwargs) -> Future:
+        future = Future()
+        with self._condition:
+            if self._closed:
+                future.set_exception(RuntimeError(f"Command scheduler for {self.name} is closed"))
+                return future
+            self._start_locked()
+            heapq.heappush(self._queue, (priority, next(self._counter), time.monotonic(), deadline, future, func, args, kwargs))
+            self._stats[priority]["submitted"] += 1
+            self._condition.notify_all()
+        return future
+
+    def _worker(self, max_priority: int):
+        while True:
+            with self._condition:
+                while not self._closed and (not self._queue or self._queue[0][0] > max_priority):
+                    self._condition.wait()
+                if self._closed:
+                    return
+                priority, _, enqueued_at, deadline, future, func, args, kwargs = heapq.heappop(self._queue)
+                if not future.set_running_or_notify_cancel():
+                    continue
+                started_at = time.monotonic()
+                stats = self._stats[priority]
+                wait_ms = (started_at - enqueued_at) * 1000
+                stats["total_wait_ms"] += wait_ms
+                stats["max_wait_ms"] = max(stats["max_wait_ms"], wait_ms)
+                expired = deadline is not None and started_at > deadline
+                if expired:
+                    stats["expired"] += 1
+
+            if expired:
+                future.set_exception(LGCommandExpired(
+                    f"{PRIORITY_NAMES[priority]} command expired after waiting {wait_ms:.0f}ms"
+                ))
+                continue
+
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                with self._condition:
+                    stats["failed"] += 1
+                future.set_exception(e)
+            else:
+                with self._condition:
+                    stats["completed"] += 1
+                future.set_result(result)
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            pending, self._queue = self._queue, []
+            self._condition.notify_all()
+        for entry in pending:
+            entry[4].cancel()
+
+    def get_status(self) -> dict:
+        with self._condition:
+            depth = {name: 0 for name in PRIORITY_NAMES.values()}
+            for entry in self._queue:
+                depth[PRIORITY_NAMES[entry[0]]] += 1
+            classes = {}
+            for priority, stats in self._stats.items():
+                started = stats["completed"] + stats["failed"] + stats["expired"]
+                classes[PRIORITY_NAMES[priority]] = {
+                    "submitted": stats["submitted"],
+                    "completed": stats["completed"],
+                    "failed": stats["failed"],
+                    "expired": stats["expired"],
+                    "avg_wait_ms": round(stats["total_wait_ms"] / started, 2) if started else 0.0,
+                    "max_wait_ms": round(stats["max_wait_ms"], 2),
+                }
+            return {
+                "workers": len(self._threads),
+                "queue_depth": depth,
+                "classes": classes,
+            }
@@ -0,0 +1,71 @@
+import random
+import time
+from typing import Optional
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+DEFAULT_FAILURE_THRESHOLD = 2
+DEFAULT_BASE_DELAY_S = 1.0
+DEFAULT_MAX_DELAY_S = 60.0
+DEFAULT_JITTER = 0.2
+
+class ConnectionBreaker:
+    def __init__(self, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 base_delay_s: float = DEFAULT_BASE_DELAY_S,
+                 max_delay_s: float = DEFAULT_MAX_DELAY_S,
+                 jitter: float = DEFAULT_JITTER):
+        self.failure_threshold = failure_threshold
+        self.base_delay_s = base_delay_s
+        self.max_delay_s = max_delay_s
+        self.jitter = jitter
+        self.state = BREAKER_CLOSED
+        self.consecutive_failures = 0
+        self.open_count = 0
+        self.retry_at = 0.0
+        self.rejected_count = 0
+        self.last_error: Optional[str] = None
+
+    def backoff_delay(self) -> float:
+        delay = min(self.max_delay_s, self.base_delay_s * (2 ** max(0, self.open_count - 1)))
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def allow_attempt(self, now: Optional[float] = None) -> bool:
+        now = time.monotonic() if now is None else now
+        if self.state == BREAKER_CLOSED:
+            return True
+        if self.state == BREAKER_OPEN and now >= self.retry_at:
+            self.state = BREAKER_HALF_OPEN
+            return True
+        self.rejected_count += 1
+        return False
+
+    def record_success(self):
+        self.state = BREAKER_CLOSED
+        self.consecutive_failures = 0
+        self.open_count = 0
+        self.last_error = None
+
+    def record_failure(self, error: str = "", now: Optional[float] = None):
+        now = time.monotonic() if now is None else now
+        self.consecutive_failures += 1
+        self.last_error = error or None
+        if self.state == BREAKER_HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self.state = BREAKER_OPEN
+            self.open_count += 1
+            self.retry_at = now + self.backoff_delay()
+
+    def retry_in(self, now: Optional[float] = None) -> float:
+        now = time.monotonic() if now is None else now
+        return max(0.0, self.retry_at - now) if self.state == BREAKER_OPEN else 0.0
+
+    def get_status(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "open_count": self.open_count,
+            "retry_in_s": round(self.retry_in(), 2),
+            "rejected": self.rejected_count,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,165 @@
+import asyncio
+import multiprocessing
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+DASHBOARD_RENDER_WORKERS = 2
+DASHBOARD_LAYOUT_CACHE_SIZE = 16
+DASHBOARD_GLYPH_CACHE_SIZE = 2048
+DASHBOARD_PNG_COMPRESS_LEVEL = 3
+
+DASHBOARD_WIDTH = 800
+DASHBOARD_PADDING = 24
+TITLE_HEIGHT = 84
+SECTION_HEIGHT = 56
+ROW_HEIGHT = 48
+FOOTER_HEIGHT = 64
+
+BACKGROUND_COLOR = "#1E1E1E"
+TITLE_COLOR = "#FFFFFF"
+SECTION_COLOR = "#F3F4F6"
+LABEL_COLOR = "#9CA3AF"
+DIVIDER_COLOR = "#374151"
+FOOTER_TEXT = "RoboStream | Liquid Galaxy | GSoC 2025"
+
+FONT_FILES = {
+    False: ["DejaVuSans.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"],
+    True: ["DejaVuSans-Bold.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"],
+}
+
+DashboardRow = Tuple[str, str, str]
+DashboardSection = Tuple[str, List[DashboardRow]]
+
+@lru_cache(maxsize=None)
+def _font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
+    for font_file in FONT_FILES[bold]:
+        try:
+            return ImageFont.truetype(font_file, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size)
+
+@lru_cache(maxsize=DASHBOARD_GLYPH_CACHE_SIZE)
+def _text_mask(text: str, size: int, bold: bool) -> Image.Image:
+    font = _font(size, bold)
+    left, top, right, bottom = font.getbbox(text)
+    mask = Image.new("L", (max(1, right - left), max(1, bottom - top)), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255)
+    return mask
+
+def _paste_text(image: Image.Image, text: str, size: int, bold: bool, color: str,
+                x: int, y_center: int, align: str = "left"):
+    mask = _text_mask(text, size, bold)
+    if align == "right":
+        x -= mask.width
+    elif align == "center":
+        x -= mask.width // 2
+    image.paste(color, (x, y_center - mask.height // 2), mask)
+
+class DashboardLayout:
+    def __init__(self, title: str, sections: List[Tuple[str, Tuple[str, ...]]]):
+        show_headers = len(sections) > 1
+        row_count = sum(len(labels) for _, labels in sections)
+        height = TITLE_HEIGHT + FOOTER_HEIGHT + row_count * ROW_HEIGHT
+        height += len(sections) * SECTION_HEIGHT if show_headers else 0
+
+        self.base = Image.new("RGB", (DASHBOARD_WIDTH, height), BACKGROUND_COLOR)
+        draw = ImageDraw.Draw(self.base)
+        _paste_text(self.base, title, 40, True, TITLE_COLOR, DASHBOARD_WIDTH // 2, TITLE_HEIGHT // 2, "center")
+
+        self.value_boxes: List[Tuple[int, int, int, int]] = []
+        y = TITLE_HEIGHT
+        for section_name, labels in sections:
+            if show_headers:
+                _paste_text(self.base, section_name, 28, True, SECTION_COLOR, DASHBOARD_PADDING, y + SECTION_HEIGHT // 2)
+                y += SECTION_HEIGHT
+            for label in labels:
+                _paste_text(self.base, label, 22, False, LABEL_COLOR, DASHBOARD_PADDING, y + ROW_HEIGHT // 2)
+                draw.line((DASHBOARD_PADDING, y + ROW_HEIGHT - 1, DASHBOARD_WIDTH - DASHBOARD_PADDING, y + ROW_HEIGHT - 1), fill=DIVIDER_COLOR)
+                self.value_boxes.append((DASHBOARD_WIDTH // 2, y, DASHBOARD_WIDTH - DASHBOARD_PADDING, y + ROW_HEIGHT - 1))
+                y += ROW_HEIGHT
+        _paste_text(self.base, FOOTER_TEXT, 20, False, TITLE_COLOR, DASHBOARD_WIDTH // 2, y + FOOTER_HEIGHT // 2, "center")
+
+        self.image = self.base.copy()
+        self.drawn: List[Optional[Tuple[str, str]]] = [None] * len(self.value_boxes)
+
+    def update(self, values: List[Tuple[str, str]]) -> int:
+        dirty = 0
+        for index, (box, value) in enumerate(zip(self.value_boxes, values, strict=True)):
+            if self.drawn[index] == value:
+                continue
+            text, color = value
+            self.image.paste(self.base.crop(box), box[:2])
+            _paste_text(self.image, text, 24, True, color, box[2], (box[1] + box[3]) // 2, "right")
+            self.drawn[index] = value
+            dirty += 1
+        return dirty
+
+_layouts: "OrderedDict[Tuple, DashboardLayout]" = OrderedDict()
+
+def render_dashboard_png(title: str, sections: List[DashboardSection]) -> Tuple[bytes, int, int]:
+    key = (title, tuple((name, tuple(row[0] for row in rows)) for name, rows in sections))
+    layout = _layouts.get(key)
+    if layout is None:
+        layout = DashboardLayout(title, list(key[1]))
+        _layouts[key] = layout
+        if len(_layouts) > DASHBOARD_LAYOUT_CACHE_SIZE:
+            _layouts.popitem(last=False)
+    else:
+        _layouts.move_to_end(key)
+
+    dirty = layout.update([(value, color) for _, rows in sections for _, value, color in rows])
+
+    with BytesIO() as buffer:
+        layout.image.save(buffer, "PNG", compress_level=DASHBOARD_PNG_COMPRESS_LEVEL)
+        return buffer.getvalue(), dirty, len(layout.value_boxes)
+
+class DashboardRenderer:
+    def __init__(self, max_workers: int = DASHBOARD_RENDER_WORKERS):
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.render_count = 0
+        self.dirty_rows = 0
+        self.total_rows = 0
+        self.total_render_ms = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(start_method)
+            )
+        return self._executor
+
+    async def render(self, title: str, sections: List[DashboardSection]) -> bytes:
+        started = time.monotonic()
+        loop = asyncio.get_running_loop()
+        png_bytes, dirty, rows = await loop.run_in_executor(self._get_executor(), render_dashboard_png, title, sections)
+        self.render_count += 1
+        self.dirty_rows += dirty
+        self.total_rows += rows
+        self.total_render_ms += (time.monotonic() - started) * 1000
+        return png_bytes
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def get_status(self) -> Dict[str, float]:
+        return {
+            "workers": self.max_workers,
+            "renders": self.render_count,
+            "dirty_rows": self.dirty_rows,
+            "total_rows": self.total_rows,
+            "avg_render_ms": round(self.total_render_ms / self.render_count, 2) if self.render_count else 0.0,
+        }
+
+dashboard_renderer = DashboardRenderer()
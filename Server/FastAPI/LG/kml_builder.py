@@ -1,14 +1,22 @@
 import time
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 import time
 from .balloon_maker import BalloonMaker
+from .kml_templates import CompiledTemplate, TEMPLATE_SLOT
+from .sensor_items import SensorSnapshot
 
 class KMLBuilder:
     def __init__(self, lg_host: str):
         self.lg_host = lg_host
+        self._logo_kml = self._render_logo_kml()
+        self._empty_kml = self._build_kml_document('Empty', '')
+        self._camera_templates: Dict[str, CompiledTemplate] = {}
     
     def build_logo_kml(self) -> str:
+        return self._logo_kml
+
+    def _render_logo_kml(self) -> str:
         return self._build_kml_document(
             'RoboStreamLogo',
             self._build_screen_overlay(
@@ -21,20 +29,23 @@ class KMLBuilder:
         )
     
     def build_camera_kml(self, server_host: str) -> str:
-        timestamp = int(time.time())
-        return self._build_kml_document(
-            'RoboStreamCameraFeed',
-            self._build_screen_overlay(
-                'RGBCamera',
-                f'http://{server_host}:8000/rgb-camera/image?t={timestamp}',
-                overlay_xy='1,1',
-                screen_xy='0.98,0.98',
-                size='800,667,pixels',
-            ),
-        )
+        template = self._camera_templates.get(server_host)
+        if template is None:
+            template = CompiledTemplate(self._build_kml_document(
+                'RoboStreamCameraFeed',
+                self._build_screen_overlay(
+                    'RGBCamera',
+                    f'http://{server_host}:8000/rgb-camera/image?t={TEMPLATE_SLOT}',
+                    overlay_xy='1,1',
+                    screen_xy='0.98,0.98',
+                    size='800,667,pixels',
+                ),
+            ))
+            self._camera_templates[server_host] = template
+        return template.render([str(int(time.time()))])
     
-    def build_sensor_data_kml(self, sensor_type: str) -> str:
-        image_name = self._get_sensor_image_name(sensor_type)
+    def build_sensor_data_kml(self, sensor_type: str, image_name: Optional[str] = None) -> str:
+        image_name = image_name or self.get_sensor_image_name(sensor_type)
         return self._build_kml_document(
             f'RoboStream {sensor_type} Data',
             self._build_screen_overlay(
@@ -46,9 +57,48 @@ class KMLBuilder:
             ),
         )
     
+    def build_robot_placemark_kml(self, latitude: float, longitude: float, altitude: float = 0, icon_href: str = None) -> str:
+        icon_href = icon_href or f'http://{self.lg_host}:81/amiga-base.png'
+        return f'''<?xml version="1.0" encoding="UTF-8"?>
+<kml xmlns="http://www.opengis.net/kml/2.2">
+  <Document>
+    <Style id="robotStyle">
+      <IconStyle>
+        <Icon>
+          <href>{icon_href}</href>
+        </Icon>
+        <scale>2.5</scale>
+      </IconStyle>
+    </Style>
+    <Placemark>
+      <name></name>
+      <styleUrl>#robotStyle</styleUrl>
+      <Point>
+        <coordinates>{longitude},{latitude},{altitude}</coordinates>
+      </Point>
+    </Placemark>
+  </Document>
+</kml>'''
+    
+    def build_network_link_kml(self, name: str, href: str, refresh_interval: float) -> str:
+        return f'''<?xml version="1.0" encoding="UTF-8"?>
+<kml xmlns="http://www.opengis.net/kml/2.2">
+  <Document>
+    <name>{name}</name>
+    <NetworkLink>
+      <name>{name}</name>
+      <Link>
+        <href>{href}</href>
+        <refreshMode>onInterval</refreshMode>
+        <refreshInterval>{refresh_interval}</refreshInterval>
+      </Link>
+    </NetworkLink>
+  </Document>
+</kml>'''
+    
     def build_empty_kml(self) -> str:
 
-        return self._build_kml_document('Empty', '')
+        return self._empty_kml
     
     def _build_kml_document(self, name: str, content: str) -> str:
 
@@ -80,7 +130,7 @@ class KMLBuilder:
       <size x="{size_parts[0]}" y="{size_parts[1]}" xunits="{size_parts[2]}" yunits="{size_parts[2]}"/>
     </ScreenOverlay>'''
     
-    def _get_sensor_image_name(self, sensor_type: str) -> str:
+    def get_sensor_image_name(self, sensor_type: str) -> str:
         timestamp = int(time.time() * 1000)
         sensor_images = {
             'GPS Position': 'gps_data',
@@ -153,105 +203,19 @@ class KMLBuilder:
         return {
             'title': config['title'],
             'data': config['data'],
-            'imageName': self._get_sensor_image_name(selected_sensor),
+            'imageName': self.get_sensor_image_name(selected_sensor),
         }
     
-    def build_sensor_balloon_kml(self, sensor_data: Dict[str, Any], selected_sensor: str) -> str:
-        structured_data = self._prepare_structured_sensor_data(sensor_data, [selected_sensor])
-        return BalloonMaker.generate_sensor_balloon(structured_data, selected_sensor)
-    
-    def build_multi_sensor_balloon_kml(self, sensor_data: Dict[str, Any], selected_sensors: List[str]) -> str:
-        structured_data = self._prepare_structured_sensor_data(sensor_data, selected_sensors)
-        return BalloonMaker.generate_multi_sensor_balloon(structured_data, selected_sensors)
-    
-    def _prepare_structured_sensor_data(self, sensor_data: Dict[str, Any], selected_sensors: List[str]) -> Dict[str, Any]:
-        data_list = []
-        
-        for sensor in selected_sensors:
-            if sensor == 'RGB Camera':
-                continue 
-                
-            sensor_items = self._get_sensor_items(sensor_data, sensor)
-            for item in sensor_items:
-                item['category'] = sensor 
-                data_list.append(item)
-        
-        return {'data': data_list}
+    def build_sensor_balloon_kml(self, snapshot: SensorSnapshot, selected_sensor: str) -> str:
+        sensor_items = snapshot.items_for([selected_sensor])[selected_sensor]
+        return snapshot.render(
+            (selected_sensor,),
+            lambda: BalloonMaker.generate_sensor_balloon(selected_sensor, sensor_items)
+        )
     
-    def _get_sensor_items(self, sensor_data: Dict[str, Any], sensor_name: str) -> List[Dict[str, Any]]:
-        if sensor_name == 'GPS Position':
-            return [
-                {'label': 'Latitude', 'value': f"{sensor_data.get('gps', {}).get('latitude', 0.0):.6f}", 'unit': '°'},
-                {'label': 'Longitude', 'value': f"{sensor_data.get('gps', {}).get('longitude', 0.0):.6f}", 'unit': '°'},
-                {'label': 'Altitude', 'value': f"{sensor_data.get('gps', {}).get('altitude', 0.0):.1f}", 'unit': 'm'},
-                {'label': 'Speed', 'value': f"{sensor_data.get('gps', {}).get('speed', 0.0):.2f}", 'unit': 'm/s'},
-            ]
-        elif sensor_name == 'IMU Sensors':
-            imu_data = sensor_data.get('imu', {})
-            accel = imu_data.get('accelerometer', {})
-            gyro = imu_data.get('gyroscope', {})
-            mag = imu_data.get('magnetometer', {})
-            return [
-                {'label': 'Accel X', 'value': f"{accel.get('x', 0.0):.2f}", 'unit': 'm/s²'},
-                {'label': 'Accel Y', 'value': f"{accel.get('y', 0.0):.2f}", 'unit': 'm/s²'},
-                {'label': 'Accel Z', 'value': f"{accel.get('z', 0.0):.2f}", 'unit': 'm/s²'},
-                {'label': 'Gyro X', 'value': f"{gyro.get('x', 0.0):.3f}", 'unit': 'rad/s'},
-                {'label': 'Gyro Y', 'value': f"{gyro.get('y', 0.0):.3f}", 'unit': 'rad/s'},
-                {'label': 'Gyro Z', 'value': f"{gyro.get('z', 0.0):.3f}", 'unit': 'rad/s'},
-                {'label': 'Mag X', 'value': f"{mag.get('x', 0.0):.2f}", 'unit': 'μT'},
-                {'label': 'Mag Y', 'value': f"{mag.get('y', 0.0):.2f}", 'unit': 'μT'},
-                {'label': 'Mag Z', 'value': f"{mag.get('z', 0.0):.2f}", 'unit': 'μT'},
-            ]
-        elif sensor_name == 'LiDAR Status':
-            return [
-                {'label': 'Status', 'value': sensor_data.get('lidar', 'Unknown'), 'unit': ''},
-                {'label': 'Camera Status', 'value': sensor_data.get('camera', 'Unknown'), 'unit': ''},
-                {'label': 'Last Update', 'value': time.strftime('%H:%M:%S'), 'unit': ''},
-            ]
-        elif sensor_name == 'Temperature':
-            actuators = sensor_data.get('actuators', {})
-            temps = []
-            motor_status = []
-            
-            for wheel_name, wheel_data in actuators.items():
-                if isinstance(wheel_data, dict) and 'temperature' in wheel_data:
-                    temps.append(wheel_data['temperature'])
-                    motor_status.append(wheel_data.get('status', 'Unknown'))
-            
-            avg_temp = sum(temps) / len(temps) if temps else 0.0
-            active_motors = sum(1 for status in motor_status if status == 'Operational')
-            
-            return [
-                {'label': 'Average Temp', 'value': f"{avg_temp:.1f}", 'unit': '°C'},
-                {'label': 'Min Temp', 'value': f"{min(temps):.1f}" if temps else "N/A", 'unit': '°C'},
-                {'label': 'Max Temp', 'value': f"{max(temps):.1f}" if temps else "N/A", 'unit': '°C'},
-                {'label': 'Active Motors', 'value': f"{active_motors}", 'unit': f'/ {len(motor_status)}'},
-                {'label': 'Status', 'value': 'Normal' if avg_temp < 70 else 'High' if avg_temp < 80 else 'Critical', 'unit': ''},
-            ]
-        elif sensor_name == 'Wheel Motors':
-            actuators = sensor_data.get('actuators', {})
-            items = []
-            
-            for wheel_name, wheel_data in actuators.items():
-                if isinstance(wheel_data, dict):
-                    wheel_display = wheel_name.replace('_', ' ').title()
-                    items.extend([
-                        {'label': f'{wheel_display} Speed', 'value': f"{wheel_data.get('speed', 0)}", 'unit': 'RPM'},
-                        {'label': f'{wheel_display} Temp', 'value': f"{wheel_data.get('temperature', 0.0):.1f}", 'unit': '°C'},
-                        {'label': f'{wheel_display} Current', 'value': f"{wheel_data.get('consumption', 0.0):.2f}", 'unit': 'A'},
-                        {'label': f'{wheel_display} Voltage', 'value': f"{wheel_data.get('voltage', 0.0):.1f}", 'unit': 'V'},
-                        {'label': f'{wheel_display} Status', 'value': wheel_data.get('status', 'Unknown'), 'unit': ''},
-                    ])
-            
-            if not items:
-                items = [{'label': 'Status', 'value': 'No Motor Data', 'unit': ''}]
-            
-            return items
-        elif sensor_name == 'Server Link':
-            return [
-                {'label': 'Status', 'value': 'Connected', 'unit': ''},
-                {'label': 'Last Update', 'value': time.strftime('%H:%M:%S'), 'unit': ''},
-                {'label': 'Timestamp', 'value': f"{sensor_data.get('timestamp', 0.0):.0f}", 'unit': ''},
-            ]
-        else:
-            return [{'label': 'Status', 'value': 'No Data', 'unit': ''}]
+    def build_multi_sensor_balloon_kml(self, snapshot: SensorSnapshot, selected_sensors: List[str]) -> str:
+        organized_data = snapshot.items_for(selected_sensors)
+        return snapshot.render(
+            ('multi',) + tuple(organized_data),
+            lambda: BalloonMaker.generate_multi_sensor_balloon(organized_data)
+        )
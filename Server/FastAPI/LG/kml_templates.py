@@ -0,0 +1,16 @@
+from typing import List
+
+TEMPLATE_SLOT = "\x00"
+
+class CompiledTemplate:
+    def __init__(self, text: str):
+        self.chunks = text.split(TEMPLATE_SLOT)
+        self.slot_count = len(self.chunks) - 1
+
+    def render(self, values: List[str]) -> str:
+        if len(values) != self.slot_count:
+            raise ValueError(f"Template expects {self.slot_count} values, got {len(values)}")
+        parts = [""] * (2 * self.slot_count + 1)
+        parts[0::2] = self.chunks
+        parts[1::2] = values
+        return "".join(parts)
@@ -0,0 +1,60 @@
+from typing import List
+
+KMLS_TXT_PATH = '/var/www/html/kmls.txt'
+
+class KmlsTxtModel:
+    def __init__(self):
+        self.entries: List[str] = []
+        self.loaded = False
+        self.write_count = 0
+        self.skip_count = 0
+
+    @staticmethod
+    def parse(content: str) -> List[str]:
+        return [line.strip() for line in content.split('\n') if line.strip()]
+
+    @staticmethod
+    def render(entries: List[str]) -> str:
+        return '\n'.join(entries) + '\n' if entries else ''
+
+    @staticmethod
+    def is_placemark_entry(line: str) -> bool:
+        return 'Placemark.kml' in line or 'placemark' in line.lower()
+
+    def load(self, content: str):
+        self.entries = self.parse(content)
+        self.loaded = True
+
+    @classmethod
+    def without_placemarks(cls, entries: List[str]) -> List[str]:
+        return [line for line in entries if not cls.is_placemark_entry(line)]
+
+    @classmethod
+    def with_placemark(cls, entries: List[str], placemark_url: str) -> List[str]:
+        return cls.without_placemarks(entries) + [placemark_url]
+
+    @staticmethod
+    def without_entry(entries: List[str], url: str) -> List[str]:
+        return [line for line in entries if line != url]
+
+    @staticmethod
+    def with_entry(entries: List[str], url: str) -> List[str]:
+        return entries if url in entries else entries + [url]
+
+    def needs_write(self, entries: List[str]) -> bool:
+        if entries == self.entries:
+            self.skip_count += 1
+            return False
+        return True
+
+    def applied(self, entries: List[str]):
+        self.entries = list(entries)
+        self.write_count += 1
+
+    def get_status(self) -> dict:
+        return {
+            "loaded": self.loaded,
+            "entries": list(self.entries),
+            "writes": self.write_count,
+            "skipped_writes": self.skip_count,
+        }
@@ -1,4 +1,11 @@
+import os
+
 LG_HOST = None
 LG_USERNAME = None
 LG_PASSWORD = None
 LG_TOTAL_SCREENS = None
+
+LG_TRANSPORT = os.environ.get("LG_TRANSPORT", "ssh")
+LG_LOCAL_ROOT = os.environ.get("LG_LOCAL_ROOT", "lg_local_rig")
+LG_LOCAL_LATENCY_S = float(os.environ.get("LG_LOCAL_LATENCY_S", "0"))
+LG_LOCAL_FAILURE_RATE = float(os.environ.get("LG_LOCAL_FAILURE_RATE", "0"))
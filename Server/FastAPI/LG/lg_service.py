@@ -2,16 +2,35 @@ import asyncio
 import base64
 import json
 import time
-from typing import Optional, List, Dict, Any
-import paramiko
-from io import BytesIO
+from typing import Optional, List, Dict, Any, Union, Callable, Awaitable, Tuple
 import os
 
 from . import lg_data
 from .slave_calculator import SlaveCalculator
 from .kml_builder import KMLBuilder
+from .ssh_executor import run_blocking
+from .transport import LGTransport, create_transport
+from .remote_writer import REMOTE_WRITER_MAX_BYTES
+from .asset_cache import asset_cache
+from .kmls_model import KmlsTxtModel, KMLS_TXT_PATH
+from .placemark_updater import PlacemarkUpdater
+from .movement_filter import MovementFilter
+from .sensor_items import SensorSnapshot
+from .balloon_maker import BalloonMaker
+from .dashboard_renderer import dashboard_renderer
+from .reconciler import LGReconciler, slave_target, QUERY_TARGET
+from .single_flight import SingleFlight, single_flight
+from .connection_breaker import ConnectionBreaker
+from .command_scheduler import (
+    PRIORITY_NAVIGATION, PRIORITY_TELEMETRY, PRIORITY_HOUSEKEEPING, LGCommandExpired, deadline_in
+)
 from SimulatedGPS import LocationData
 
+DEFAULT_RIG_ID = "default"
+LIVE_PLACEMARK_FILENAME = "robot_live_placemark.kml"
+ROBOT_TRAIL_FILENAME = "robot_trail.kml"
+PLACEMARK_UPDATE_DEADLINE_S = 5.0
+
 class Coordinates:
     def __init__(self, latitude, longitude, elevation, tilt, bearing, altitude):
         self.latitude = latitude
@@ -29,71 +48,152 @@ class LoginResult:
         self.success = success
         self.message = message
 
+class ScreenOperationResult:
+    def __init__(self, success: bool, screens: Optional[Dict[int, Dict[str, Any]]] = None):
+        self.success = success
+        self.screens = screens or {}
+
 class LGConnectionManager:
     def __init__(self, host: str, username: str, password: str, total_screens: int):
         self.host = host
         self.username = username
         self.password = password
         self.total_screens = total_screens
-        self.client: Optional[paramiko.SSHClient] = None
-        self.sftp: Optional[paramiko.SFTPClient] = None
-        self.is_connected = False
+        self.transport: Optional[LGTransport] = None
+        self.rig_key = (host, username)
         
         self.slave_calculator = SlaveCalculator(total_screens)
         self.kml_builder = KMLBuilder(host)
         
         self.placemark_counter = 0
         self.current_placemark_file = None
+        self.kmls_model = KmlsTxtModel()
+        self.placemark_updater = PlacemarkUpdater(self.send_robot_placemark)
+        self.movement_filter = MovementFilter()
+        self.reconciler = LGReconciler(self)
+        self.breaker = ConnectionBreaker()
+        self._connect_lock = asyncio.Lock()
         
-    async def connect(self) -> bool:
-        try:
-            self.client = paramiko.SSHClient()
-            self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            
-            self.client.connect(
-                hostname=self.host,
-                username=self.username,
-                password=self.password,
-                timeout=10
-            )
-            
-            stdin, stdout, stderr = self.client.exec_command('echo "Connection successful"')
-            stdout.read()
-            
-            self.sftp = self.client.open_sftp()
-            
-            self.is_connected = True
+    @property
+    def is_connected(self) -> bool:
+        return self.transport is not None and self.transport.is_alive()
+
+    def _connect_blocking(self):
+        previous = self.transport
+        self.transport = create_transport(self.host, self.username, self.password)
+        if previous is not None:
+            previous.close()
+        self.transport.connect()
+
+    async def _schedule(self, priority: int, func, *args, deadline: Optional[float] = None):
+        future = self.transport.scheduler.submit(priority, func, *args, deadline=deadline)
+        return await asyncio.wrap_future(future)
+
+    async def _exec(self, command: str, priority: int = PRIORITY_HOUSEKEEPING) -> str:
+        return await self._schedule(priority, self.transport.exec, command)
+
+    async def _exec_detached(self, command: str, priority: int = PRIORITY_HOUSEKEEPING):
+        await self._schedule(priority, self.transport.exec_detached, command)
+
+    async def _write_remote_file(self, remote_path: str, content: Union[str, bytes],
+                                 priority: int = PRIORITY_TELEMETRY, deadline: Optional[float] = None):
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        await self._schedule(priority, self.transport.write_file, remote_path, data, deadline=deadline)
+
+    async def _read_remote_file(self, remote_path: str, priority: int = PRIORITY_TELEMETRY) -> str:
+        return await self._schedule(priority, self.transport.read_file, remote_path)
+
+    async def _remove_remote_file(self, remote_path: str, priority: int = PRIORITY_TELEMETRY):
+        await self._schedule(priority, self.transport.remove_file, remote_path)
+
+    def _upload_asset_blocking(self, local_path: str, remote_path: str, mode: int = 0o644) -> bool:
+        digest = asset_cache.local_digest(local_path)
+        transport = self.transport
+        with transport.file_lock:
+            if asset_cache.is_uploaded(self.rig_key, remote_path, digest, transport.stat(remote_path)):
+                return False
+
+            with open(local_path, 'rb') as local_file:
+                transport.write_file(remote_path, local_file.read(), mode)
+            asset_cache.record(self.rig_key, remote_path, digest, transport.stat(remote_path))
             return True
-            
-        except Exception as e:
-            print(f"LG Connection error: {e}")
-            await self.disconnect()
-            return False
+
+    async def _upload_asset(self, local_path: str, remote_path: str, mode: int = 0o644,
+                            priority: int = PRIORITY_TELEMETRY, deadline: Optional[float] = None) -> bool:
+        return await self._schedule(priority, self._upload_asset_blocking, local_path, remote_path, mode, deadline=deadline)
+
+    async def _write_via_helper(self, remote_path: str, content: str, priority: int = PRIORITY_TELEMETRY):
+        navigation = priority == PRIORITY_NAVIGATION
+        await self._schedule(priority, self.transport.write_small, remote_path, content, navigation)
+
+    async def connect(self) -> bool:
+        async with self._connect_lock:
+            if self.is_connected:
+                return True
+
+            if not self.breaker.allow_attempt():
+                print(f"LG connection to {self.host} skipped: circuit open, retry in {self.breaker.retry_in():.1f}s")
+                return False
+
+            try:
+                await run_blocking(self._connect_blocking)
+                self.reconciler.invalidate()
+                self.kmls_model.load(await self._read_remote_file(KMLS_TXT_PATH))
+                self.breaker.record_success()
+                return True
+                
+            except Exception as e:
+                print(f"LG Connection error: {e}")
+                self.breaker.record_failure(str(e))
+                await self.disconnect()
+                return False
     
     async def disconnect(self):
         self.current_placemark_file = None
-        
-        if self.sftp:
-            self.sftp.close()
-            self.sftp = None
-        if self.client:
-            self.client.close()
-            self.client = None
-        self.is_connected = False
+        transport, self.transport = self.transport, None
+        if transport:
+            await run_blocking(transport.close)
     
-    async def send_kml_to_slave(self, kml_content: str, slave_number: int) -> bool:
-        if not self.is_connected or not self.client:
+    async def send_kml_to_slave(self, kml_content: str, slave_number: int, force: bool = False) -> bool:
+        if not self.is_connected:
             return False
+
+        if not force and self.reconciler.is_applied(slave_target(slave_number), kml_content):
+            self.reconciler.slave_skip_count += 1
+            return True
             
         try:
-            command = f"echo '{kml_content}' > /var/www/html/kml/slave_{slave_number}.kml"
-            stdin, stdout, stderr = self.client.exec_command(command)
-            stdout.read()
+            remote_path = f'/var/www/html/kml/slave_{slave_number}.kml'
+            if len(kml_content) > REMOTE_WRITER_MAX_BYTES:
+                await self._write_remote_file(remote_path, kml_content)
+            else:
+                await self._write_via_helper(remote_path, kml_content)
+            self.reconciler.mark_applied(slave_target(slave_number), kml_content)
+            self.reconciler.slave_write_count += 1
             return True
         except Exception as e:
+            self.reconciler.forget(slave_target(slave_number))
             print(f"Error sending KML to slave {slave_number}: {e}")
             return False
     
+    async def run_on_screens(self, screens: List[int], operation: Callable[[int], Awaitable[bool]]) -> Dict[int, Dict[str, Any]]:
+        async def run_screen(screen: int):
+            started = time.perf_counter()
+            error = None
+            try:
+                success = bool(await operation(screen))
+            except Exception as e:
+                success = False
+                error = str(e)
+            return screen, {
+                "success": success,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                "error": error,
+            }
+
+        results = await asyncio.gather(*(run_screen(screen) for screen in screens))
+        return dict(results)
+
     async def send_kml_to_leftmost_screen(self, kml_content: str) -> bool:
         return await self.send_kml_to_slave(kml_content, self.slave_calculator.leftmost_screen)
     
@@ -101,68 +201,97 @@ class LGConnectionManager:
         return await self.send_kml_to_slave(kml_content, self.slave_calculator.rightmost_screen)
     
     async def send_robot_placemark(self, latitude: float, longitude: float, altitude: float = 0) -> bool:
-        if not self.is_connected or not self.client or not self.sftp:
+        if not self.is_connected:
             return False
             
         try:
-            await self._delete_previous_placemark()
-            
-            self.placemark_counter += 1
-            new_placemark_filename = f"placemark{self.placemark_counter}.kml"
-            self.current_placemark_file = new_placemark_filename
-            
             robot_icon_path = "AMIGA_ROBOT_PNG/amiga-base.png"
             if not os.path.exists(robot_icon_path):
                 print(f"ERROR: Amiga robot icon file not found at {robot_icon_path}")
                 return False
                 
-            icon_uploaded = await self._upload_robot_icon(robot_icon_path)
+            icon_uploaded = await self._upload_robot_icon(robot_icon_path, deadline_in(PLACEMARK_UPDATE_DEADLINE_S))
             if not icon_uploaded:
                 print("ERROR: Failed to upload Amiga robot icon to LG1. Cannot create placemark.")
                 return False
             
+            await self._delete_previous_placemark()
+            
+            self.placemark_counter += 1
+            new_placemark_filename = f"placemark{self.placemark_counter}.kml"
+            self.current_placemark_file = new_placemark_filename
+            
             await asyncio.sleep(0.1)
             
-            placemark_kml = f'''<?xml version="1.0" encoding="UTF-8"?>
-<kml xmlns="http://www.opengis.net/kml/2.2">
-  <Document>
-    <Style id="robotStyle">
-      <IconStyle>
-        <Icon>
-          <href>http://{self.host}:81/amiga-base.png</href>
-        </Icon>
-        <scale>2.5</scale>
-      </IconStyle>
-    </Style>
-    <Placemark>
-      <name></name>
-      <styleUrl>#robotStyle</styleUrl>
-      <Point>
-        <coordinates>{longitude},{latitude},{altitude}</coordinates>
-      </Point>
-    </Placemark>
-  </Document>
-</kml>'''
+            placemark_kml = self.kml_builder.build_robot_placemark_kml(latitude, longitude, altitude)
             
             remote_path = f'/var/www/html/{new_placemark_filename}'
-            with BytesIO(placemark_kml.encode('utf-8')) as kml_io:
-                self.sftp.putfo(kml_io, remote_path)
+            await self._write_remote_file(remote_path, placemark_kml)
             await self.update_kmls_txt()
             
             print(f"Robot placemark updated: {new_placemark_filename} at coordinates {latitude}, {longitude}")
             return True
+        except LGCommandExpired as e:
+            print(f"Robot placemark update dropped: {e}")
+            return False
         except Exception as e:
             print(f"Error sending robot placemark: {e}")
             return False
 
+    async def send_live_robot_placemark_link(self, placemark_href: str, refresh_interval: float) -> bool:
+        if not self.is_connected:
+            return False
+            
+        try:
+            self.movement_filter.reset()
+            await self.placemark_updater.cancel()
+            if self.current_placemark_file != LIVE_PLACEMARK_FILENAME:
+                await self._delete_previous_placemark()
+            self.current_placemark_file = LIVE_PLACEMARK_FILENAME
+            
+            link_kml = self.kml_builder.build_network_link_kml('RobotLivePlacemark', placemark_href, refresh_interval)
+            await self._write_remote_file(f'/var/www/html/{LIVE_PLACEMARK_FILENAME}', link_kml)
+            await self.update_kmls_txt()
+            
+            print(f"Live robot placemark linked to {placemark_href} (refresh every {refresh_interval}s)")
+            return True
+        except Exception as e:
+            print(f"Error sending live robot placemark link: {e}")
+            return False
+
+    async def send_robot_trail_link(self, trail_href: str, refresh_interval: float) -> bool:
+        if not self.is_connected:
+            return False
+            
+        try:
+            link_kml = self.kml_builder.build_network_link_kml('RobotTrail', trail_href, refresh_interval)
+            await self._write_remote_file(f'/var/www/html/{ROBOT_TRAIL_FILENAME}', link_kml)
+            await self.sync_kmls_entries(lambda entries: KmlsTxtModel.with_entry(entries, f"http://{self.host}:81/{ROBOT_TRAIL_FILENAME}"))
+            
+            print(f"Robot trail linked to {trail_href} (refresh every {refresh_interval}s)")
+            return True
+        except Exception as e:
+            print(f"Error sending robot trail link: {e}")
+            return False
+
+    async def remove_robot_trail_link(self) -> bool:
+        if not self.is_connected:
+            return False
+            
+        try:
+            await self._remove_remote_file(f'/var/www/html/{ROBOT_TRAIL_FILENAME}')
+            await self.sync_kmls_entries(lambda entries: KmlsTxtModel.without_entry(entries, f"http://{self.host}:81/{ROBOT_TRAIL_FILENAME}"))
+            return True
+        except Exception as e:
+            print(f"Error removing robot trail link: {e}")
+            return False
+
     async def _delete_previous_placemark(self) -> bool:
-        if not self.current_placemark_file or not self.is_connected or not self.client:
+        if not self.current_placemark_file or not self.is_connected:
             return True
             
         try:
-            command = f"rm -f /var/www/html/{self.current_placemark_file}"
-            stdin, stdout, stderr = self.client.exec_command(command)
-            stdout.read()
+            await self._remove_remote_file(f"/var/www/html/{self.current_placemark_file}")
             
             print(f"Previous placemark file deleted: {self.current_placemark_file}")
             return True
@@ -170,60 +299,51 @@ class LGConnectionManager:
             print(f"Error deleting previous placemark file {self.current_placemark_file}: {e}")
             return False
 
-    async def _upload_robot_icon(self, local_icon_path: str) -> bool:
-        if not self.is_connected or not self.sftp:
+    async def _upload_robot_icon(self, local_icon_path: str, deadline: Optional[float] = None) -> bool:
+        if not self.is_connected:
             return False
             
         try:
             remote_icon_path = "/var/www/html/amiga-base.png"
             
             if os.path.exists(local_icon_path):
-                self.sftp.put(local_icon_path, remote_icon_path)
-                
-                command = f"chmod 644 {remote_icon_path}"
-                stdin, stdout, stderr = self.client.exec_command(command)
-                stdout.read()
-                
-                print(f"Amiga robot icon uploaded to master server (LG1): {local_icon_path} -> {remote_icon_path}")
+                if await self._upload_asset(local_icon_path, remote_icon_path, deadline=deadline):
+                    print(f"Amiga robot icon uploaded to master server (LG1): {local_icon_path} -> {remote_icon_path}")
                 return True
             else:
                 print(f"Local Amiga robot icon file not found: {local_icon_path}")
                 return False
+        except LGCommandExpired:
+            raise
         except Exception as e:
             print(f"Error uploading Amiga robot icon to master server: {e}")
             return False
     
+    async def write_kmls_entries(self, entries: List[str]):
+        await self._write_remote_file(KMLS_TXT_PATH, KmlsTxtModel.render(entries))
+        self.kmls_model.applied(entries)
+
+    async def sync_kmls_entries(self, edit: Callable[[List[str]], List[str]], force: bool = False) -> bool:
+        self.reconciler.edit_kmls_entries(edit)
+        return await self.reconciler.reconcile_kmls(force)
+
     async def update_kmls_txt(self) -> bool:
-        if not self.is_connected or not self.client or not self.current_placemark_file:
+        if not self.is_connected or not self.current_placemark_file:
             return False
             
         try:
-            try:
-                stdin, stdout, stderr = self.client.exec_command('cat /var/www/html/kmls.txt')
-                current_content = stdout.read().decode('utf-8').strip()
-            except:
-                current_content = ""
-
             placemark_line = f"http://{self.host}:81/{self.current_placemark_file}"
-            lines = current_content.split('\n') if current_content else []
-
-            lines = [line.strip() for line in lines if line.strip() and 
-                    'Placemark.kml' not in line and 'placemark' not in line.lower()]
-            lines.append(placemark_line)
-
-            new_content = '\n'.join(lines)
-            command = f"echo '{new_content}' > /var/www/html/kmls.txt"
-            stdin, stdout, stderr = self.client.exec_command(command)
-            stdout.read()
-            
-            print(f"kmls.txt updated with new placemark: {placemark_line}")
+            if await self.sync_kmls_entries(lambda entries: KmlsTxtModel.with_placemark(entries, placemark_line)):
+                print(f"kmls.txt updated with new placemark: {placemark_line}")
             return True
         except Exception as e:
             print(f"Error updating kmls.txt: {e}")
             return False
 
     async def clean_all_placemark_files(self) -> bool:
-        if not self.is_connected or not self.client:
+        self.movement_filter.reset()
+        await self.placemark_updater.cancel()
+        if not self.is_connected:
             return False
             
         try:
@@ -233,26 +353,12 @@ class LGConnectionManager:
             ]
             
             for command in commands:
-                stdin, stdout, stderr = self.client.exec_command(command)
-                stdout.read()
+                await self._exec(command)
             
-            try:
-                stdin, stdout, stderr = self.client.exec_command('cat /var/www/html/kmls.txt')
-                current_content = stdout.read().decode('utf-8').strip()
-            except:
-                current_content = ""
-
-            if current_content:
-                lines = current_content.split('\n')
-                lines = [line.strip() for line in lines if line.strip() and 
-                        'Placemark.kml' not in line and 'placemark' not in line.lower()]
-                
-                new_content = '\n'.join(lines)
-                command = f"echo '{new_content}' > /var/www/html/kmls.txt"
-                stdin, stdout, stderr = self.client.exec_command(command)
-                stdout.read()
+            await self.sync_kmls_entries(KmlsTxtModel.without_placemarks)
                 
             self.current_placemark_file = None
+            self.movement_filter.reset()
             print("All placemark files cleaned from server")
             return True
         except Exception as e:
@@ -260,35 +366,24 @@ class LGConnectionManager:
             return False
     
     async def remove_robot_placemark(self) -> bool:
-        if not self.is_connected or not self.client:
+        self.movement_filter.reset()
+        await self.placemark_updater.cancel()
+        if not self.is_connected:
             return False
             
         try:
             if self.current_placemark_file:
-                command = f'rm -f /var/www/html/{self.current_placemark_file}'
-                stdin, stdout, stderr = self.client.exec_command(command)
-                stdout.read()
+                await self._remove_remote_file(f'/var/www/html/{self.current_placemark_file}')
 
-            stdin, stdout, stderr = self.client.exec_command('rm -f /var/www/html/Placemark.kml')
-            stdout.read()
+            await self._remove_remote_file('/var/www/html/Placemark.kml')
 
             try:
-                stdin, stdout, stderr = self.client.exec_command('cat /var/www/html/kmls.txt')
-                current_content = stdout.read().decode('utf-8').strip()
-                
-                if current_content:
-                    lines = current_content.split('\n')
-                    lines = [line.strip() for line in lines if line.strip() and 
-                            'Placemark.kml' not in line and 'placemark' not in line.lower()]
-                    new_content = '\n'.join(lines)
-                    
-                    command = f"echo '{new_content}' > /var/www/html/kmls.txt"
-                    stdin, stdout, stderr = self.client.exec_command(command)
-                    stdout.read()
+                await self.sync_kmls_entries(KmlsTxtModel.without_placemarks)
             except Exception as e:
                 print(f"Error updating kmls.txt during removal: {e}")
 
             self.current_placemark_file = None
+            self.movement_filter.reset()
             print("Robot placemark removed from server")
             return True
         except Exception as e:
@@ -296,7 +391,7 @@ class LGConnectionManager:
             return False
     
     async def send_image(self, image_bytes: bytes, filename: str) -> bool:
-        if not self.is_connected or not self.sftp:
+        if not self.is_connected:
             return False
             
         try:
@@ -304,8 +399,7 @@ class LGConnectionManager:
             await self.cleanup_old_images(f'{base_name}_*.png')
             
             remote_path = f'/var/www/html/{filename}'
-            with BytesIO(image_bytes) as image_io:
-                self.sftp.putfo(image_io, remote_path)
+            await self._write_remote_file(remote_path, image_bytes)
             
             return True
         except Exception as e:
@@ -313,12 +407,12 @@ class LGConnectionManager:
             return False
     
     async def send_file_from_path(self, local_path: str, remote_path: str) -> bool:
-        if not self.is_connected or not self.sftp:
+        if not self.is_connected:
             return False
             
         try:
             if os.path.exists(local_path):
-                self.sftp.put(local_path, remote_path)
+                await self._upload_asset(local_path, remote_path)
                 return True
             return False
         except Exception as e:
@@ -326,26 +420,19 @@ class LGConnectionManager:
             return False
     
     async def cleanup_old_images(self, pattern: str) -> bool:
-        if not self.is_connected or not self.client:
+        if not self.is_connected:
             return False
             
         try:
             command = f'find /var/www/html/ -name "{pattern}" -type f -mmin +5 -delete'
-            stdin, stdout, stderr = self.client.exec_command(command)
-            stdout.read()
+            await self._exec(command)
             return True
         except Exception as e:
             print(f"Error cleaning up images: {e}")
             return False
     
     async def clear_slave(self, slave_number: int) -> bool:
-        empty_kml = '''<?xml version="1.0" encoding="UTF-8"?>
-<kml xmlns="http://www.opengis.net/kml/2.2">
-  <Document>
-    <name>Empty</name>
-  </Document>
-</kml>'''
-        return await self.send_kml_to_slave(empty_kml, slave_number)
+        return await self.send_kml_to_slave(self.kml_builder.build_empty_kml(), slave_number)
     
     async def clear_rightmost_screen(self) -> bool:
 
@@ -353,10 +440,6 @@ class LGConnectionManager:
             if not self.is_connected:
                 return False
 
-            if lg_data.LG_TOTAL_SCREENS is None:
-                print("Error: LG_TOTAL_SCREENS not configured")
-                return False
-
             rightmost_screen = self.slave_calculator.rightmost_screen
 
             result = await self.clear_slave(rightmost_screen)
@@ -368,35 +451,46 @@ class LGConnectionManager:
             print(f"Error clearing rightmost screen: {e}")
             return False
     
-    async def relaunch_lg(self) -> bool:
+    async def relaunch_lg(self) -> ScreenOperationResult:
 
         try:
             if not self.is_connected:
-                return False
-
-            if lg_data.LG_TOTAL_SCREENS is None:
-                print("Error: LG_TOTAL_SCREENS not configured")
-                return False
+                return ScreenOperationResult(False)
                 
-            password = lg_data.LG_PASSWORD
-            username = lg_data.LG_USERNAME
-            total_screens = lg_data.LG_TOTAL_SCREENS
+            password = self.password
+            username = self.username
+            total_screens = self.total_screens
             
-            if not password or not username:
+            if not password or not username or not total_screens:
                 print("Error: LG credentials not configured")
-                return False
+                return ScreenOperationResult(False)
             
             print(f"Starting LG relaunch for {total_screens} screens")
 
-            for i in range(total_screens, 0, -1):
-                try:
-                    print(f"Relaunching screen lg{i}")
+            report = await self.run_on_screens(
+                list(range(total_screens, 0, -1)),
+                lambda screen: self._relaunch_screen(screen, username, password)
+            )
+            
+            failed = [screen for screen, status in report.items() if not status["success"]]
+            for screen in failed:
+                print(f"Error relaunching screen lg{screen}: {report[screen]['error']}")
+            
+            print(f"LG relaunch commands completed for all screens ({len(failed)} failed)")
+            return ScreenOperationResult(True, report)
+                
+        except Exception as e:
+            print(f"Error executing lg-relaunch command: {e}")
+            return ScreenOperationResult(False)
+
+    async def _relaunch_screen(self, screen: int, username: str, password: str) -> bool:
+        print(f"Relaunching screen lg{screen}")
 
-                    lg_relaunch_cmd = f'"/home/{username}/bin/lg-relaunch" > /home/{username}/log.txt'
-                    stdin, stdout, stderr = self.client.exec_command(lg_relaunch_cmd)
-                    await asyncio.sleep(1) 
+        lg_relaunch_cmd = f'"/home/{username}/bin/lg-relaunch" > /home/{username}/log.txt'
+        await self._exec_detached(lg_relaunch_cmd)
+        await asyncio.sleep(1) 
 
-                    relaunch_command = f'''RELAUNCH_CMD="\\
+        relaunch_command = f'''RELAUNCH_CMD="\\
 if [ -f /etc/init/lxdm.conf ]; then
   export SERVICE=lxdm
 elif [ -f /etc/init/lightdm.conf ]; then
@@ -409,40 +503,42 @@ if  [[ \\$(service \\$SERVICE status) =~ 'stop' ]]; then
 else
   echo {password} | sudo -S service \\${{SERVICE}} restart
 fi
-" && sshpass -p {password} ssh -x -t {username}@lg{i} "$RELAUNCH_CMD"'''
-                    
-                    stdin, stdout, stderr = self.client.exec_command(relaunch_command)
-
-                    await asyncio.sleep(2)
-                    
-                    print(f"Relaunch command sent to lg{i}")
-                    
-                except Exception as screen_error:
-                    print(f"Error relaunching screen lg{i}: {screen_error}")
-                    continue
+" && sshpass -p {password} ssh -x -t {username}@lg{screen} "$RELAUNCH_CMD"'''
+        
+        await self._exec_detached(relaunch_command)
+        
+        print(f"Relaunch command sent to lg{screen}")
+        return True
+
+    async def write_query(self, query: str) -> bool:
+        self.reconciler.set_query(query)
+        return await self.reconciler.reconcile_query(force=True)
+
+    async def write_query_file(self, query: str) -> bool:
+        if not self.is_connected:
+            return False
             
-            print("LG relaunch commands completed for all screens")
+        try:
+            await self._write_via_helper('/tmp/query.txt', f"{query}\n", PRIORITY_NAVIGATION)
+            self.reconciler.mark_applied(QUERY_TARGET, query)
             return True
-                
         except Exception as e:
-            print(f"Error executing lg-relaunch command: {e}")
+            self.reconciler.forget(QUERY_TARGET)
+            print(f"Error writing query.txt: {e}")
             return False
 
     async def navigate(self, coordinates: Coordinates) -> Optional[str]:
         try:
-            if not self.is_connected or not self.client:
+            if not self.is_connected:
                 print("Error: LG not connected")
                 return None
                 
             coordinates_lookat = coordinates.LookAt()
-            escaped_lookat = coordinates_lookat.replace('"', '\\"')
-            command = f'echo "flytoview={escaped_lookat}" > /tmp/query.txt'
             
-            print(f"Debug: Executing command: {command}")
             print(f"Debug: LookAt XML: {coordinates_lookat}")
             
-            stdin, stdout, stderr = self.client.exec_command(command)
-            stdout.read()
+            if not await self.write_query(f"flytoview={coordinates_lookat}"):
+                return None
             
             print(f"Debug: Navigate command sent - Lat: {coordinates.latitude}, Lon: {coordinates.longitude}")
             return coordinates_lookat
@@ -450,30 +546,100 @@ fi
             print(f"Error in navigate: {e}")
             return None
 
-class LGService:
-    def __init__(self):
-        self.connection_manager: Optional[LGConnectionManager] = None
+class LGRig:
+    def __init__(self, rig_id: str):
+        self.rig_id = rig_id
+        self.manager: Optional[LGConnectionManager] = None
         self.gps_flyto_sent = False
         self.robot_tracking_active = False
-        
-    def _get_connection_manager(self) -> Optional[LGConnectionManager]:
-        if not all([lg_data.LG_HOST, lg_data.LG_USERNAME, lg_data.LG_PASSWORD, lg_data.LG_TOTAL_SCREENS]):
-            return None
-            
-        if (not self.connection_manager or 
-            self.connection_manager.host != lg_data.LG_HOST or
-            self.connection_manager.username != lg_data.LG_USERNAME or
-            self.connection_manager.password != lg_data.LG_PASSWORD or
-            self.connection_manager.total_screens != lg_data.LG_TOTAL_SCREENS):
+        self.live_placemark_active = False
+        self.placemark_filter_config = MovementFilter().get_config()
+        self.dashboard_image: Optional[Tuple[Tuple, str]] = None
+        self.trail_active = False
+        self.placemark_flush_task: Optional[asyncio.Task] = None
+
+    async def bind(self, host: str, username: str, password: str, total_screens: int) -> LGConnectionManager:
+        if (not self.manager or 
+            self.manager.host != host or
+            self.manager.username != username or
+            self.manager.password != password or
+            self.manager.total_screens != total_screens):
             
-            self.connection_manager = LGConnectionManager(
-                lg_data.LG_HOST, lg_data.LG_USERNAME, lg_data.LG_PASSWORD, lg_data.LG_TOTAL_SCREENS
-            )
+            await self.attach(LGConnectionManager(host, username, password, total_screens))
+        return self.manager
+
+    async def attach(self, manager: LGConnectionManager):
+        manager.movement_filter.configure(**self.placemark_filter_config)
+        previous, self.manager = self.manager, manager
+        self.dashboard_image = None
+        if previous is not None and previous is not manager:
+            await self._retire(previous)
+
+    async def detach(self):
+        manager, self.manager = self.manager, None
+        if manager is not None:
+            await self._retire(manager)
+
+    async def _retire(self, manager: LGConnectionManager):
+        flush_task, self.placemark_flush_task = self.placemark_flush_task, None
+        if flush_task is not None and not flush_task.done() and flush_task is not asyncio.current_task():
+            flush_task.cancel()
+        manager.movement_filter.reset()
+        await manager.placemark_updater.cancel()
+        await manager.disconnect()
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "rig_id": self.rig_id,
+            "host": self.manager.host if self.manager else None,
+            "username": self.manager.username if self.manager else None,
+            "total_screens": self.manager.total_screens if self.manager else None,
+            "connected": bool(self.manager and self.manager.is_connected),
+            "transport": self.manager.transport.get_status() if self.manager and self.manager.transport else None,
+            "connection": self.manager.breaker.get_status() if self.manager else None,
+            "robot_tracking_active": self.robot_tracking_active,
+            "live_placemark_active": self.live_placemark_active,
+            "trail_active": self.trail_active,
+        }
+
+class LGService:
+    def __init__(self):
+        self.rigs: Dict[str, LGRig] = {DEFAULT_RIG_ID: LGRig(DEFAULT_RIG_ID)}
+        self.single_flight = SingleFlight()
+
+    @property
+    def connection_manager(self) -> Optional[LGConnectionManager]:
+        return self.rigs[DEFAULT_RIG_ID].manager
+
+    async def _get_rig(self, rig_id: str = DEFAULT_RIG_ID) -> Optional[LGRig]:
+        rig = self.rigs.get(rig_id)
+        if rig is None:
+            return None
+
+        if rig_id == DEFAULT_RIG_ID:
+            if not all([lg_data.LG_HOST, lg_data.LG_USERNAME, lg_data.LG_PASSWORD, lg_data.LG_TOTAL_SCREENS]):
+                return None
+            await rig.bind(lg_data.LG_HOST, lg_data.LG_USERNAME, lg_data.LG_PASSWORD, lg_data.LG_TOTAL_SCREENS)
+        
+        return rig if rig.manager else None
         
-        return self.connection_manager
+    def _get_connection_manager(self, rig_id: str = DEFAULT_RIG_ID) -> Optional[LGConnectionManager]:
+        rig = self.rigs.get(rig_id)
+        return rig.manager if rig else None
+
+    def list_rigs(self) -> List[Dict[str, Any]]:
+        return [rig.get_status() for rig in self.rigs.values()]
+
+    async def remove_rig(self, rig_id: str) -> bool:
+        if rig_id == DEFAULT_RIG_ID or rig_id not in self.rigs:
+            return False
+        rig = self.rigs.pop(rig_id)
+        await rig.detach()
+        return True
     
-    async def login(self, host: str, username: str, password: str, total_screens: int) -> LoginResult:
-        if not host or not username or not password or total_screens <= 0:
+    async def login(self, host: str, username: str, password: str, total_screens: int,
+                    rig_id: str = DEFAULT_RIG_ID) -> LoginResult:
+        if not host or not username or not password or total_screens <= 0 or not rig_id:
             return LoginResult(False, 'Please fill in all fields correctly.')
         
         try:
@@ -482,14 +648,15 @@ class LGService:
             
             if connected:
                 await self._show_logo_with_manager(test_manager)
-                await test_manager.disconnect()
                 
-                lg_data.LG_HOST = host
-                lg_data.LG_USERNAME = username
-                lg_data.LG_PASSWORD = password
-                lg_data.LG_TOTAL_SCREENS = total_screens
+                if rig_id == DEFAULT_RIG_ID:
+                    lg_data.LG_HOST = host
+                    lg_data.LG_USERNAME = username
+                    lg_data.LG_PASSWORD = password
+                    lg_data.LG_TOTAL_SCREENS = total_screens
+                await self.rigs.setdefault(rig_id, LGRig(rig_id)).attach(test_manager)
                 
-                print(f"Debug: Configuration saved - Host: {lg_data.LG_HOST}, Username: {lg_data.LG_USERNAME}, Screens: {lg_data.LG_TOTAL_SCREENS}")
+                print(f"Debug: Configuration saved for rig {rig_id} - Host: {host}, Username: {username}, Screens: {total_screens}")
                 
                 return LoginResult(True, 'Connected successfully. Configuration saved automatically.')
             else:
@@ -498,22 +665,28 @@ class LGService:
         except Exception as e:
             return LoginResult(False, f'Connection error: {str(e)}')
     
-    async def _show_logo_with_manager(self, manager: LGConnectionManager) -> bool:
-        try:
-            logo_kml = manager.kml_builder.build_logo_kml()
+    async def _plan_logo(self, manager: LGConnectionManager):
+        logo_kml = manager.kml_builder.build_logo_kml()
+
+        logo_path = "LOGO_IMAGES/robostream_complete_logo.png"
+        if os.path.exists(logo_path):
+            await manager.send_file_from_path(logo_path, '/var/www/html/robostream_complete_logo.png')
 
-            logo_path = "LOGO_IMAGES/robostream_complete_logo.png"
-            if os.path.exists(logo_path):
-                await manager.send_file_from_path(logo_path, '/var/www/html/robostream_complete_logo.png')
+        manager.reconciler.set_slave(manager.slave_calculator.leftmost_screen, logo_kml)
 
-            return await manager.send_kml_to_leftmost_screen(logo_kml)
+    async def _show_logo_with_manager(self, manager: LGConnectionManager) -> bool:
+        try:
+            await self._plan_logo(manager)
+            return await manager.reconciler.reconcile()
         except Exception as e:
             print(f"Error showing logo: {e}")
             return False
     
-    async def show_logo(self) -> bool:
+    @single_flight
+    async def show_logo(self, rig_id: str = DEFAULT_RIG_ID) -> bool:
         print("Debug: show_logo() called")
-        manager = self._get_connection_manager()
+        rig = await self._get_rig(rig_id)
+        manager = rig.manager if rig else None
         if not manager:
             print("Debug: No connection manager available")
             return False
@@ -536,9 +709,11 @@ class LGService:
             print(f"Error showing logo: {e}")
             return False
     
-    async def show_rgb_camera(self, server_host: str) -> bool:
+    @single_flight
+    async def show_rgb_camera(self, server_host: str, rig_id: str = DEFAULT_RIG_ID) -> bool:
         print(f"Debug: show_rgb_camera() called with server_host: {server_host}")
-        manager = self._get_connection_manager()
+        rig = await self._get_rig(rig_id)
+        manager = rig.manager if rig else None
         if not manager:
             print("Debug: No connection manager available")
             return False
@@ -556,16 +731,19 @@ class LGService:
             print("Debug: Building camera KML...")
             camera_kml = manager.kml_builder.build_camera_kml(server_host)
             print("Debug: Sending KML to rightmost screen...")
-            result = await manager.send_kml_to_rightmost_screen(camera_kml)
-            print(f"Debug: send_kml_to_rightmost_screen result: {result}")
+            manager.reconciler.set_slave(manager.slave_calculator.rightmost_screen, camera_kml)
+            result = await manager.reconciler.reconcile()
+            print(f"Debug: rightmost screen reconcile result: {result}")
             return result
         except Exception as e:
             print(f"Error showing RGB camera: {e}")
             return False
     
-    async def show_sensor_data(self, sensor_data: Dict[str, Any], selected_sensors: List[str]) -> bool:
+    @single_flight
+    async def show_sensor_data(self, sensor_data: SensorSnapshot, selected_sensors: List[str], as_image: bool = False, rig_id: str = DEFAULT_RIG_ID) -> bool:
         print(f"Debug: show_sensor_data() called with sensors: {selected_sensors}")
-        manager = self._get_connection_manager()
+        rig = await self._get_rig(rig_id)
+        manager = rig.manager if rig else None
         if not manager or not selected_sensors:
             print("Debug: No connection manager or no sensors selected")
             return False
@@ -576,47 +754,100 @@ class LGService:
                 if not connected:
                     return False
 
-            camera_overlay = ""
-            non_camera_sensors = [s for s in selected_sensors if s != 'RGB Camera']
-            
-            if 'RGB Camera' in selected_sensors:
-                camera_overlay = self._build_camera_overlay(manager.host, 0)
-
-            balloon_kml = ""
-            if non_camera_sensors:
-                if len(non_camera_sensors) == 1:
-                    balloon_kml = manager.kml_builder.build_sensor_balloon_kml(sensor_data, non_camera_sensors[0])
-                else:
-                    balloon_kml = manager.kml_builder.build_multi_sensor_balloon_kml(sensor_data, non_camera_sensors)
-                    
-            if camera_overlay and balloon_kml:
-                kml_sent = await manager.send_kml_to_rightmost_screen(balloon_kml)
-            elif balloon_kml:
-                kml_sent = await manager.send_kml_to_rightmost_screen(balloon_kml)
-            elif camera_overlay:
-                combined_kml = self._build_combined_kml([camera_overlay])
-                kml_sent = await manager.send_kml_to_rightmost_screen(combined_kml)
+            if as_image:
+                planned = await self._plan_sensor_dashboard(rig, sensor_data, selected_sensors)
             else:
+                planned = self._plan_sensor_data(manager, sensor_data, selected_sensors)
+            if not planned:
                 return False
+            kml_sent = await manager.reconciler.reconcile()
 
-            if 'GPS Position' in selected_sensors and not self.gps_flyto_sent:
-                await self._fly_to_default_gps_location(manager)
-                self.gps_flyto_sent = True
-            
-            if 'GPS Position' in selected_sensors:
-                gps_data = sensor_data.get('gps', {})
-                latitude = gps_data.get('latitude', 0.0)
-                longitude = gps_data.get('longitude', 0.0)
-                altitude = gps_data.get('altitude', 0.0)
-                
-                print(f"Debug: Showing robot placemark at GPS position: {latitude}, {longitude}, {altitude}")
-                await manager.send_robot_placemark(latitude, longitude, altitude)
-                self.robot_tracking_active = True
+            await self._track_gps_sensor(rig, sensor_data, selected_sensors)
             
             return kml_sent
         except Exception as e:
             print(f"Error showing sensor data: {e}")
             return False
+
+    def _plan_sensor_data(self, manager: LGConnectionManager, sensor_data: SensorSnapshot, selected_sensors: List[str]) -> bool:
+        camera_overlay = ""
+        non_camera_sensors = [s for s in selected_sensors if s != 'RGB Camera']
+        
+        if 'RGB Camera' in selected_sensors:
+            camera_overlay = self._build_camera_overlay(manager.host, 0)
+
+        balloon_kml = ""
+        if non_camera_sensors:
+            if len(non_camera_sensors) == 1:
+                balloon_kml = manager.kml_builder.build_sensor_balloon_kml(sensor_data, non_camera_sensors[0])
+            else:
+                balloon_kml = manager.kml_builder.build_multi_sensor_balloon_kml(sensor_data, non_camera_sensors)
+                
+        rightmost = manager.slave_calculator.rightmost_screen
+        if camera_overlay and balloon_kml:
+            manager.reconciler.set_slave(rightmost, balloon_kml)
+        elif balloon_kml:
+            manager.reconciler.set_slave(rightmost, balloon_kml)
+        elif camera_overlay:
+            manager.reconciler.set_slave(rightmost, self._build_combined_kml([camera_overlay]))
+        else:
+            return False
+        return True
+
+    async def _plan_sensor_dashboard(self, rig: LGRig, sensor_data: SensorSnapshot, selected_sensors: List[str]) -> bool:
+        manager = rig.manager
+        organized_data = sensor_data.items_for(selected_sensors)
+        if not organized_data:
+            return self._plan_sensor_data(manager, sensor_data, selected_sensors)
+
+        title = next(iter(organized_data)) if len(organized_data) == 1 else 'Multi-Sensor Dashboard'
+        dashboard_key = (sensor_data.version, tuple(organized_data))
+        if rig.dashboard_image and rig.dashboard_image[0] == dashboard_key:
+            image_name = rig.dashboard_image[1]
+        else:
+            sections = [
+                (sensor_name, BalloonMaker.sensor_rows(sensor_name, sensor_items))
+                for sensor_name, sensor_items in organized_data.items()
+            ]
+            image_bytes = await dashboard_renderer.render(title, sections)
+            image_name = manager.kml_builder.get_sensor_image_name(title)
+            if not await manager.send_image(image_bytes, image_name):
+                return False
+            rig.dashboard_image = (dashboard_key, image_name)
+
+        manager.reconciler.set_slave(
+            manager.slave_calculator.rightmost_screen,
+            manager.kml_builder.build_sensor_data_kml(title, image_name)
+        )
+        return True
+
+    async def _track_gps_sensor(self, rig: LGRig, sensor_data: SensorSnapshot, selected_sensors: List[str]) -> bool:
+        if 'GPS Position' not in selected_sensors:
+            return True
+
+        manager = rig.manager
+
+        if not rig.gps_flyto_sent:
+            await self._fly_to_default_gps_location(manager)
+            rig.gps_flyto_sent = True
+        
+        latitude = sensor_data.latitude
+        longitude = sensor_data.longitude
+        altitude = sensor_data.altitude
+        
+        print(f"Debug: Showing robot placemark at GPS position: {latitude}, {longitude}, {altitude}")
+        result = True
+        generation = manager.placemark_updater.generation
+        if not rig.live_placemark_active:
+            if manager.movement_filter.should_send(latitude, longitude, altitude):
+                result = await manager.placemark_updater.submit(latitude, longitude, altitude)
+                if not result:
+                    manager.movement_filter.reset()
+            else:
+                self._schedule_placemark_flush(rig)
+        if manager.placemark_updater.generation == generation:
+            rig.robot_tracking_active = True
+        return result
     
     async def _fly_to_default_gps_location(self, manager) -> bool:
         try:
@@ -671,11 +902,13 @@ class LGService:
             print(f"Error flying to GPS location: {e}")
             return False
 
-    async def hide_sensor_data(self) -> bool:
-        self.gps_flyto_sent = False  
-        manager = self._get_connection_manager()
+    @single_flight
+    async def hide_sensor_data(self, rig_id: str = DEFAULT_RIG_ID) -> bool:
+        rig = await self._get_rig(rig_id)
+        manager = rig.manager if rig else None
         if not manager:
             return False
+        rig.gps_flyto_sent = False  
             
         try:
             if not manager.is_connected:
@@ -683,17 +916,133 @@ class LGService:
                 if not connected:
                     return False
 
-            clear_result = await manager.clear_slave(manager.slave_calculator.rightmost_screen)
+            manager.reconciler.clear_slave(manager.slave_calculator.rightmost_screen)
+            clear_result = await manager.reconciler.reconcile()
 
-            if self.robot_tracking_active:
-                print("Debug: Hiding robot placemark when stopping sensor streaming")
-                await manager.remove_robot_placemark()
-                self.robot_tracking_active = False
+            await self._release_robot_tracking(rig)
             
             return clear_result
         except Exception as e:
             print(f"Error hiding sensor data: {e}")
             return False
+
+    async def _release_robot_tracking(self, rig: LGRig) -> bool:
+        rig.gps_flyto_sent = False
+        if not rig.robot_tracking_active:
+            return True
+        print("Debug: Hiding robot placemark when stopping sensor streaming")
+        result = await rig.manager.remove_robot_placemark()
+        rig.robot_tracking_active = False
+        rig.live_placemark_active = False
+        return result
+
+    async def run_batch(self, operations: List[Dict[str, Any]], rig_id: str = DEFAULT_RIG_ID) -> List[Dict[str, Any]]:
+        results = [{"op": operation.get("op"), "success": False} for operation in operations]
+        rig = await self._get_rig(rig_id)
+        manager = rig.manager if rig else None
+        if not manager:
+            for result in results:
+                result["error"] = "LG not configured"
+            return results
+
+        try:
+            if not manager.is_connected and not await manager.connect():
+                for result in results:
+                    result["error"] = "Could not connect to Liquid Galaxy"
+                return results
+
+            screen_owners: Dict[int, int] = {}
+            planned: Dict[int, List[int]] = {}
+            followups = []
+            for index, operation in enumerate(operations):
+                try:
+                    planned_op = await self._plan_batch_operation(rig, operation.get("op"), operation.get("params") or {})
+                except Exception as e:
+                    results[index]["error"] = str(e)
+                    continue
+                if planned_op is None:
+                    results[index]["error"] = f"Unsupported operation: {operation.get('op')}"
+                    continue
+
+                screens, followup = planned_op
+                planned[index] = screens
+                for screen in screens:
+                    screen_owners[screen] = index
+                if followup:
+                    followups.append((index, followup))
+
+            await manager.reconciler.reconcile()
+
+            for index, screens in planned.items():
+                results[index]["success"] = all(
+                    manager.reconciler.is_applied(slave_target(screen), manager.reconciler.desired_slaves[screen])
+                    for screen in screens
+                )
+                superseded = [screen for screen in screens if screen_owners[screen] != index]
+                if superseded:
+                    results[index]["superseded_screens"] = superseded
+
+            for index, followup in followups:
+                try:
+                    followup_result = await followup()
+                except Exception as e:
+                    followup_result = False
+                    results[index]["error"] = str(e)
+                results[index]["success"] = results[index]["success"] and bool(followup_result)
+
+            return results
+        except Exception as e:
+            print(f"Error running LG batch: {e}")
+            for result in results:
+                result.setdefault("error", str(e))
+            return results
+
+    async def _plan_batch_operation(self, rig: LGRig, op: str, params: Dict[str, Any]):
+        manager = rig.manager
+        leftmost = manager.slave_calculator.leftmost_screen
+        rightmost = manager.slave_calculator.rightmost_screen
+
+        if op == "show_logo":
+            await self._plan_logo(manager)
+            return [leftmost], None
+        if op == "show_camera":
+            manager.reconciler.set_slave(rightmost, manager.kml_builder.build_camera_kml(params["server_host"]))
+            return [rightmost], None
+        if op == "show_sensors":
+            sensor_data = params.get("sensor_data")
+            selected_sensors = params.get("selected_sensors", [])
+            if sensor_data is None or not selected_sensors:
+                raise ValueError("No displayable sensors selected")
+            if params.get("as_image"):
+                if not await self._plan_sensor_dashboard(rig, sensor_data, selected_sensors):
+                    raise ValueError("Failed to push sensor dashboard image")
+            elif not self._plan_sensor_data(manager, sensor_data, selected_sensors):
+                raise ValueError("No displayable sensors selected")
+            return [rightmost], lambda: self._track_gps_sensor(rig, sensor_data, selected_sensors)
+        if op == "hide_sensors":
+            manager.reconciler.clear_slave(rightmost)
+            return [rightmost], lambda: self._release_robot_tracking(rig)
+        if op == "clear_kml":
+            manager.reconciler.clear_slave(rightmost)
+            return [rightmost], None
+        if op == "clear_logos":
+            manager.reconciler.clear_slave(leftmost)
+            return [leftmost], None
+        if op == "clear_kml_logos":
+            manager.reconciler.clear_slave(rightmost)
+            manager.reconciler.clear_slave(leftmost)
+            return [rightmost, leftmost], None
+        if op == "fly_to":
+            try:
+                latitude = float(params["latitude"])
+                longitude = float(params["longitude"])
+            except (KeyError, TypeError, ValueError):
+                raise ValueError("fly_to requires numeric latitude and longitude") from None
+            if not -90 <= latitude <= 90 or not -180 <= longitude <= 180:
+                raise ValueError(f"fly_to coordinates out of range: {latitude}, {longitude}")
+            gps_data = {**params, "latitude": latitude, "longitude": longitude}
+            return [], lambda: self._fly_to_gps_location(gps_data, manager)
+        return None
     
     def _build_camera_overlay(self, host: str, overlay_index: int) -> str:
         x_position = 0.98 - (overlay_index * 0.2)
@@ -729,12 +1078,16 @@ class LGService:
   </Document>
 </kml>'''
     
-    async def disconnect(self):
-        if self.connection_manager:
-            await self.connection_manager.disconnect()
+    async def disconnect(self, rig_id: Optional[str] = DEFAULT_RIG_ID):
+        rigs = list(self.rigs.values()) if rig_id is None else [self.rigs[rig_id]] if rig_id in self.rigs else []
+        for rig in rigs:
+            if rig.manager:
+                await rig.manager.disconnect()
     
-    async def clear_all_kml(self) -> bool:
-        manager = self._get_connection_manager()
+    @single_flight
+    async def clear_all_kml(self, rig_id: str = DEFAULT_RIG_ID) -> bool:
+        rig = await self._get_rig(rig_id)
+        manager = rig.manager if rig else None
         if not manager:
             return False
             
@@ -744,13 +1097,16 @@ class LGService:
                 if not connected:
                     return False
             
-            return await manager.clear_rightmost_screen()
+            manager.reconciler.clear_slave(manager.slave_calculator.rightmost_screen)
+            return await manager.reconciler.reconcile()
         except Exception as e:
             print(f"Error clearing rightmost screen KML: {e}")
             return False
 
-    async def clear_logos(self) -> bool:
-        manager = self._get_connection_manager()
+    @single_flight
+    async def clear_logos(self, rig_id: str = DEFAULT_RIG_ID) -> bool:
+        rig = await self._get_rig(rig_id)
+        manager = rig.manager if rig else None
         if not manager:
             return False
         try:
@@ -760,7 +1116,8 @@ class LGService:
                     return False
 
             leftmost = manager.slave_calculator.leftmost_screen
-            result = await manager.clear_slave(leftmost)
+            manager.reconciler.clear_slave(leftmost)
+            result = await manager.reconciler.reconcile()
             if not result:
                 print(f"Failed to clear leftmost screen {leftmost}")
             return result
@@ -768,26 +1125,95 @@ class LGService:
             print(f"Error clearing logos (leftmost screen): {e}")
             return False
 
-    async def clean_kml_and_logos(self) -> bool:
-        manager = self._get_connection_manager()
+    @single_flight
+    async def clean_kml_and_logos(self, rig_id: str = DEFAULT_RIG_ID) -> ScreenOperationResult:
+        rig = await self._get_rig(rig_id)
+        manager = rig.manager if rig else None
         if not manager:
+            return ScreenOperationResult(False)
+        try:
+            if not manager.is_connected:
+                connected = await manager.connect()
+                if not connected:
+                    return ScreenOperationResult(False)
+
+            manager.reconciler.clear_slave(manager.slave_calculator.rightmost_screen)
+            manager.reconciler.clear_slave(manager.slave_calculator.leftmost_screen)
+            return ScreenOperationResult(*await manager.reconciler.reconcile_with_report())
+        except Exception as e:
+            print(f"Error cleaning KML + logos: {e}")
+            return ScreenOperationResult(False)
+    
+    @single_flight
+    async def relaunch_lg(self, rig_id: str = DEFAULT_RIG_ID) -> ScreenOperationResult:
+        rig = await self._get_rig(rig_id)
+        manager = rig.manager if rig else None
+        if not manager:
+            return ScreenOperationResult(False)
+            
+        try:
+            if not manager.is_connected:
+                connected = await manager.connect()
+                if not connected:
+                    return ScreenOperationResult(False)
+            
+            return await manager.relaunch_lg()
+        except Exception as e:
+            print(f"Error relaunching Liquid Galaxy: {e}")
+            return ScreenOperationResult(False)
+
+    @single_flight
+    async def show_live_robot_location(self, server_host: str, refresh_interval: float, rig_id: str = DEFAULT_RIG_ID) -> bool:
+        rig = await self._get_rig(rig_id)
+        manager = rig.manager if rig else None
+        if not manager:
+            print("Debug: No connection manager available")
             return False
+            
         try:
             if not manager.is_connected:
                 connected = await manager.connect()
                 if not connected:
                     return False
+            
+            placemark_href = f"http://{server_host}:8000/lg/live/robot.kml"
+            result = await manager.send_live_robot_placemark_link(placemark_href, refresh_interval)
+            
+            if result:
+                rig.live_placemark_active = True
+                rig.robot_tracking_active = True
+            
+            return result
+        except Exception as e:
+            print(f"Error showing live robot location: {e}")
+            return False
 
-            leftmost = manager.slave_calculator.leftmost_screen
-            rightmost_cleared = await manager.clear_rightmost_screen()
-            leftmost_cleared = await manager.clear_slave(leftmost)
-            return rightmost_cleared and leftmost_cleared
+    @single_flight
+    async def show_robot_trail(self, server_host: str, refresh_interval: float, rig_id: str = DEFAULT_RIG_ID) -> bool:
+        rig = await self._get_rig(rig_id)
+        manager = rig.manager if rig else None
+        if not manager:
+            return False
+            
+        try:
+            if not manager.is_connected:
+                connected = await manager.connect()
+                if not connected:
+                    return False
+            
+            trail_href = f"http://{server_host}:8000/lg/live/trail.kml"
+            result = await manager.send_robot_trail_link(trail_href, refresh_interval)
+            if result:
+                rig.trail_active = True
+            return result
         except Exception as e:
-            print(f"Error cleaning KML + logos: {e}")
+            print(f"Error showing robot trail: {e}")
             return False
-    
-    async def relaunch_lg(self) -> bool:
-        manager = self._get_connection_manager()
+
+    @single_flight
+    async def hide_robot_trail(self, rig_id: str = DEFAULT_RIG_ID) -> bool:
+        rig = await self._get_rig(rig_id)
+        manager = rig.manager if rig else None
         if not manager:
             return False
             
@@ -797,17 +1223,37 @@ class LGService:
                 if not connected:
                     return False
             
-            return await manager.relaunch_lg()
+            result = await manager.remove_robot_trail_link()
+            if result:
+                rig.trail_active = False
+            return result
         except Exception as e:
-            print(f"Error relaunching Liquid Galaxy: {e}")
+            print(f"Error hiding robot trail: {e}")
             return False
 
-    async def show_robot_location(self, latitude: float, longitude: float, altitude: float = 0) -> bool:
+    def is_trail_active(self, rig_id: str = DEFAULT_RIG_ID) -> bool:
+        rig = self.rigs.get(rig_id)
+        return bool(rig and rig.trail_active)
+
+    def is_live_placemark_active(self, rig_id: str = DEFAULT_RIG_ID) -> bool:
+        rig = self.rigs.get(rig_id)
+        return bool(rig and rig.live_placemark_active)
+
+    async def show_robot_location(self, latitude: float, longitude: float, altitude: float = 0, rig_id: str = DEFAULT_RIG_ID) -> bool:
         print(f"Debug: show_robot_location called with lat={latitude}, lon={longitude}, alt={altitude}")
-        manager = self._get_connection_manager()
+        rig = await self._get_rig(rig_id)
+        manager = rig.manager if rig else None
         if not manager:
             print("Debug: No connection manager available")
             return False
+
+        if rig.live_placemark_active:
+            return True
+        
+        if not manager.movement_filter.should_send(latitude, longitude, altitude):
+            print("Debug: Robot movement below threshold, placemark update suppressed")
+            self._schedule_placemark_flush(rig)
+            return True
             
         try:
             if not manager.is_connected:
@@ -815,24 +1261,51 @@ class LGService:
                 connected = await manager.connect()
                 if not connected:
                     print("Debug: Failed to connect to LG")
+                    manager.movement_filter.reset()
                     return False
             
             print("Debug: Sending robot placemark...")
-            result = await manager.send_robot_placemark(latitude, longitude, altitude)
+            result = await manager.placemark_updater.submit(latitude, longitude, altitude)
             print(f"Debug: send_robot_placemark result: {result}")
             
             if result:
-                self.robot_tracking_active = True
+                rig.robot_tracking_active = True
                 print(f"Debug: Robot location updated successfully at {latitude}, {longitude}")
+            else:
+                manager.movement_filter.reset()
             
             return result
         except Exception as e:
             print(f"Error showing robot location: {e}")
             return False
     
-    async def hide_robot_location(self) -> bool:
+    def _schedule_placemark_flush(self, rig: LGRig):
+        if rig.placemark_flush_task is None or rig.placemark_flush_task.done():
+            rig.placemark_flush_task = asyncio.create_task(self._flush_placemark_when_due(rig, rig.manager))
+
+    async def _flush_placemark_when_due(self, rig: LGRig, manager: LGConnectionManager):
+        movement_filter = manager.movement_filter
+        while True:
+            delay = movement_filter.flush_delay()
+            if delay is None:
+                return
+            await asyncio.sleep(delay)
+
+            if rig.manager is not manager or rig.live_placemark_active or not manager.is_connected:
+                return
+            position = movement_filter.take_due()
+            if position is None:
+                continue
+            print(f"Debug: Flushing held robot placemark at {position[0]}, {position[1]}")
+            if not await manager.placemark_updater.submit(*position):
+                movement_filter.reset()
+                return
+
+    @single_flight
+    async def hide_robot_location(self, rig_id: str = DEFAULT_RIG_ID) -> bool:
         print("Debug: hide_robot_location called")
-        manager = self._get_connection_manager()
+        rig = await self._get_rig(rig_id)
+        manager = rig.manager if rig else None
         if not manager:
             print("Debug: No connection manager available")
             return False
@@ -848,7 +1321,8 @@ class LGService:
             print(f"Debug: remove_robot_placemark result: {result}")
             
             if result:
-                self.robot_tracking_active = False
+                rig.robot_tracking_active = False
+                rig.live_placemark_active = False
                 print("Debug: Robot location hidden successfully")
             
             return result
@@ -856,7 +1330,93 @@ class LGService:
             print(f"Error hiding robot location: {e}")
             return False
     
-    def is_robot_tracking_active(self) -> bool:
-        return self.robot_tracking_active
+    def is_robot_tracking_active(self, rig_id: str = DEFAULT_RIG_ID) -> bool:
+        rig = self.rigs.get(rig_id)
+        return bool(rig and rig.robot_tracking_active)
+
+    def get_tracking_rig_ids(self) -> List[str]:
+        return [rig_id for rig_id, rig in self.rigs.items() if rig.robot_tracking_active]
+
+    @single_flight
+    async def clean_all_placemark_files(self, rig_id: str = DEFAULT_RIG_ID) -> bool:
+        rig = await self._get_rig(rig_id)
+        manager = rig.manager if rig else None
+        if not manager:
+            return False
+
+        try:
+            if not manager.is_connected:
+                connected = await manager.connect()
+                if not connected:
+                    return False
+
+            result = await manager.clean_all_placemark_files()
+            if result:
+                rig.robot_tracking_active = False
+                rig.live_placemark_active = False
+            return result
+        except Exception as e:
+            print(f"Error cleaning placemark files: {e}")
+            return False
+
+    def get_placemark_update_stats(self, rig_id: str = DEFAULT_RIG_ID) -> Optional[Dict[str, Any]]:
+        manager = self._get_connection_manager(rig_id)
+        if not manager:
+            return None
+        return manager.placemark_updater.get_status()
+
+    async def resync_screens(self, rig_id: str = DEFAULT_RIG_ID) -> ScreenOperationResult:
+        rig = await self._get_rig(rig_id)
+        manager = rig.manager if rig else None
+        if not manager:
+            return ScreenOperationResult(False)
+
+        try:
+            if not manager.is_connected:
+                connected = await manager.connect()
+                if not connected:
+                    return ScreenOperationResult(False)
+
+            return ScreenOperationResult(*await manager.reconciler.reconcile_with_report(force=True))
+        except Exception as e:
+            print(f"Error resyncing LG screens: {e}")
+            return ScreenOperationResult(False)
+
+    def get_reconciler_status(self, rig_id: str = DEFAULT_RIG_ID) -> Optional[Dict[str, Any]]:
+        manager = self._get_connection_manager(rig_id)
+        if not manager:
+            return None
+        return manager.reconciler.get_status()
+
+    def get_single_flight_status(self) -> Dict[str, Any]:
+        return self.single_flight.get_status()
+
+    def get_scheduler_status(self, rig_id: str = DEFAULT_RIG_ID) -> Optional[Dict[str, Any]]:
+        manager = self._get_connection_manager(rig_id)
+        if not manager or not manager.transport:
+            return None
+        return manager.transport.scheduler.get_status()
+
+    def configure_placemark_filter(self, min_distance_m: float, min_interval_s: float, force_refresh_s: float,
+                                   rig_id: str = DEFAULT_RIG_ID) -> Optional[Dict[str, Any]]:
+        rig = self.rigs.get(rig_id)
+        if not rig:
+            return None
+        rig.placemark_filter_config = {
+            "min_distance_m": min_distance_m,
+            "min_interval_s": min_interval_s,
+            "force_refresh_s": force_refresh_s,
+        }
+        if rig.manager:
+            rig.manager.movement_filter.configure(**rig.placemark_filter_config)
+        return self.get_placemark_filter_status(rig_id)
+
+    def get_placemark_filter_status(self, rig_id: str = DEFAULT_RIG_ID) -> Optional[Dict[str, Any]]:
+        rig = self.rigs.get(rig_id)
+        if not rig:
+            return None
+        if not rig.manager:
+            return dict(rig.placemark_filter_config)
+        return rig.manager.movement_filter.get_status()
 
 lg_service = LGService()
@@ -0,0 +1,107 @@
+import math
+import time
+from typing import Optional, Tuple
+
+Position = Tuple[float, float, float]
+
+EARTH_RADIUS_M = 6371000.0
+
+DEFAULT_MIN_DISTANCE_M = 1.0
+DEFAULT_MIN_INTERVAL_S = 0.5
+DEFAULT_FORCE_REFRESH_S = 30.0
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+class MovementFilter:
+    def __init__(self, min_distance_m: float = DEFAULT_MIN_DISTANCE_M,
+                 min_interval_s: float = DEFAULT_MIN_INTERVAL_S,
+                 force_refresh_s: float = DEFAULT_FORCE_REFRESH_S):
+        self.min_distance_m = min_distance_m
+        self.min_interval_s = min_interval_s
+        self.force_refresh_s = force_refresh_s
+        self.last_position: Optional[Tuple[float, float]] = None
+        self.last_sent_at = 0.0
+        self.pending: Optional[Position] = None
+        self.pending_due: Optional[float] = None
+        self.accepted_count = 0
+        self.suppressed_count = 0
+        self.flushed_count = 0
+
+    def configure(self, min_distance_m: float, min_interval_s: float, force_refresh_s: float):
+        self.min_distance_m = min_distance_m
+        self.min_interval_s = min_interval_s
+        self.force_refresh_s = force_refresh_s
+
+    def should_send(self, latitude: float, longitude: float, altitude: float = 0.0, now: Optional[float] = None) -> bool:
+        now = time.monotonic() if now is None else now
+
+        if self.last_position is not None:
+            elapsed = now - self.last_sent_at
+            forced = self.force_refresh_s > 0 and elapsed >= self.force_refresh_s
+            if not forced:
+                moved_m = haversine_m(self.last_position[0], self.last_position[1], latitude, longitude)
+                if elapsed < self.min_interval_s or moved_m < self.min_distance_m:
+                    self.suppressed_count += 1
+                    self._hold(latitude, longitude, altitude, moved_m >= self.min_distance_m)
+                    return False
+
+        self._mark_sent(latitude, longitude, now)
+        self.accepted_count += 1
+        return True
+
+    def _hold(self, latitude: float, longitude: float, altitude: float, moved: bool):
+        if moved:
+            self.pending_due = self.last_sent_at + self.min_interval_s
+        elif self.force_refresh_s > 0:
+            self.pending_due = self.last_sent_at + self.force_refresh_s
+        else:
+            self.pending = self.pending_due = None
+            return
+        self.pending = (latitude, longitude, altitude)
+
+    def _mark_sent(self, latitude: float, longitude: float, now: float):
+        self.last_position = (latitude, longitude)
+        self.last_sent_at = now
+        self.pending = self.pending_due = None
+
+    def flush_delay(self, now: Optional[float] = None) -> Optional[float]:
+        if self.pending is None:
+            return None
+        now = time.monotonic() if now is None else now
+        return max(0.0, self.pending_due - now)
+
+    def take_due(self, now: Optional[float] = None) -> Optional[Position]:
+        now = time.monotonic() if now is None else now
+        if self.pending is None or now < self.pending_due:
+            return None
+        position = self.pending
+        self._mark_sent(position[0], position[1], now)
+        self.flushed_count += 1
+        return position
+
+    def reset(self):
+        self.last_position = None
+        self.last_sent_at = 0.0
+        self.pending = self.pending_due = None
+
+    def get_config(self) -> dict:
+        return {
+            "min_distance_m": self.min_distance_m,
+            "min_interval_s": self.min_interval_s,
+            "force_refresh_s": self.force_refresh_s,
+        }
+
+    def get_status(self) -> dict:
+        return {
+            **self.get_config(),
+            "accepted": self.accepted_count,
+            "suppressed": self.suppressed_count,
+            "flushed": self.flushed_count,
+            "pending": self.pending is not None,
+        }
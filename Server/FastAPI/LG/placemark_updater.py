@@ -0,0 +1,80 @@
+import asyncio
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+Position = Tuple[float, float, float]
+
+class PlacemarkUpdater:
+    def __init__(self, apply_update: Callable[[float, float, float], Awaitable[bool]]):
+        self._apply_update = apply_update
+        self._pending: Optional[Position] = None
+        self._waiters: List[asyncio.Future] = []
+        self._task: Optional[asyncio.Task] = None
+        self.last_applied: Optional[Position] = None
+        self.generation = 0
+        self.submitted_count = 0
+        self.applied_count = 0
+        self.coalesced_count = 0
+        self.cancelled_count = 0
+
+    async def submit(self, latitude: float, longitude: float, altitude: float = 0) -> bool:
+        future = asyncio.get_running_loop().create_future()
+        if self._pending is not None:
+            self.coalesced_count += 1
+        self._pending = (latitude, longitude, altitude)
+        self._waiters.append(future)
+        self.submitted_count += 1
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return await future
+
+    async def _run(self):
+        while self._pending is not None:
+            position, self._pending = self._pending, None
+            waiters, self._waiters = self._waiters, []
+            generation = self.generation
+            try:
+                result = await self._apply_update(*position)
+            except Exception as e:
+                print(f"Error applying placemark update: {e}")
+                result = False
+
+            self.applied_count += 1
+            if generation != self.generation:
+                self.cancelled_count += 1
+                result = False
+            elif result:
+                self.last_applied = position
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(result)
+
+    async def cancel(self):
+        self.generation += 1
+        if self._pending is not None:
+            self.cancelled_count += 1
+        self._pending = None
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(False)
+        self.last_applied = None
+
+        task = self._task
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            await asyncio.shield(task)
+
+    def is_busy(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def get_status(self) -> dict:
+        return {
+            "submitted": self.submitted_count,
+            "applied": self.applied_count,
+            "coalesced": self.coalesced_count,
+            "cancelled": self.cancelled_count,
+            "generation": self.generation,
+            "pending": self._pending is not None,
+            "busy": self.is_busy(),
+            "last_applied": list(self.last_applied) if self.last_applied else None,
+        }
@@ -0,0 +1,139 @@
+import asyncio
+import hashlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+QUERY_TARGET = "query"
+
+def content_hash(content: str) -> str:
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+def slave_target(slave_number: int) -> str:
+    return f"slave_{slave_number}"
+
+class LGReconciler:
+    def __init__(self, manager):
+        self.manager = manager
+        self.desired_slaves: Dict[int, str] = {}
+        self.desired_kmls_entries: Optional[List[str]] = None
+        self.desired_query: Optional[str] = None
+        self.applied_hashes: Dict[str, str] = {}
+        self.write_count = 0
+        self.skip_count = 0
+        self.slave_write_count = 0
+        self.slave_skip_count = 0
+        self._lock = asyncio.Lock()
+        self._kmls_lock = asyncio.Lock()
+
+    def set_slave(self, slave_number: int, kml_content: str):
+        self.desired_slaves[slave_number] = kml_content
+
+    def clear_slave(self, slave_number: int):
+        self.desired_slaves[slave_number] = self.manager.kml_builder.build_empty_kml()
+
+    def set_kmls_entries(self, entries: List[str]):
+        self.desired_kmls_entries = list(entries)
+
+    def kmls_entries(self) -> List[str]:
+        if self.desired_kmls_entries is None:
+            return list(self.manager.kmls_model.entries)
+        return list(self.desired_kmls_entries)
+
+    def edit_kmls_entries(self, edit: Callable[[List[str]], List[str]]):
+        self.set_kmls_entries(edit(self.kmls_entries()))
+
+    def set_query(self, query: str):
+        self.desired_query = query
+
+    def mark_applied(self, target: str, content: str):
+        self.applied_hashes[target] = content_hash(content)
+
+    def forget(self, target: str):
+        self.applied_hashes.pop(target, None)
+
+    def is_applied(self, target: str, content: str) -> bool:
+        return self.applied_hashes.get(target) == content_hash(content)
+
+    def invalidate(self):
+        query_hash = self.applied_hashes.get(QUERY_TARGET)
+        self.applied_hashes.clear()
+        if query_hash is not None:
+            self.applied_hashes[QUERY_TARGET] = query_hash
+
+    def skip_ratio(self) -> float:
+        total = self.slave_write_count + self.slave_skip_count
+        return round(self.slave_skip_count / total, 3) if total else 0.0
+
+    async def reconcile(self, force: bool = False) -> bool:
+        success, _ = await self.reconcile_with_report(force)
+        return success
+
+    async def reconcile_with_report(self, force: bool = False) -> Tuple[bool, Dict[int, Dict[str, Any]]]:
+        async with self._lock:
+            success = True
+            report: Dict[int, Dict[str, Any]] = {}
+
+            desired_slaves = dict(self.desired_slaves)
+            pending = [
+                slave_number for slave_number, kml_content in desired_slaves.items()
+                if force or not self.is_applied(slave_target(slave_number), kml_content)
+            ]
+            self.skip_count += len(desired_slaves) - len(pending)
+            self.slave_skip_count += len(desired_slaves) - len(pending)
+            if pending:
+                report = await self.manager.run_on_screens(
+                    pending,
+                    lambda slave_number: self.manager.send_kml_to_slave(desired_slaves[slave_number], slave_number, force=force)
+                )
+                for status in report.values():
+                    if status["success"]:
+                        self.write_count += 1
+                    else:
+                        success = False
+
+            try:
+                await self.reconcile_kmls(force)
+            except Exception as e:
+                print(f"Error reconciling kmls.txt: {e}")
+                success = False
+
+            if force and not await self.reconcile_query(force=True):
+                success = False
+
+            return success, report
+
+    async def reconcile_kmls(self, force: bool = False) -> bool:
+        async with self._kmls_lock:
+            entries = self.desired_kmls_entries
+            if entries is None:
+                return False
+            if not force and not self.manager.kmls_model.needs_write(entries):
+                self.skip_count += 1
+                return False
+            await self.manager.write_kmls_entries(entries)
+            self.write_count += 1
+            return True
+
+    async def reconcile_query(self, force: bool = False) -> bool:
+        query = self.desired_query
+        if query is None:
+            return True
+        if not force and self.is_applied(QUERY_TARGET, query):
+            self.skip_count += 1
+            return True
+        if not await self.manager.write_query_file(query):
+            return False
+        self.write_count += 1
+        return True
+
+    def get_status(self) -> dict:
+        return {
+            "desired_slaves": sorted(self.desired_slaves.keys()),
+            "desired_kmls_entries": self.desired_kmls_entries,
+            "desired_query": self.desired_query,
+            "applied_targets": sorted(self.applied_hashes.keys()),
+            "writes": self.write_count,
+            "skipped": self.skip_count,
+            "slave_writes": self.slave_write_count,
+            "slave_skips": self.slave_skip_count,
+            "slave_skip_ratio": self.skip_ratio(),
+        }
@@ -0,0 +1,122 @@
+import shlex
+import threading
+import time
+from typing import Dict, Optional, Union
+
+import paramiko
+
+REMOTE_WRITER_TIMEOUT = 10.0
+REMOTE_WRITER_MAX_BYTES = 64 * 1024
+
+REMOTE_WRITER_SCRIPT = (
+    'while read -r size path; do '
+    'if head -c "$size" > "$path.tmp" 2>/dev/null && mv -f "$path.tmp" "$path" 2>/dev/null; '
+    'then echo OK; else echo ERR; fi; '
+    'done'
+)
+
+class _WriterStream:
+    def __init__(self, channel: paramiko.Channel):
+        self.channel = channel
+        self.buffer = b""
+        self.sent = 0
+        self.received = 0
+        self.statuses: Dict[int, str] = {}
+        self.error: Optional[Exception] = None
+        self.recv_lock = threading.Lock()
+
+    def is_usable(self) -> bool:
+        return self.error is None and not self.channel.closed
+
+    def fail(self, error: Exception):
+        if self.error is None:
+            self.error = error
+        try:
+            self.channel.close()
+        except Exception:
+            pass
+
+    def _read_line(self) -> str:
+        while b"\n" not in self.buffer:
+            chunk = self.channel.recv(256)
+            if not chunk:
+                raise EOFError("Remote writer channel closed")
+            self.buffer += chunk
+        line, self.buffer = self.buffer.split(b"\n", 1)
+        return line.decode('utf-8').strip()
+
+    def wait_status(self, ticket: int) -> str:
+        with self.recv_lock:
+            while ticket not in self.statuses:
+                if self.error is not None:
+                    raise self.error
+                try:
+                    status = self._read_line()
+                except Exception as e:
+                    self.fail(e)
+                    raise
+                self.statuses[self.received] = status
+                self.received += 1
+            return self.statuses.pop(ticket)
+
+class RemoteFileWriter:
+    def __init__(self, session):
+        self.session = session
+        self.stream: Optional[_WriterStream] = None
+        self.write_count = 0
+        self.reopen_count = 0
+        self.last_write_ms = 0.0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+
+    def _open(self) -> _WriterStream:
+        transport = self.session.get_client().get_transport()
+        channel = transport.open_session()
+        channel.settimeout(REMOTE_WRITER_TIMEOUT)
+        channel.exec_command(f"bash -c {shlex.quote(REMOTE_WRITER_SCRIPT)}")
+        self.stream = _WriterStream(channel)
+        self.reopen_count += 1
+        return self.stream
+
+    def write(self, remote_path: str, content: Union[str, bytes]):
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        start = time.perf_counter()
+        with self._lock:
+            stream = self.stream
+            if stream is None or not stream.is_usable():
+                if stream is not None:
+                    stream.fail(EOFError("Remote writer channel reopened"))
+                stream = self._open()
+            try:
+                stream.channel.sendall(f"{len(data)} {remote_path}\n".encode('utf-8') + data)
+            except Exception as e:
+                stream.fail(e)
+                raise
+            ticket = stream.sent
+            stream.sent += 1
+            self.peak_in_flight = max(self.peak_in_flight, stream.sent - stream.received)
+
+        status = stream.wait_status(ticket)
+        if status != "OK":
+            stream.fail(RuntimeError(f"Remote writer stream aborted after a failed write to {remote_path}"))
+            raise RuntimeError(f"Remote writer failed for {remote_path}: {status or 'no status'}")
+        with self._lock:
+            self.write_count += 1
+            self.last_write_ms = (time.perf_counter() - start) * 1000
+
+    def close(self):
+        with self._lock:
+            stream, self.stream = self.stream, None
+            if stream is not None:
+                stream.fail(EOFError("Remote writer closed"))
+
+    def get_status(self) -> dict:
+        stream = self.stream
+        return {
+            "open": stream is not None and stream.is_usable(),
+            "writes": self.write_count,
+            "reopens": self.reopen_count,
+            "in_flight": stream.sent - stream.received if stream else 0,
+            "peak_in_flight": self.peak_in_flight,
+            "last_write_ms": round(self.last_write_ms, 2),
+        }
@@ -0,0 +1,127 @@
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from models import SensorData, ActuatorData
+
+CAMERA_SENSOR = 'RGB Camera'
+WHEEL_FIELDS = ['front_left_wheel', 'front_right_wheel', 'back_left_wheel', 'back_right_wheel']
+WHEEL_DISPLAY_NAMES = {field: field.replace('_', ' ').title() for field in WHEEL_FIELDS}
+UNKNOWN_SENSOR_ITEMS = [{'label': 'Status', 'value': 'No Data', 'unit': ''}]
+
+def extract_sensor_items(sensor_data: SensorData, actuator_data: ActuatorData) -> Dict[str, List[Dict[str, str]]]:
+    gps = sensor_data.gps
+    accel = sensor_data.imu.accelerometer
+    gyro = sensor_data.imu.gyroscope
+    mag = sensor_data.imu.magnetometer
+    last_update = time.strftime('%H:%M:%S', time.localtime(sensor_data.timestamp))
+
+    wheel_items = []
+    temps = []
+    active_motors = 0
+    for field in WHEEL_FIELDS:
+        wheel = getattr(actuator_data, field)
+        wheel_display = WHEEL_DISPLAY_NAMES[field]
+        temps.append(wheel.temperature)
+        if wheel.status == 'Operational':
+            active_motors += 1
+        wheel_items.extend([
+            {'label': f'{wheel_display} Speed', 'value': f"{wheel.speed}", 'unit': 'RPM'},
+            {'label': f'{wheel_display} Temp', 'value': f"{wheel.temperature:.1f}", 'unit': '°C'},
+            {'label': f'{wheel_display} Current', 'value': f"{wheel.consumption:.2f}", 'unit': 'A'},
+            {'label': f'{wheel_display} Voltage', 'value': f"{wheel.voltage:.1f}", 'unit': 'V'},
+            {'label': f'{wheel_display} Status', 'value': wheel.status, 'unit': ''},
+        ])
+    avg_temp = sum(temps) / len(temps)
+
+    return {
+        'GPS Position': [
+            {'label': 'Latitude', 'value': f"{gps.latitude:.6f}", 'unit': '°'},
+            {'label': 'Longitude', 'value': f"{gps.longitude:.6f}", 'unit': '°'},
+            {'label': 'Altitude', 'value': f"{gps.altitude:.1f}", 'unit': 'm'},
+            {'label': 'Speed', 'value': f"{gps.speed:.2f}", 'unit': 'm/s'},
+        ],
+        'IMU Sensors': [
+            {'label': 'Accel X', 'value': f"{accel.x:.2f}", 'unit': 'm/s²'},
+            {'label': 'Accel Y', 'value': f"{accel.y:.2f}", 'unit': 'm/s²'},
+            {'label': 'Accel Z', 'value': f"{accel.z:.2f}", 'unit': 'm/s²'},
+            {'label': 'Gyro X', 'value': f"{gyro.x:.3f}", 'unit': 'rad/s'},
+            {'label': 'Gyro Y', 'value': f"{gyro.y:.3f}", 'unit': 'rad/s'},
+            {'label': 'Gyro Z', 'value': f"{gyro.z:.3f}", 'unit': 'rad/s'},
+            {'label': 'Mag X', 'value': f"{mag.x:.2f}", 'unit': 'μT'},
+            {'label': 'Mag Y', 'value': f"{mag.y:.2f}", 'unit': 'μT'},
+            {'label': 'Mag Z', 'value': f"{mag.z:.2f}", 'unit': 'μT'},
+        ],
+        'LiDAR Status': [
+            {'label': 'Status', 'value': sensor_data.lidar, 'unit': ''},
+            {'label': 'Camera Status', 'value': sensor_data.camera, 'unit': ''},
+            {'label': 'Last Update', 'value': last_update, 'unit': ''},
+        ],
+        'Temperature': [
+            {'label': 'Average Temp', 'value': f"{avg_temp:.1f}", 'unit': '°C'},
+            {'label': 'Min Temp', 'value': f"{min(temps):.1f}", 'unit': '°C'},
+            {'label': 'Max Temp', 'value': f"{max(temps):.1f}", 'unit': '°C'},
+            {'label': 'Active Motors', 'value': f"{active_motors}", 'unit': f'/ {len(WHEEL_FIELDS)}'},
+            {'label': 'Status', 'value': 'Normal' if avg_temp < 70 else 'High' if avg_temp < 80 else 'Critical', 'unit': ''},
+        ],
+        'Wheel Motors': wheel_items,
+        'Server Link': [
+            {'label': 'Status', 'value': 'Connected', 'unit': ''},
+            {'label': 'Last Update', 'value': last_update, 'unit': ''},
+            {'label': 'Timestamp', 'value': f"{sensor_data.timestamp:.0f}", 'unit': ''},
+        ],
+    }
+
+class SensorSnapshot:
+    def __init__(self, version: int, sensor_data: SensorData, actuator_data: ActuatorData):
+        self.version = version
+        self.latitude = sensor_data.gps.latitude
+        self.longitude = sensor_data.gps.longitude
+        self.altitude = sensor_data.gps.altitude
+        self.items = extract_sensor_items(sensor_data, actuator_data)
+        self._rendered: Dict[Tuple, str] = {}
+        self.render_hits = 0
+
+    def __repr__(self) -> str:
+        return f"SensorSnapshot(version={self.version})"
+
+    def items_for(self, selected_sensors: List[str]) -> Dict[str, List[Dict[str, str]]]:
+        return {
+            sensor: self.items.get(sensor, UNKNOWN_SENSOR_ITEMS)
+            for sensor in selected_sensors if sensor != CAMERA_SENSOR
+        }
+
+    def render(self, key: Tuple, build: Callable[[], str]) -> str:
+        rendered = self._rendered.get(key)
+        if rendered is None:
+            rendered = build()
+            self._rendered[key] = rendered
+        else:
+            self.render_hits += 1
+        return rendered
+
+class SensorSnapshotCache:
+    def __init__(self):
+        self._snapshot: Optional[SensorSnapshot] = None
+        self.build_count = 0
+        self.hit_count = 0
+
+    def get(self, sensor_data: SensorData, actuator_data: ActuatorData, version: int) -> SensorSnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            self.hit_count += 1
+            return snapshot
+        snapshot = SensorSnapshot(version, sensor_data, actuator_data)
+        self._snapshot = snapshot
+        self.build_count += 1
+        return snapshot
+
+    def get_status(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            "version": snapshot.version if snapshot else None,
+            "builds": self.build_count,
+            "hits": self.hit_count,
+            "render_hits": snapshot.render_hits if snapshot else 0,
+        }
+
+sensor_snapshots = SensorSnapshotCache()
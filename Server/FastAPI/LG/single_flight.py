@@ -0,0 +1,38 @@
+import asyncio
+import functools
+import json
+from typing import Any, Awaitable, Callable, Dict
+
+def make_key(name: str, args: tuple, kwargs: dict) -> str:
+    return json.dumps([name, list(args), kwargs], sort_keys=True, default=str)
+
+class SingleFlight:
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.executed_count = 0
+        self.shared_count = 0
+
+    async def run(self, key: str, operation: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is not None:
+            self.shared_count += 1
+        else:
+            task = asyncio.ensure_future(operation())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            self.executed_count += 1
+        return await asyncio.shield(task)
+
+    def get_status(self) -> dict:
+        return {
+            "in_flight": len(self._inflight),
+            "executed": self.executed_count,
+            "shared": self.shared_count,
+        }
+
+def single_flight(method):
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        key = make_key(method.__name__, args, kwargs)
+        return await self.single_flight.run(key, lambda: method(self, *args, **kwargs))
+    return wrapper
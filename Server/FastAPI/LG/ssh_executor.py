@@ -0,0 +1,17 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+SSH_EXECUTOR_MAX_WORKERS = 4
+
+_ssh_executor = ThreadPoolExecutor(
+    max_workers=SSH_EXECUTOR_MAX_WORKERS,
+    thread_name_prefix="lg-ssh"
+)
+
+async def run_blocking(func, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_ssh_executor, functools.partial(func, *args, **kwargs))
+
+def shutdown_ssh_executor():
+    _ssh_executor.shutdown(wait=False, cancel_futures=True)
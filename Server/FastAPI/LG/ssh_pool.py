@@ -0,0 +1,162 @@
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import paramiko
+
+from .remote_writer import RemoteFileWriter
+from .command_scheduler import LGCommandScheduler
+from .channel_budget import ChannelBudget, LaneLock
+
+SSH_CONNECT_TIMEOUT = 10
+SSH_KEEPALIVE_SECONDS = 15
+SSH_HEALTH_CHECK_INTERVAL = 30.0
+SSH_PERSISTENT_CHANNELS = 3
+
+SessionKey = Tuple[str, int, str, str]
+
+class PooledSSHSession:
+    def __init__(self, host: str, port: int, username: str, password: str):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.client: Optional[paramiko.SSHClient] = None
+        self.sftp: Optional[paramiko.SFTPClient] = None
+        self.writer = RemoteFileWriter(self)
+        self.navigation_writer = RemoteFileWriter(self)
+        self.scheduler = LGCommandScheduler(f"{username}@{host}")
+        self.connect_count = 0
+        self.ref_count = 0
+        self.last_health_check = 0.0
+        self.sftp_lock = LaneLock("sftp")
+        self.channels = ChannelBudget(reserved=SSH_PERSISTENT_CHANNELS)
+        self._lock = threading.RLock()
+
+    def is_alive(self) -> bool:
+        transport = self.client.get_transport() if self.client else None
+        return bool(transport and transport.is_active())
+
+    def _open(self):
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        client.connect(
+            hostname=self.host,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            timeout=SSH_CONNECT_TIMEOUT
+        )
+        client.get_transport().set_keepalive(SSH_KEEPALIVE_SECONDS)
+        self.client = client
+        self.sftp = None
+        self.connect_count += 1
+        self.last_health_check = time.time()
+        print(f"[SSHPool] Opened session to {self.username}@{self.host}:{self.port} (connect #{self.connect_count})")
+
+    def _health_check(self) -> bool:
+        try:
+            self.client.get_transport().send_ignore()
+            self.last_health_check = time.time()
+            return True
+        except Exception as e:
+            print(f"[SSHPool] Health check failed for {self.host}: {e}")
+            return False
+
+    def get_client(self) -> paramiko.SSHClient:
+        with self._lock:
+            if not self.is_alive():
+                self._close_locked()
+                self._open()
+            elif time.time() - self.last_health_check > SSH_HEALTH_CHECK_INTERVAL:
+                if not self._health_check():
+                    self._close_locked()
+                    self._open()
+            return self.client
+
+    def get_sftp(self) -> paramiko.SFTPClient:
+        with self._lock:
+            client = self.get_client()
+            if self.sftp is None or self.sftp.get_channel().closed:
+                self.sftp = client.open_sftp()
+            return self.sftp
+
+    def get_writer(self, navigation: bool = False) -> RemoteFileWriter:
+        return self.navigation_writer if navigation else self.writer
+
+    def invalidate(self):
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self):
+        sftp, client = self.sftp, self.client
+        self.sftp = None
+        self.client = None
+        try:
+            if sftp:
+                sftp.close()
+        except Exception:
+            pass
+        try:
+            if client:
+                client.close()
+        except Exception:
+            pass
+
+    def close(self):
+        self.scheduler.close()
+        self.invalidate()
+
+    def get_status(self) -> dict:
+        return {
+            "host": self.host,
+            "port": self.port,
+            "user": self.username,
+            "alive": self.is_alive(),
+            "connect_count": self.connect_count,
+            "refs": self.ref_count,
+            "sftp_open": self.sftp is not None,
+            "writer": self.writer.get_status(),
+            "navigation_writer": self.navigation_writer.get_status(),
+            "scheduler": self.scheduler.get_status(),
+            "sftp_lane": self.sftp_lock.get_status(),
+            "exec_channels": self.channels.get_status(),
+        }
+
+class SSHSessionPool:
+    def __init__(self):
+        self._sessions: Dict[SessionKey, PooledSSHSession] = {}
+        self._lock = threading.Lock()
+
+    def acquire_session(self, host: str, username: str, password: str, port: int = 22) -> PooledSSHSession:
+        key = (host, port, username, password)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = PooledSSHSession(host, port, username, password)
+                self._sessions[key] = session
+            session.ref_count += 1
+            return session
+
+    def release_session(self, session: PooledSSHSession):
+        key = (session.host, session.port, session.username, session.password)
+        with self._lock:
+            session.ref_count -= 1
+            if session.ref_count > 0 or self._sessions.get(key) is not session:
+                return
+            del self._sessions[key]
+        session.close()
+
+    def close_all(self):
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def get_status(self) -> list:
+        with self._lock:
+            sessions = list(self._sessions.values())
+        return [session.get_status() for session in sessions]
+
+ssh_pool = SSHSessionPool()
@@ -0,0 +1,73 @@
+import zipfile
+from typing import Iterable, Iterator, List, Optional
+
+from telemetry_history import TelemetryPoint
+from .track_trail import kml_when
+
+KMZ_DOCUMENT_NAME = "doc.kml"
+KMZ_COMPRESS_LEVEL = 6
+
+def iter_track_kml(chunks: Iterable[List[TelemetryPoint]], name: str = "Robot track") -> Iterator[str]:
+    yield f'''<?xml version="1.0" encoding="UTF-8"?>
+<kml xmlns="http://www.opengis.net/kml/2.2" xmlns:gx="http://www.google.com/kml/ext/2.2">
+  <Document>
+    <name>{name}</name>
+    <Style id="robotTrackStyle">
+      <IconStyle>
+        <scale>0</scale>
+      </IconStyle>
+      <LineStyle>
+        <color>ff00d7ff</color>
+        <width>4</width>
+      </LineStyle>
+    </Style>
+    <Placemark>
+      <name>{name}</name>
+      <styleUrl>#robotTrackStyle</styleUrl>
+      <gx:MultiTrack>
+        <altitudeMode>clampToGround</altitudeMode>
+        <gx:interpolate>1</gx:interpolate>
+'''
+    previous: Optional[TelemetryPoint] = None
+    for chunk in chunks:
+        points = [previous] + chunk if previous else chunk
+        previous = chunk[-1]
+        yield ''.join([
+            "        <gx:Track>\n",
+            ''.join(f"          <when>{kml_when(point.timestamp)}</when>\n" for point in points),
+            ''.join(f"          <gx:coord>{point.longitude} {point.latitude} {point.altitude}</gx:coord>\n" for point in points),
+            "        </gx:Track>\n",
+        ])
+    yield '''      </gx:MultiTrack>
+    </Placemark>
+  </Document>
+</kml>'''
+
+class _ChunkSink:
+    def __init__(self):
+        self._parts: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b''.join(self._parts)
+        self._parts = []
+        return data
+
+def iter_track_kmz(kml_parts: Iterable[str]) -> Iterator[bytes]:
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=KMZ_COMPRESS_LEVEL) as archive:
+        with archive.open(KMZ_DOCUMENT_NAME, 'w') as entry:
+            for part in kml_parts:
+                entry.write(part.encode('utf-8'))
+                data = sink.drain()
+                if data:
+                    yield data
+    data = sink.drain()
+    if data:
+        yield data
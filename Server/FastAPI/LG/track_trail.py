@@ -0,0 +1,156 @@
+import heapq
+import math
+import time
+from typing import List, Optional, Tuple
+
+from telemetry_history import TelemetryHistory, TelemetryPoint
+
+DEFAULT_TRAIL_VERTEX_BUDGET = 500
+
+class TrailVertex:
+    __slots__ = ('point', 'prev', 'next', 'area', 'removed', 'when_kml', 'coord_kml')
+
+    def __init__(self, point: TelemetryPoint):
+        self.point = point
+        self.prev: Optional['TrailVertex'] = None
+        self.next: Optional['TrailVertex'] = None
+        self.area: Optional[float] = None
+        self.removed = False
+        self.when_kml = f"        <when>{kml_when(point.timestamp)}</when>\n"
+        self.coord_kml = f"        <gx:coord>{point.longitude} {point.latitude} {point.altitude}</gx:coord>\n"
+
+def kml_when(timestamp: float) -> str:
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(timestamp))
+
+def triangle_area(a: TelemetryPoint, b: TelemetryPoint, c: TelemetryPoint) -> float:
+    scale = math.cos(math.radians(b.latitude))
+    return abs(
+        (b.longitude - a.longitude) * scale * (c.latitude - a.latitude) -
+        (c.longitude - a.longitude) * scale * (b.latitude - a.latitude)
+    ) / 2
+
+class TrackTrail:
+    def __init__(self, vertex_budget: int = DEFAULT_TRAIL_VERTEX_BUDGET):
+        self.vertex_budget = max(2, vertex_budget)
+        self.head: Optional[TrailVertex] = None
+        self.tail: Optional[TrailVertex] = None
+        self.vertex_count = 0
+        self._heap: List[Tuple[float, int, TrailVertex]] = []
+        self._heap_counter = 0
+        self.last_seq = 0
+        self.revision = 0
+        self.appended_count = 0
+        self.simplified_count = 0
+        self._kml_cache: Optional[Tuple[int, str]] = None
+
+    def _push(self, vertex: TrailVertex, min_area: float = 0.0):
+        vertex.area = max(min_area, triangle_area(vertex.prev.point, vertex.point, vertex.next.point))
+        self._heap_counter += 1
+        heapq.heappush(self._heap, (vertex.area, self._heap_counter, vertex))
+
+    def _pop_smallest(self) -> Optional[TrailVertex]:
+        while self._heap:
+            area, _, vertex = heapq.heappop(self._heap)
+            if not vertex.removed and vertex.area == area and vertex.prev and vertex.next:
+                return vertex
+        return None
+
+    def _remove(self, vertex: TrailVertex):
+        vertex.removed = True
+        vertex.prev.next = vertex.next
+        vertex.next.prev = vertex.prev
+        self.vertex_count -= 1
+        self.simplified_count += 1
+        for neighbour in (vertex.prev, vertex.next):
+            if neighbour.prev and neighbour.next:
+                self._push(neighbour, vertex.area)
+
+    def append(self, point: TelemetryPoint):
+        vertex = TrailVertex(point)
+        if self.tail is None:
+            self.head = self.tail = vertex
+        else:
+            vertex.prev = self.tail
+            self.tail.next = vertex
+            if self.tail.prev:
+                self._push(self.tail)
+            self.tail = vertex
+        self.vertex_count += 1
+        self.appended_count += 1
+        self.last_seq = max(self.last_seq, point.seq)
+
+        while self.vertex_count > self.vertex_budget:
+            smallest = self._pop_smallest()
+            if smallest is None:
+                break
+            self._remove(smallest)
+        self.revision += 1
+
+    def sync(self, history: TelemetryHistory) -> int:
+        points = history.since(self.last_seq)
+        for point in points:
+            self.append(point)
+        return len(points)
+
+    def clear(self):
+        self.head = self.tail = None
+        self.vertex_count = 0
+        self._heap = []
+        self.revision += 1
+        self._kml_cache = None
+
+    def vertices(self) -> List[TrailVertex]:
+        vertices = []
+        vertex = self.head
+        while vertex:
+            vertices.append(vertex)
+            vertex = vertex.next
+        return vertices
+
+    def to_kml(self) -> str:
+        if self._kml_cache and self._kml_cache[0] == self.revision:
+            return self._kml_cache[1]
+        vertices = self.vertices()
+        kml = ''.join([
+            TRAIL_KML_HEADER,
+            ''.join(vertex.when_kml for vertex in vertices),
+            ''.join(vertex.coord_kml for vertex in vertices),
+            TRAIL_KML_FOOTER,
+        ])
+        self._kml_cache = (self.revision, kml)
+        return kml
+
+    def get_status(self) -> dict:
+        return {
+            "vertex_budget": self.vertex_budget,
+            "vertices": self.vertex_count,
+            "appended": self.appended_count,
+            "simplified": self.simplified_count,
+            "last_seq": self.last_seq,
+            "revision": self.revision,
+        }
+
+TRAIL_KML_HEADER = '''<?xml version="1.0" encoding="UTF-8"?>
+<kml xmlns="http://www.opengis.net/kml/2.2" xmlns:gx="http://www.google.com/kml/ext/2.2">
+  <Document>
+    <name>RobotTrail</name>
+    <Style id="robotTrailStyle">
+      <IconStyle>
+        <scale>0</scale>
+      </IconStyle>
+      <LineStyle>
+        <color>ff00d7ff</color>
+        <width>4</width>
+      </LineStyle>
+    </Style>
+    <Placemark>
+      <name>Robot trail</name>
+      <styleUrl>#robotTrailStyle</styleUrl>
+      <gx:Track>
+        <altitudeMode>clampToGround</altitudeMode>
+'''
+
+TRAIL_KML_FOOTER = '''      </gx:Track>
+    </Placemark>
+  </Document>
+</kml>'''
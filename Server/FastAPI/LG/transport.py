@@ -0,0 +1,289 @@
+import fnmatch
+import os
+import random
+import re
+import shlex
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from io import BytesIO
+from typing import Dict, List, Optional
+
+from . import lg_data
+from .ssh_pool import ssh_pool
+from .command_scheduler import LGCommandScheduler
+
+class LGTransportError(Exception):
+    pass
+
+class LGTransport(ABC):
+    kind = "base"
+
+    def __init__(self):
+        self.scheduler: Optional[LGCommandScheduler] = None
+        self.file_lock = threading.RLock()
+
+    @abstractmethod
+    def connect(self):
+        pass
+
+    @abstractmethod
+    def close(self):
+        pass
+
+    @abstractmethod
+    def is_alive(self) -> bool:
+        pass
+
+    @abstractmethod
+    def exec(self, command: str) -> str:
+        pass
+
+    @abstractmethod
+    def exec_detached(self, command: str):
+        pass
+
+    @abstractmethod
+    def write_file(self, remote_path: str, data: bytes, mode: Optional[int] = None):
+        pass
+
+    def write_small(self, remote_path: str, content: str, navigation: bool = False):
+        self.write_file(remote_path, content.encode('utf-8'))
+
+    @abstractmethod
+    def read_file(self, remote_path: str) -> str:
+        pass
+
+    @abstractmethod
+    def remove_file(self, remote_path: str):
+        pass
+
+    @abstractmethod
+    def stat(self, remote_path: str):
+        pass
+
+    def get_status(self) -> dict:
+        return {"kind": self.kind}
+
+class SSHTransport(LGTransport):
+    kind = "ssh"
+
+    def __init__(self, host: str, username: str, password: str, port: int = 22):
+        super().__init__()
+        self.host = host
+        self.username = username
+        self.password = password
+        self.port = port
+        self.session = ssh_pool.acquire_session(host, username, password, port=port)
+        self.scheduler = self.session.scheduler
+        self.file_lock = self.session.sftp_lock
+        self._released = False
+
+    def connect(self):
+        self.session.get_sftp()
+
+    def close(self):
+        if self._released:
+            return
+        self._released = True
+        ssh_pool.release_session(self.session)
+
+    def is_alive(self) -> bool:
+        return self.session.is_alive()
+
+    def exec(self, command: str) -> str:
+        with self.session.channels.slot():
+            stdin, stdout, stderr = self.session.get_client().exec_command(command)
+            try:
+                return stdout.read().decode('utf-8')
+            finally:
+                stdout.channel.close()
+
+    def exec_detached(self, command: str):
+        self.session.channels.acquire()
+        channel = None
+        try:
+            stdin, stdout, stderr = self.session.get_client().exec_command(command)
+            channel = stdout.channel
+        finally:
+            self.session.channels.release(channel)
+
+    def write_file(self, remote_path: str, data: bytes, mode: Optional[int] = None):
+        with self.file_lock:
+            sftp = self.session.get_sftp()
+            temp_path = f"{remote_path}.{uuid.uuid4().hex[:8]}.tmp"
+            try:
+                with BytesIO(data) as data_io:
+                    sftp.putfo(data_io, temp_path, confirm=False)
+                if mode is not None:
+                    sftp.chmod(temp_path, mode)
+                sftp.posix_rename(temp_path, remote_path)
+            except Exception:
+                try:
+                    sftp.remove(temp_path)
+                except Exception:
+                    pass
+                raise
+
+    def write_small(self, remote_path: str, content: str, navigation: bool = False):
+        self.session.get_writer(navigation).write(remote_path, content)
+
+    def read_file(self, remote_path: str) -> str:
+        with self.file_lock:
+            try:
+                with self.session.get_sftp().open(remote_path, 'r') as remote_file:
+                    return remote_file.read().decode('utf-8')
+            except FileNotFoundError:
+                return ""
+
+    def remove_file(self, remote_path: str):
+        with self.file_lock:
+            try:
+                self.session.get_sftp().remove(remote_path)
+            except FileNotFoundError:
+                pass
+
+    def stat(self, remote_path: str):
+        with self.file_lock:
+            try:
+                return self.session.get_sftp().stat(remote_path)
+            except FileNotFoundError:
+                return None
+
+    def get_status(self) -> dict:
+        return {"kind": self.kind, **self.session.get_status()}
+
+class LocalTransport(LGTransport):
+    kind = "local"
+
+    def __init__(self, root_dir: str, latency_s: float = 0.0, failure_rate: float = 0.0):
+        super().__init__()
+        self.root_dir = os.path.abspath(root_dir)
+        self.latency_s = latency_s
+        self.failure_rate = failure_rate
+        self.scheduler = LGCommandScheduler(f"local:{self.root_dir}")
+        self.commands: List[str] = []
+        self.operation_count = 0
+        self.injected_failures = 0
+        self.ref_count = 0
+        self._alive = False
+
+    def configure(self, latency_s: float, failure_rate: float):
+        self.latency_s = latency_s
+        self.failure_rate = failure_rate
+
+    def _local_path(self, remote_path: str) -> str:
+        local_path = os.path.normpath(os.path.join(self.root_dir, remote_path.lstrip('/')))
+        if os.path.commonpath([self.root_dir, local_path]) != self.root_dir:
+            raise LGTransportError(f"Path escapes local LG root: {remote_path}")
+        return local_path
+
+    def _inject(self):
+        self.operation_count += 1
+        if self.latency_s > 0:
+            time.sleep(self.latency_s)
+        if self.failure_rate > 0 and random.random() < self.failure_rate:
+            self.injected_failures += 1
+            raise LGTransportError("Injected local transport failure")
+
+    def connect(self):
+        self._inject()
+        for directory in ('var/www/html/kml', 'tmp'):
+            os.makedirs(os.path.join(self.root_dir, directory), exist_ok=True)
+        self._alive = True
+
+    def close(self):
+        with _local_transports_lock:
+            self.ref_count -= 1
+            if self.ref_count <= 0:
+                self.ref_count = 0
+                self._alive = False
+
+    def is_alive(self) -> bool:
+        return self._alive
+
+    def exec(self, command: str) -> str:
+        self._inject()
+        self.commands.append(command)
+        parts = shlex.split(command)
+        if parts[:2] == ['rm', '-f']:
+            for pattern in parts[2:]:
+                directory, name_pattern = os.path.split(self._local_path(pattern))
+                if os.path.isdir(directory):
+                    for name in fnmatch.filter(os.listdir(directory), name_pattern):
+                        os.remove(os.path.join(directory, name))
+        return ""
+
+    def exec_detached(self, command: str):
+        self.exec(command)
+
+    def write_file(self, remote_path: str, data: bytes, mode: Optional[int] = None):
+        self._inject()
+        local_path = self._local_path(remote_path)
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        temp_path = f"{local_path}.{uuid.uuid4().hex[:8]}.tmp"
+        with open(temp_path, 'wb') as local_file:
+            local_file.write(data)
+        if mode is not None:
+            os.chmod(temp_path, mode)
+        os.replace(temp_path, local_path)
+
+    def read_file(self, remote_path: str) -> str:
+        self._inject()
+        try:
+            with open(self._local_path(remote_path), 'r', encoding='utf-8') as local_file:
+                return local_file.read()
+        except FileNotFoundError:
+            return ""
+
+    def remove_file(self, remote_path: str):
+        self._inject()
+        try:
+            os.remove(self._local_path(remote_path))
+        except FileNotFoundError:
+            pass
+
+    def stat(self, remote_path: str):
+        self._inject()
+        try:
+            return os.stat(self._local_path(remote_path))
+        except FileNotFoundError:
+            return None
+
+    def get_status(self) -> dict:
+        return {
+            "kind": self.kind,
+            "root_dir": self.root_dir,
+            "alive": self._alive,
+            "refs": self.ref_count,
+            "latency_s": self.latency_s,
+            "failure_rate": self.failure_rate,
+            "operations": self.operation_count,
+            "injected_failures": self.injected_failures,
+            "commands": len(self.commands),
+            "scheduler": self.scheduler.get_status(),
+        }
+
+_local_transports: Dict[str, LocalTransport] = {}
+_local_transports_lock = threading.Lock()
+
+def get_local_transport(root_dir: str) -> LocalTransport:
+    root_dir = os.path.abspath(root_dir)
+    with _local_transports_lock:
+        transport = _local_transports.get(root_dir)
+        if transport is None:
+            transport = LocalTransport(root_dir)
+            _local_transports[root_dir] = transport
+        transport.ref_count += 1
+        transport.configure(lg_data.LG_LOCAL_LATENCY_S, lg_data.LG_LOCAL_FAILURE_RATE)
+        return transport
+
+def local_root_for(host: str) -> str:
+    host_dir = re.sub(r'[^A-Za-z0-9_.-]', '_', host).lstrip('.') or '_'
+    return os.path.join(lg_data.LG_LOCAL_ROOT, host_dir)
+
+def create_transport(host: str, username: str, password: str, port: int = 22) -> LGTransport:
+    if lg_data.LG_TRANSPORT == "local":
+        return get_local_transport(local_root_for(host))
+    return SSHTransport(host, username, password, port=port)
@@ -1,7 +1,8 @@
 import time
 import threading
 import ctypes
-from paramiko import SSHClient, AutoAddPolicy
+from LG.transport import create_transport
+from LG.command_scheduler import PRIORITY_NAVIGATION, LGCommandExpired, deadline_in
 
 
 class OrbitBuilder:
@@ -14,24 +15,25 @@ class OrbitBuilder:
         self._stop_event = threading.Event()
         self._thread = None
 
-    def _connect(self):
-        client = SSHClient()
-        client.set_missing_host_key_policy(AutoAddPolicy())
-        client.connect(
-            hostname=self.ip,
-            port=self.port,
-            username=self.user,
-            password=self.password,
-            timeout=10
-        )
-        return client
+    def _transport(self):
+        return create_transport(self.ip, self.user, self.password, port=self.port)
 
-    def _send_query(self, client, content):
-        cmd = f"bash -lc 'cat > /tmp/query.txt <<\"EOF\"\n{content}\nEOF'"
-        stdin, stdout, stderr = client.exec_command(cmd)
-        rc = stdout.channel.recv_exit_status()
-        if rc != 0:
-            raise RuntimeError(stderr.read().decode() or f"Non-zero exit status {rc}")
+    def _send_query(self, content, deadline_s=None, transport=None):
+        owned = transport is None
+        if owned:
+            transport = self._transport()
+        try:
+            transport.scheduler.submit(
+                PRIORITY_NAVIGATION,
+                transport.write_small,
+                "/tmp/query.txt",
+                f"{content}\n",
+                navigation=True,
+                deadline=deadline_in(deadline_s)
+            ).result()
+        finally:
+            if owned:
+                transport.close()
 
     def _build_lookat(self, lat, lon, zoom, tilt, heading):
         return (
@@ -48,10 +50,10 @@ class OrbitBuilder:
         )
 
     def _orbit_loop(self, lat, lon, zoom, tilt, steps, step_ms, start_heading):
-        client = None
+        transport = None
         try:
-            client = self._connect()
-            self._send_query(client, "exittour=true")
+            transport = self._transport()
+            self._send_query("exittour=true", transport=transport)
             time.sleep(0.1)
 
             delta = 360.0 / max(1, steps)
@@ -62,17 +64,15 @@ class OrbitBuilder:
             while not self._stop_event.is_set():
                 lookat = self._build_lookat(lat, lon, zoom, tilt, heading)
                 try:
-                    self._send_query(client, f"flytoview={lookat}")
+                    self._send_query(f"flytoview={lookat}", deadline_s=step_ms / 1000.0, transport=transport)
+                except LGCommandExpired:
+                    pass
                 except Exception as e:
                     print(f"[OrbitBuilder] Connection error: {e}, attempting reconnection...")
                     try:
-                        if client:
-                            client.close()
-                    except:
+                        self._send_query(f"flytoview={lookat}", deadline_s=step_ms / 1000.0, transport=transport)
+                    except LGCommandExpired:
                         pass
-                    try:
-                        client = self._connect()
-                        self._send_query(client, f"flytoview={lookat}")
                     except Exception as e2:
                         print(f"[OrbitBuilder] Reconnection failed: {e2}")
                         break 
@@ -83,7 +83,7 @@ class OrbitBuilder:
                 heading = (heading + delta) % 360.0
 
             try:
-                self._send_query(client, "exittour=true")
+                self._send_query("exittour=true", transport=transport)
                 print("[OrbitBuilder] Orbit stopped, exiting tour")
             except Exception:
                 pass
@@ -91,11 +91,8 @@ class OrbitBuilder:
         except Exception as e:
             print(f"[OrbitBuilder] Orbit loop error: {e}")
         finally:
-            try:
-                if client:
-                    client.close()
-            except:
-                pass
+            if transport:
+                transport.close()
             self._thread = None
             self._stop_event.clear()
 
@@ -131,9 +128,7 @@ class OrbitBuilder:
     def stop_orbit(self, timeout: float = 2.0, force: bool = False) -> bool:
         if not self._thread or not self._thread.is_alive():
             try:
-                client = self._connect()
-                self._send_query(client, "exittour=true")
-                client.close()
+                self._send_query("exittour=true")
                 print("[OrbitBuilder] No orbit running, sent exittour command")
             except Exception as e:
                 print(f"[OrbitBuilder] Error sending exittour: {e}")
@@ -157,9 +152,7 @@ class OrbitBuilder:
                 return False
 
         try:
-            client = self._connect()
-            self._send_query(client, "exittour=true")
-            client.close()
+            self._send_query("exittour=true")
             print("[OrbitBuilder] Orbit stopped successfully")
         except Exception as e:
             print(f"[OrbitBuilder] Error sending final exittour: {e}")
@@ -0,0 +1,155 @@
+import argparse
+import os
+import sys
+import timeit
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from LG.balloon_maker import BalloonMaker
+from LG.sensor_items import extract_sensor_items
+from robot_simulator import RobotSimulator
+
+SENSORS = ['GPS Position', 'IMU Sensors', 'LiDAR Status', 'Temperature', 'Wheel Motors', 'Server Link']
+
+def legacy_sensor_color(sensor_name: str, label: str, value: Any) -> str:
+
+    default_color = "#F3F4F6"
+    good_color = "#10B981"
+    warning_color = "#F59E0B"
+    error_color = "#EF4444"
+    info_color = "#06B6D4"
+    purple_color = "#8B5CF6"
+
+    value_str = str(value).lower()
+
+    if sensor_name == 'GPS Position':
+        if 'latitude' in label.lower() or 'longitude' in label.lower():
+            return info_color
+        elif 'altitude' in label.lower():
+            return good_color
+        elif 'speed' in label.lower():
+            return purple_color
+
+    elif sensor_name == 'IMU Sensors':
+        if 'gyroscope' in label.lower() or 'gyro' in label.lower():
+            return purple_color
+        elif 'accelerometer' in label.lower() or 'accel' in label.lower():
+            return warning_color
+        elif 'magnetometer' in label.lower() or 'mag' in label.lower():
+            return info_color
+
+    elif sensor_name == 'Temperature':
+        try:
+            temp_val = float(value)
+            if temp_val < 40:
+                return good_color
+            elif temp_val < 60:
+                return info_color
+            elif temp_val < 75:
+                return warning_color
+            else:
+                return error_color
+        except:
+            pass
+
+    elif sensor_name == 'Wheel Motors':
+        if 'speed' in label.lower() or 'rpm' in label.lower():
+            return purple_color
+        elif 'temp' in label.lower():
+            try:
+                temp_val = float(value)
+                if temp_val < 50:
+                    return good_color
+                elif temp_val < 70:
+                    return warning_color
+                else:
+                    return error_color
+            except:
+                pass
+        elif 'current' in label.lower() or 'consumption' in label.lower():
+            return info_color
+        elif 'voltage' in label.lower():
+            return warning_color
+
+    elif sensor_name == 'LiDAR Status':
+        if 'camera' in label.lower():
+            return purple_color
+
+    if any(status in value_str for status in ['connected', 'active', 'online', 'ok', 'good', 'operational', 'streaming']):
+        return good_color
+    elif any(status in value_str for status in ['warning', 'slow', 'degraded', 'high']):
+        return warning_color
+    elif any(status in value_str for status in ['error', 'failed', 'offline', 'bad', 'critical', 'disconnected']):
+        return error_color
+    elif any(status in value_str for status in ['unknown', 'n/a', 'null', 'monitoring', 'normal']):
+        return info_color
+
+    return default_color
+
+def build_snapshots(count: int) -> List[Dict[str, List[Dict[str, str]]]]:
+    robot = RobotSimulator()
+    snapshots = []
+    for _ in range(count):
+        robot.force_update()
+        snapshots.append(extract_sensor_items(robot.sensor_data, robot.actuator_data))
+    return snapshots
+
+def color_all(snapshots, get_color) -> int:
+    colored = 0
+    for items in snapshots:
+        for sensor_name in SENSORS:
+            for item in items[sensor_name]:
+                get_color(sensor_name, item['label'], item['value'])
+                colored += 1
+    return colored
+
+def render_all(snapshots):
+    for items in snapshots:
+        BalloonMaker.generate_multi_sensor_balloon({sensor: items[sensor] for sensor in SENSORS})
+
+def check_colors(snapshots) -> int:
+    mismatches = 0
+    for items in snapshots:
+        for sensor_name in SENSORS:
+            for item in items[sensor_name]:
+                args = (sensor_name, item['label'], item['value'])
+                if BalloonMaker._get_sensor_color(*args) != legacy_sensor_color(*args):
+                    mismatches += 1
+    return mismatches
+
+def best_us(func, repeat: int, per: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat)) / per * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the BalloonMaker color rule tables against the legacy if/elif chain.")
+    parser.add_argument("--snapshots", type=int, default=200, help="distinct sensor snapshots to color per run")
+    parser.add_argument("--repeat", type=int, default=7, help="timing runs, best one is reported")
+    args = parser.parse_args()
+
+    snapshots = build_snapshots(args.snapshots)
+    mismatches = check_colors(snapshots)
+    if mismatches:
+        print(f"FAIL: {mismatches} colors differ from the legacy rule chain")
+        sys.exit(1)
+
+    items_per_run = color_all(snapshots, legacy_sensor_color)
+    table_get_color = BalloonMaker._get_sensor_color
+
+    legacy_color_us = best_us(lambda: color_all(snapshots, legacy_sensor_color), args.repeat, len(snapshots))
+    table_color_us = best_us(lambda: color_all(snapshots, table_get_color), args.repeat, len(snapshots))
+
+    table_balloon_us = best_us(lambda: render_all(snapshots), args.repeat, len(snapshots))
+    BalloonMaker._get_sensor_color = staticmethod(legacy_sensor_color)
+    try:
+        legacy_balloon_us = best_us(lambda: render_all(snapshots), args.repeat, len(snapshots))
+    finally:
+        BalloonMaker._get_sensor_color = staticmethod(table_get_color)
+
+    print(f"{len(snapshots)} snapshots, {items_per_run // len(snapshots)} rows per multi-sensor balloon, colors identical")
+    print(f"{'':24}{'legacy chain':>14}{'rule tables':>14}")
+    print(f"{'colors per balloon':24}{legacy_color_us:>12.1f}us{table_color_us:>12.1f}us")
+    print(f"{'full balloon':24}{legacy_balloon_us:>12.1f}us{table_balloon_us:>12.1f}us")
+
+if __name__ == "__main__":
+    main()
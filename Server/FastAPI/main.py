@@ -1,10 +1,12 @@
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Query, HTTPException
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Query, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 import asyncio
+import hashlib
 import json
 import time
-from typing import List
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Tuple
 import uvicorn
 import os
 
@@ -13,9 +15,16 @@ from models import (
     OrbitRequest, OrbitStopRequest
 )
 from robot_simulator import RobotSimulator
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 import LG.lg_data as lg_data
-from LG.lg_service import lg_service
+from LG.lg_service import lg_service, DEFAULT_RIG_ID
+from LG.ssh_executor import run_blocking, shutdown_ssh_executor
+from LG.ssh_pool import ssh_pool
+from LG.kml_builder import KMLBuilder
+from LG.sensor_items import sensor_snapshots
+from LG.dashboard_renderer import dashboard_renderer
+from LG.track_trail import TrackTrail
+from LG.track_export import iter_track_kml, iter_track_kmz
 from Orbit_Builder import OrbitBuilder
 from SimulatedGPS import LocationData
 
@@ -43,6 +52,7 @@ class LGLoginRequest(BaseModel):
 
 class LGSensorRequest(BaseModel):
     selected_sensors: List[str]
+    as_image: bool = False
 
 class LGServerRequest(BaseModel):
     server_host: str
@@ -55,7 +65,26 @@ class RobotLocationRequest(BaseModel):
     longitude: float
     altitude: float = 0.0
 
+class LGPlacemarkFilterConfig(BaseModel):
+    min_distance_m: float = Field(1.0, ge=0.0)
+    min_interval_s: float = Field(0.5, ge=0.0)
+    force_refresh_s: float = Field(30.0, ge=0.0)
+
+class LGLiveRobotRequest(BaseModel):
+    server_host: str
+    refresh_interval: float = 2.0
+
+class LGBatchOperation(BaseModel):
+    op: str
+    params: Dict[str, Any] = Field(default_factory=dict)
+
+class LGBatchRequest(BaseModel):
+    operations: List[LGBatchOperation]
+
 robot = RobotSimulator()
+robot_trail = TrackTrail()
+live_kml_builder = KMLBuilder(lg_data.LG_HOST)
+ROBOT_TRAIL_EPOCH = int(time.time())
 connected_clients: List[WebSocket] = []
 
 ROBOT_IP = None
@@ -89,12 +118,26 @@ async def root():
             "lg_show_robot_location": "/lg/show-robot-location",
             "lg_show_robot_location_manual": "/lg/show-robot-location-manual", 
             "lg_hide_robot_location": "/lg/hide-robot-location",
+            "lg_show_robot_location_live": "/lg/show-robot-location-live",
+            "lg_live_robot_kml": "/lg/live/robot.kml",
+            "lg_live_robot_icon": "/lg/live/robot-icon.png",
+            "lg_show_robot_trail": "/lg/show-robot-trail",
+            "lg_hide_robot_trail": "/lg/hide-robot-trail",
+            "lg_live_trail_kml": "/lg/live/trail.kml",
             "lg_robot_tracking_status": "/lg/robot-tracking-status",
+            "lg_placemark_filter": "/lg/placemark-filter",
+            "lg_screen_state": "/lg/screen-state",
+            "lg_resync": "/lg/resync",
+            "lg_scheduler": "/lg/scheduler",
+            "lg_batch": "/lg/batch",
+            "lg_rigs": "/lg/rigs",
             "lg_clear_logos": "/lg/clear-logos",
             "lg_clear_kml_and_logos": "/lg/clear-kml-logos",
             "lg_update_robot_location": "/lg/update-robot-location",
             "robot_reset_to_initial": "/robot/reset-to-initial",
             "robot_cycle_info": "/robot/cycle-info",
+            "export_track_kml": "/export/track.kml",
+            "export_track_kmz": "/export/track.kmz",
             "orbit_start": "/orbit/start",
             "orbit_start_robot": "/orbit/start-robot",
             "orbit_quick_start": "/orbit/quick-start",
@@ -125,12 +168,13 @@ async def get_lg_config():
     }
 
 @app.post("/lg/login")
-async def lg_login(request: LGLoginRequest):
+async def lg_login(request: LGLoginRequest, rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
     result = await lg_service.login(
         request.host, 
         request.username, 
         request.password, 
-        request.total_screens
+        request.total_screens,
+        rig_id=rig_id
     )
     return {
         "success": result.success,
@@ -138,11 +182,11 @@ async def lg_login(request: LGLoginRequest):
     }
 
 @app.post("/lg/show-logo")
-async def lg_show_logo():
+async def lg_show_logo(rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
     print("Debug: lg_show_logo endpoint called")
     print(f"Debug: LG Config - Host: {lg_data.LG_HOST}, Username: {lg_data.LG_USERNAME}, Screens: {lg_data.LG_TOTAL_SCREENS}")
     
-    success = await lg_service.show_logo()
+    success = await lg_service.show_logo(rig_id=rig_id)
     print(f"Debug: lg_service.show_logo() returned: {success}")
     
     return {
@@ -151,11 +195,11 @@ async def lg_show_logo():
     }
 
 @app.post("/lg/show-camera")
-async def lg_show_camera(request: LGServerRequest):
+async def lg_show_camera(request: LGServerRequest, rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
     print(f"Debug: lg_show_camera endpoint called with server_host: {request.server_host}")
     print(f"Debug: LG Config - Host: {lg_data.LG_HOST}, Username: {lg_data.LG_USERNAME}, Screens: {lg_data.LG_TOTAL_SCREENS}")
     
-    success = await lg_service.show_rgb_camera(request.server_host)
+    success = await lg_service.show_rgb_camera(request.server_host, rig_id=rig_id)
     print(f"Debug: lg_service.show_rgb_camera() returned: {success}")
     
     return {
@@ -164,16 +208,15 @@ async def lg_show_camera(request: LGServerRequest):
     }
 
 @app.post("/lg/show-sensors")
-async def lg_show_sensors(request: LGSensorRequest):
+async def lg_show_sensors(request: LGSensorRequest, rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
     print(f"Debug: lg_show_sensors endpoint called with sensors: {request.selected_sensors}")
     print(f"Debug: LG Config - Host: {lg_data.LG_HOST}, Username: {lg_data.LG_USERNAME}, Screens: {lg_data.LG_TOTAL_SCREENS}")
     
     robot.update_sensors()
 
-    combined_data = robot.sensor_data.dict()
-    combined_data['actuators'] = robot.actuator_data.dict()
+    snapshot = sensor_snapshots.get(robot.sensor_data, robot.actuator_data, robot.snapshot_version)
     
-    success = await lg_service.show_sensor_data(combined_data, request.selected_sensors)
+    success = await lg_service.show_sensor_data(snapshot, request.selected_sensors, as_image=request.as_image, rig_id=rig_id)
     print(f"Debug: lg_service.show_sensor_data() returned: {success}")
     
     return {
@@ -182,63 +225,74 @@ async def lg_show_sensors(request: LGSensorRequest):
     }
 
 @app.post("/lg/hide-sensors")
-async def lg_hide_sensors():
-    success = await lg_service.hide_sensor_data()
+async def lg_hide_sensors(rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
+    success = await lg_service.hide_sensor_data(rig_id=rig_id)
     return {
         "success": success,
         "message": "Sensor data hidden successfully" if success else "Failed to hide sensor data"
     }
 
 @app.post("/lg/disconnect")
-async def lg_disconnect():
-    await lg_service.disconnect()
+async def lg_disconnect(rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
+    await lg_service.disconnect(rig_id=rig_id)
     return {
         "success": True,
         "message": "Disconnected from Liquid Galaxy"
     }
 
 @app.post("/lg/clear-all-kml")
-async def lg_clear_all_kml():
-    success = await lg_service.clear_all_kml()
+async def lg_clear_all_kml(rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
+    success = await lg_service.clear_all_kml(rig_id=rig_id)
     return {
         "success": success,
         "message": "All KML content cleared successfully" if success else "Failed to clear all KML content"
     }
 
 @app.post("/lg/clear-logos")
-async def lg_clear_logos():
-    success = await lg_service.clear_logos()
+async def lg_clear_logos(rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
+    success = await lg_service.clear_logos(rig_id=rig_id)
     return {
         "success": success,
         "message": "Logos cleared from leftmost screen" if success else "Failed to clear logos"
     }
 
 @app.post("/lg/clear-kml-logos")
-async def lg_clear_kml_and_logos():
-    success = await lg_service.clean_kml_and_logos()
+async def lg_clear_kml_and_logos(rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
+    result = await lg_service.clean_kml_and_logos(rig_id=rig_id)
     return {
-        "success": success,
-        "message": "KML overlays and logos cleared" if success else "Failed to clear KML overlays + logos"
+        "success": result.success,
+        "message": "KML overlays and logos cleared" if result.success else "Failed to clear KML overlays + logos",
+        "screens": result.screens
+    }
+
+@app.post("/lg/resync")
+async def lg_resync(rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
+    result = await lg_service.resync_screens(rig_id=rig_id)
+    return {
+        "success": result.success,
+        "message": "LG screens rewritten from desired state" if result.success else "Failed to resync LG screens",
+        "screens": result.screens
     }
 
 @app.post("/lg/clean-placemark-files")
-async def lg_clean_placemark_files():
-    success = await lg_service.clean_all_placemark_files()
+async def lg_clean_placemark_files(rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
+    success = await lg_service.clean_all_placemark_files(rig_id=rig_id)
     return {
         "success": success,
         "message": "All placemark files cleaned successfully" if success else "Failed to clean placemark files"
     }
 
 @app.post("/lg/relaunch")
-async def lg_relaunch():
-    success = await lg_service.relaunch_lg()
+async def lg_relaunch(rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
+    result = await lg_service.relaunch_lg(rig_id=rig_id)
     return {
-        "success": success,
-        "message": "Liquid Galaxy relaunched successfully" if success else "Failed to relaunch Liquid Galaxy"
+        "success": result.success,
+        "message": "Liquid Galaxy relaunched successfully" if result.success else "Failed to relaunch Liquid Galaxy",
+        "screens": result.screens
     }
 
 @app.post("/lg/show-robot-location")
-async def lg_show_robot_location():
+async def lg_show_robot_location(rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
     print("Debug: lg_show_robot_location endpoint called")
     
     robot.reset_to_initial_position()
@@ -251,7 +305,8 @@ async def lg_show_robot_location():
     success = await lg_service.show_robot_location(
         latitude=gps_data.latitude,
         longitude=gps_data.longitude,
-        altitude=gps_data.altitude
+        altitude=gps_data.altitude,
+        rig_id=rig_id
     )
     
     return {
@@ -265,13 +320,14 @@ async def lg_show_robot_location():
     }
 
 @app.post("/lg/show-robot-location-manual")
-async def lg_show_robot_location_manual(request: RobotLocationRequest):
+async def lg_show_robot_location_manual(request: RobotLocationRequest, rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
     print(f"Debug: lg_show_robot_location_manual endpoint called with lat={request.latitude}, lon={request.longitude}, alt={request.altitude}")
     
     success = await lg_service.show_robot_location(
         latitude=request.latitude,
         longitude=request.longitude,
-        altitude=request.altitude
+        altitude=request.altitude,
+        rig_id=rig_id
     )
     
     return {
@@ -284,11 +340,84 @@ async def lg_show_robot_location_manual(request: RobotLocationRequest):
         }
     }
 
+@app.post("/lg/show-robot-location-live")
+async def lg_show_robot_location_live(request: LGLiveRobotRequest, rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
+    success = await lg_service.show_live_robot_location(request.server_host, request.refresh_interval, rig_id=rig_id)
+    
+    return {
+        "success": success,
+        "message": f"Live robot placemark linked to http://{request.server_host}:8000/lg/live/robot.kml" if success else "Failed to link live robot placemark on LG",
+        "refresh_interval": request.refresh_interval
+    }
+
+@app.get("/lg/live/robot.kml")
+async def lg_live_robot_kml(request: Request):
+    robot.update_sensors()
+    gps_data = robot.sensor_data.gps
+    
+    icon_href = f"{str(request.base_url).rstrip('/')}/lg/live/robot-icon.png"
+    placemark_kml = live_kml_builder.build_robot_placemark_kml(
+        gps_data.latitude, gps_data.longitude, gps_data.altitude, icon_href=icon_href
+    )
+    etag = f'"{hashlib.sha1(placemark_kml.encode("utf-8")).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    return Response(
+        content=placemark_kml,
+        media_type="application/vnd.google-earth.kml+xml",
+        headers=headers
+    )
+
+@app.post("/lg/show-robot-trail")
+async def lg_show_robot_trail(request: LGLiveRobotRequest, rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
+    success = await lg_service.show_robot_trail(request.server_host, request.refresh_interval, rig_id=rig_id)
+    
+    return {
+        "success": success,
+        "message": f"Robot trail linked to http://{request.server_host}:8000/lg/live/trail.kml" if success else "Failed to link robot trail on LG",
+        "refresh_interval": request.refresh_interval
+    }
+
+@app.post("/lg/hide-robot-trail")
+async def lg_hide_robot_trail(rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
+    success = await lg_service.hide_robot_trail(rig_id=rig_id)
+    return {
+        "success": success,
+        "message": "Robot trail hidden from LG" if success else "Failed to hide robot trail from LG"
+    }
+
+@app.get("/lg/live/trail.kml")
+async def lg_live_trail_kml(request: Request):
+    robot.update_sensors()
+    robot_trail.sync(robot.telemetry_history)
+    
+    etag = f'"trail-{ROBOT_TRAIL_EPOCH}-{robot_trail.revision}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    return Response(
+        content=robot_trail.to_kml(),
+        media_type="application/vnd.google-earth.kml+xml",
+        headers=headers
+    )
+
+@app.get("/lg/live/robot-icon.png")
+async def lg_live_robot_icon():
+    icon_path = "AMIGA_ROBOT_PNG/amiga-base.png"
+    if not os.path.exists(icon_path):
+        raise HTTPException(status_code=404, detail="Robot icon not found")
+    return FileResponse(icon_path, media_type="image/png", headers={"Cache-Control": "max-age=3600"})
+
 @app.post("/lg/hide-robot-location")
-async def lg_hide_robot_location():
+async def lg_hide_robot_location(rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
     print("Debug: lg_hide_robot_location endpoint called")
     
-    success = await lg_service.hide_robot_location()
+    success = await lg_service.hide_robot_location(rig_id=rig_id)
     
     return {
         "success": success,
@@ -296,27 +425,87 @@ async def lg_hide_robot_location():
     }
 
 @app.get("/lg/robot-tracking-status")
-async def lg_robot_tracking_status():
-    is_active = lg_service.is_robot_tracking_active()
+async def lg_robot_tracking_status(rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
+    is_active = lg_service.is_robot_tracking_active(rig_id=rig_id)
     
     return {
         "tracking_active": is_active,
+        "live_placemark": lg_service.is_live_placemark_active(rig_id=rig_id),
+        "placemark_updates": lg_service.get_placemark_update_stats(rig_id=rig_id),
+        "placemark_filter": lg_service.get_placemark_filter_status(rig_id=rig_id),
+        "trail_active": lg_service.is_trail_active(rig_id=rig_id),
+        "trail": robot_trail.get_status(),
+        "telemetry_history": robot.telemetry_history.get_status(),
         "message": "Robot tracking is active" if is_active else "Robot tracking is inactive"
     }
 
+@app.get("/lg/placemark-filter")
+async def lg_get_placemark_filter(rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
+    return {
+        "success": True,
+        "filter": lg_service.get_placemark_filter_status(rig_id=rig_id)
+    }
+
+@app.post("/lg/placemark-filter")
+async def lg_set_placemark_filter(config: LGPlacemarkFilterConfig, rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
+    return {
+        "success": True,
+        "message": "Placemark movement filter updated",
+        "filter": lg_service.configure_placemark_filter(
+            config.min_distance_m, config.min_interval_s, config.force_refresh_s, rig_id=rig_id
+        )
+    }
+
+@app.get("/lg/screen-state")
+async def lg_screen_state(rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
+    return {
+        "success": True,
+        "reconciler": lg_service.get_reconciler_status(rig_id=rig_id),
+        "sensor_snapshots": sensor_snapshots.get_status(),
+        "dashboard_renderer": dashboard_renderer.get_status()
+    }
+
+@app.get("/lg/scheduler")
+async def lg_scheduler_status(rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
+    return {
+        "success": True,
+        "scheduler": lg_service.get_scheduler_status(rig_id=rig_id),
+        "single_flight": lg_service.get_single_flight_status()
+    }
+
+@app.get("/lg/rigs")
+async def lg_list_rigs():
+    return {
+        "success": True,
+        "rigs": lg_service.list_rigs()
+    }
+
+@app.delete("/lg/rigs/{rig_id}")
+async def lg_remove_rig(rig_id: str):
+    success = await lg_service.remove_rig(rig_id)
+    return {
+        "success": success,
+        "message": f"Rig {rig_id} removed" if success else f"Rig {rig_id} cannot be removed"
+    }
+
 @app.post("/robot/reset-to-initial")
 async def reset_robot_to_initial():
     
     robot.reset_to_initial_position()
     
-    if lg_service.is_robot_tracking_active():
+    tracking_rigs = lg_service.get_tracking_rig_ids()
+    if tracking_rigs:
         try:
             gps_data = robot.sensor_data.gps
-            await lg_service.show_robot_location(
-                latitude=gps_data.latitude,
-                longitude=gps_data.longitude,
-                altitude=gps_data.altitude
-            )
+            await asyncio.gather(*(
+                lg_service.show_robot_location(
+                    latitude=gps_data.latitude,
+                    longitude=gps_data.longitude,
+                    altitude=gps_data.altitude,
+                    rig_id=tracking_rig
+                )
+                for tracking_rig in tracking_rigs
+            ))
             print(f"Robot reset and placemark updated: {gps_data.latitude:.6f}, {gps_data.longitude:.6f}")
         except Exception as e:
             print(f"Error updating placemark after reset: {e}")
@@ -349,6 +538,53 @@ async def get_robot_cycle_info():
         "update_interval_seconds": robot.update_interval
     }
 
+def _export_range(start: Optional[datetime], end: Optional[datetime]) -> Tuple[Optional[float], Optional[float]]:
+    timestamps = []
+    for value in (start, end):
+        if value is not None and value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        timestamps.append(value.timestamp() if value is not None else None)
+    start_ts, end_ts = timestamps
+    
+    if start_ts is not None and end_ts is not None and start_ts > end_ts:
+        raise HTTPException(status_code=400, detail="start must not be after end")
+    if not robot.telemetry_history.has_points(start_ts, end_ts):
+        raise HTTPException(status_code=404, detail="No telemetry recorded in the requested range")
+    return start_ts, end_ts
+
+def _export_filename(extension: str, start_ts: Optional[float], end_ts: Optional[float]) -> str:
+    start_label = time.strftime('%Y%m%dT%H%M%SZ', time.gmtime(start_ts)) if start_ts is not None else "start"
+    end_label = time.strftime('%Y%m%dT%H%M%SZ', time.gmtime(end_ts)) if end_ts is not None else "now"
+    return f"robot_track_{start_label}_{end_label}.{extension}"
+
+@app.get("/export/track.kml")
+async def export_track_kml(
+    start: Optional[datetime] = Query(None, description="Range start (ISO 8601 or Unix seconds, UTC if no zone)"),
+    end: Optional[datetime] = Query(None, description="Range end (ISO 8601 or Unix seconds, UTC if no zone)")
+):
+    start_ts, end_ts = _export_range(start, end)
+    kml_parts = iter_track_kml(robot.telemetry_history.iter_range(start_ts, end_ts))
+    
+    return StreamingResponse(
+        (part.encode('utf-8') for part in kml_parts),
+        media_type="application/vnd.google-earth.kml+xml",
+        headers={"Content-Disposition": f'attachment; filename="{_export_filename("kml", start_ts, end_ts)}"'}
+    )
+
+@app.get("/export/track.kmz")
+async def export_track_kmz(
+    start: Optional[datetime] = Query(None, description="Range start (ISO 8601 or Unix seconds, UTC if no zone)"),
+    end: Optional[datetime] = Query(None, description="Range end (ISO 8601 or Unix seconds, UTC if no zone)")
+):
+    start_ts, end_ts = _export_range(start, end)
+    kml_parts = iter_track_kml(robot.telemetry_history.iter_range(start_ts, end_ts))
+    
+    return StreamingResponse(
+        iter_track_kmz(kml_parts),
+        media_type="application/vnd.google-earth.kmz",
+        headers={"Content-Disposition": f'attachment; filename="{_export_filename("kmz", start_ts, end_ts)}"'}
+    )
+
 @app.post("/orbit/start")
 async def start_orbit(orbit_request: OrbitRequest):
 
@@ -461,7 +697,7 @@ async def stop_orbit(
             "message": "There is no orbit currently running"
         }
     
-    stopped = _orbit_builder.stop_orbit(timeout=timeout, force=force)
+    stopped = await run_blocking(_orbit_builder.stop_orbit, timeout=timeout, force=force)
     
     if stopped:
         print(f"[{time.strftime('%H:%M:%S')}] Orbit stopped successfully")
@@ -484,6 +720,53 @@ async def stop_orbit(
                 "message": f"Orbit did not stop within {timeout} seconds. Try with force=true parameter."
             }
 
+ORBIT_BATCH_OPS = ("orbit_start", "orbit_stop")
+
+async def _run_orbit_batch_operation(operation: LGBatchOperation, rig_id: str) -> Dict[str, Any]:
+    if rig_id != DEFAULT_RIG_ID:
+        return {"op": operation.op, "success": False, "error": "Orbit is only available on the default rig"}
+    try:
+        if operation.op == "orbit_start":
+            response = await start_orbit(OrbitRequest(**operation.params))
+        else:
+            response = await stop_orbit(
+                force=operation.params.get("force", False),
+                timeout=operation.params.get("timeout", 2.0)
+            )
+        return {"op": operation.op, "success": response["success"], "status": response["status"]}
+    except Exception as e:
+        return {"op": operation.op, "success": False, "error": str(e)}
+
+@app.post("/lg/batch")
+async def lg_batch(request: LGBatchRequest, rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
+    results: List[Dict[str, Any]] = []
+    lg_operations: List[Dict[str, Any]] = []
+    snapshot = None
+
+    async def run_lg_operations():
+        if lg_operations:
+            results.extend(await lg_service.run_batch(lg_operations, rig_id=rig_id))
+            lg_operations.clear()
+    
+    for operation in request.operations:
+        if operation.op in ORBIT_BATCH_OPS:
+            await run_lg_operations()
+            results.append(await _run_orbit_batch_operation(operation, rig_id))
+            continue
+        params = dict(operation.params)
+        if operation.op == "show_sensors":
+            if snapshot is None:
+                robot.update_sensors()
+                snapshot = sensor_snapshots.get(robot.sensor_data, robot.actuator_data, robot.snapshot_version)
+            params["sensor_data"] = snapshot
+        lg_operations.append({"op": operation.op, "params": params})
+    await run_lg_operations()
+    
+    return {
+        "success": all(result["success"] for result in results),
+        "results": results
+    }
+
 @app.get("/orbit/config")
 async def get_orbit_config():
     global _orbit_builder
@@ -503,7 +786,8 @@ async def get_orbit_config():
                 "ip": _orbit_builder.ip if _orbit_builder else None,
                 "user": _orbit_builder.user if _orbit_builder else None,
             } if _orbit_builder else None
-        }
+        },
+        "ssh_sessions": ssh_pool.get_status()
     }
 
 @app.get("/orbit/status")
@@ -555,8 +839,8 @@ async def quick_start_orbit(
     return result
 
 @app.post("/lg/update-robot-location")
-async def lg_update_robot_location():
-    if not lg_service.is_robot_tracking_active():
+async def lg_update_robot_location(rig_id: str = Query(DEFAULT_RIG_ID, description="Liquid Galaxy rig identifier")):
+    if not lg_service.is_robot_tracking_active(rig_id=rig_id):
         return {
             "success": False,
             "message": "Robot tracking is not active"
@@ -570,7 +854,8 @@ async def lg_update_robot_location():
     success = await lg_service.show_robot_location(
         latitude=gps_data.latitude,
         longitude=gps_data.longitude,
-        altitude=gps_data.altitude
+        altitude=gps_data.altitude,
+        rig_id=rig_id
     )
     
     return {
@@ -784,14 +1069,19 @@ async def websocket_endpoint(websocket: WebSocket):
         while True:
             robot.update_sensors()
             
-            if lg_service.is_robot_tracking_active() and robot.has_gps_changed():
+            tracking_rigs = lg_service.get_tracking_rig_ids()
+            if tracking_rigs and robot.has_gps_changed():
                 try:
                     gps_data = robot.sensor_data.gps
-                    await lg_service.show_robot_location(
-                        latitude=gps_data.latitude,
-                        longitude=gps_data.longitude,
-                        altitude=gps_data.altitude
-                    )
+                    await asyncio.gather(*(
+                        lg_service.show_robot_location(
+                            latitude=gps_data.latitude,
+                            longitude=gps_data.longitude,
+                            altitude=gps_data.altitude,
+                            rig_id=tracking_rig
+                        )
+                        for tracking_rig in tracking_rigs
+                    ))
                     print(f"[{time.strftime('%H:%M:%S')}] IMMEDIATE placemark update: {gps_data.latitude:.6f}, {gps_data.longitude:.6f}")
                 except Exception as e:
                     print(f"Error auto-updating robot location: {e}")
@@ -817,47 +1107,62 @@ if __name__ == "__main__":
     print(f"🖼️  Available images: {len(robot.image_files)}")
     if robot.image_files:
         print(f"   Images: {', '.join(robot.image_files)}")
-    print(f"🌐 Server running on: http://0.0.0.0:8000")
-    print(f"📊 Available endpoints:")
-    print(f"   GET  /sensors           - Current sensor data")
-    print(f"   GET  /actuators         - Current actuator data")
-    print(f"   GET  /config            - Server configuration")
-    print(f"   POST /force-update      - Force data update")
-    print(f"   GET  /rgb-camera        - RGB camera sensor data")
-    print(f"   GET  /rgb-camera/image  - Current camera image file")
-    print(f"   GET  /rgb-camera/image-data - Camera image as base64 + metadata")
-    print(f"   WS   /ws                - WebSocket real-time data")
-    print(f"   POST /lg-config         - Set Liquid Galaxy configuration")
-    print(f"   GET  /lg-config         - Get Liquid Galaxy configuration")
-    print(f"   POST /lg/login          - Login to Liquid Galaxy")
-    print(f"   POST /lg/show-logo      - Show logo on Liquid Galaxy")
-    print(f"   POST /lg/show-camera    - Show camera feed on Liquid Galaxy")
-    print(f"   POST /lg/show-sensors   - Show sensor data on Liquid Galaxy")
-    print(f"   POST /lg/hide-sensors   - Hide sensor data from Liquid Galaxy")
-    print(f"   POST /lg/disconnect     - Disconnect from Liquid Galaxy")
-    print(f"   POST /lg/clear-all-kml  - Clear all KML content from Liquid Galaxy")
-    print(f"   POST /lg/show-robot-location - Show robot location on Liquid Galaxy (using current GPS)")
-    print(f"   POST /lg/show-robot-location-manual - Show robot location with manual coordinates")
-    print(f"   POST /lg/hide-robot-location - Hide robot location from Liquid Galaxy")
-    print(f"   POST /robot/reset-to-initial - Reset robot to initial coordinate position")
-    print(f"   GET  /robot/cycle-info - Get robot coordinate cycle information")
-    print(f"   POST /orbit/start - Start orbit around specified coordinates")
-    print(f"   POST /orbit/start-robot - Start orbit around current robot position")
-    print(f"   POST /orbit/quick-start - Quick start orbit with predefined parameters")
-    print(f"   POST /orbit/default - Start orbit with default coordinates from LocationData")
-    print(f"   POST /orbit/stop - Stop running orbit")
-    print(f"   GET  /orbit/status - Get current orbit status")
-    print(f"   GET  /orbit/config - Get orbit and LG configuration")
-    print(f"")
-    print(f"🌍 Location Data Endpoints:")
-    print(f"   GET  /location/info - Get current location info and available locations")
-    print(f"   GET  /location/gps-status - Get GPS status (real/simulated) and current zone")
-    print(f"   POST /location/set?location_name=<name> - Change current location (Lleida/Pozuelo)")
-    print(f"   GET  /location/gps-simulation-zones - Get available GPS simulation zones")
-    print(f"   GET  /location/orbit-coordinates - Get default orbit coordinates")
-    print(f"   GET  /location/robot-positions - Get robot GPS position sequence")
-    print(f"   GET  /location/orbit-parameters - Get orbit parameters for different types")
-    print(f"   GET  /lg/robot-tracking-status - Get robot tracking status")
+    print("🌐 Server running on: http://0.0.0.0:8000")
+    print("📊 Available endpoints:")
+    print("   GET  /sensors           - Current sensor data")
+    print("   GET  /actuators         - Current actuator data")
+    print("   GET  /config            - Server configuration")
+    print("   POST /force-update      - Force data update")
+    print("   GET  /rgb-camera        - RGB camera sensor data")
+    print("   GET  /rgb-camera/image  - Current camera image file")
+    print("   GET  /rgb-camera/image-data - Camera image as base64 + metadata")
+    print("   WS   /ws                - WebSocket real-time data")
+    print("   POST /lg-config         - Set Liquid Galaxy configuration")
+    print("   GET  /lg-config         - Get Liquid Galaxy configuration")
+    print("   POST /lg/login          - Login to Liquid Galaxy")
+    print("   POST /lg/show-logo      - Show logo on Liquid Galaxy")
+    print("   POST /lg/show-camera    - Show camera feed on Liquid Galaxy")
+    print("   POST /lg/show-sensors   - Show sensor data on Liquid Galaxy")
+    print("   POST /lg/hide-sensors   - Hide sensor data from Liquid Galaxy")
+    print("   POST /lg/disconnect     - Disconnect from Liquid Galaxy")
+    print("   POST /lg/clear-all-kml  - Clear all KML content from Liquid Galaxy")
+    print("   POST /lg/show-robot-location - Show robot location on Liquid Galaxy (using current GPS)")
+    print("   POST /lg/show-robot-location-manual - Show robot location with manual coordinates")
+    print("   POST /lg/hide-robot-location - Hide robot location from Liquid Galaxy")
+    print("   POST /lg/show-robot-location-live - Link LG to the live robot placemark served by this API")
+    print("   GET  /lg/live/robot.kml - Live robot placemark KML (ETag, polled by LG)")
+    print("   POST /lg/show-robot-trail - Link LG to the simplified robot trail served by this API")
+    print("   POST /lg/hide-robot-trail - Remove the robot trail from LG")
+    print("   GET  /lg/live/trail.kml - Robot trail as a gx:Track (ETag, polled by LG)")
+    print("   POST /robot/reset-to-initial - Reset robot to initial coordinate position")
+    print("   GET  /robot/cycle-info - Get robot coordinate cycle information")
+    print("   GET  /export/track.kml - Stream recorded robot track as KML (?start=&end=)")
+    print("   GET  /export/track.kmz - Stream recorded robot track as zipped KMZ (?start=&end=)")
+    print("   POST /orbit/start - Start orbit around specified coordinates")
+    print("   POST /orbit/start-robot - Start orbit around current robot position")
+    print("   POST /orbit/quick-start - Quick start orbit with predefined parameters")
+    print("   POST /orbit/default - Start orbit with default coordinates from LocationData")
+    print("   POST /orbit/stop - Stop running orbit")
+    print("   GET  /orbit/status - Get current orbit status")
+    print("   GET  /orbit/config - Get orbit and LG configuration")
+    print("")
+    print("🌍 Location Data Endpoints:")
+    print("   GET  /location/info - Get current location info and available locations")
+    print("   GET  /location/gps-status - Get GPS status (real/simulated) and current zone")
+    print("   POST /location/set?location_name=<name> - Change current location (Lleida/Pozuelo)")
+    print("   GET  /location/gps-simulation-zones - Get available GPS simulation zones")
+    print("   GET  /location/orbit-coordinates - Get default orbit coordinates")
+    print("   GET  /location/robot-positions - Get robot GPS position sequence")
+    print("   GET  /location/orbit-parameters - Get orbit parameters for different types")
+    print("   GET  /lg/robot-tracking-status - Get robot tracking status")
+    print("   GET  /lg/placemark-filter - Get placemark movement filter thresholds")
+    print("   POST /lg/placemark-filter - Set placemark movement filter thresholds")
+    print("   GET  /lg/screen-state - Get desired/applied LG screen state")
+    print("   POST /lg/resync - Force-rewrite every LG screen from desired state")
+    print("   GET  /lg/scheduler - Get LG command queue depth and wait times")
+    print("   POST /lg/batch - Run an ordered list of LG/orbit operations in one request")
+    print("   GET  /lg/rigs - List registered Liquid Galaxy rigs (register with /lg/login?rig_id=...)")
+    print("   DEL  /lg/rigs/{rig_id} - Remove a registered rig")
     print("=" * 50)
 
 @app.on_event("shutdown")
@@ -868,13 +1173,17 @@ async def shutdown_event():
     
     if _orbit_builder and _orbit_builder.is_running():
         print("Stopping orbit before server shutdown...")
-        _orbit_builder.stop_orbit(timeout=1.0, force=True)
+        await run_blocking(_orbit_builder.stop_orbit, timeout=1.0, force=True)
 
     try:
-        await lg_service.disconnect()
+        await lg_service.disconnect(rig_id=None)
         print("Disconnected from Liquid Galaxy")
     except Exception as e:
         print(f"Error disconnecting from LG: {e}")
 
+    await run_blocking(ssh_pool.close_all)
+    shutdown_ssh_executor()
+    dashboard_renderer.shutdown()
+
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -5,6 +5,7 @@ import base64
 from typing import List
 from models import SensorData, IMUData, ThreeAxisData, GPSData, RGBCameraData, ActuatorData, ServoData
 from SimulatedGPS import LocationData
+from telemetry_history import TelemetryHistory
 
 class RobotSimulator:
     def __init__(self):
@@ -19,6 +20,8 @@ class RobotSimulator:
         self.update_interval = 5.0
         self.last_update = 0.0
         self.gps_changed = False 
+        self.snapshot_version = 0
+        self.telemetry_history = TelemetryHistory()
         
         self.images_folder = "images"
         self.image_files = self._load_image_files()
@@ -50,7 +53,12 @@ class RobotSimulator:
             back_left_wheel=self._create_servo_data(),
             back_right_wheel=self._create_servo_data()
         )
+        self._record_telemetry(self.sensor_data.timestamp)
     
+    def _record_telemetry(self, timestamp: float):
+        gps = self.sensor_data.gps
+        self.telemetry_history.append(timestamp, gps.latitude, gps.longitude, gps.altitude, gps.speed)
+
     def _create_servo_data(self) -> ServoData:
         return ServoData(
             speed=random.randint(0, 150),
@@ -131,6 +139,7 @@ class RobotSimulator:
             return
 
         self.last_update = current_time
+        self.snapshot_version += 1
         self.sensor_data.timestamp = current_time
 
         self.sensor_data.imu.accelerometer = self._create_three_axis_data()
@@ -162,6 +171,7 @@ class RobotSimulator:
         self.actuator_data.front_right_wheel = self._create_servo_data()
         self.actuator_data.back_left_wheel = self._create_servo_data()
         self.actuator_data.back_right_wheel = self._create_servo_data()
+        self._record_telemetry(current_time)
         
         prev_index = (self.current_gps_index - 1) % len(self.gps_positions)
         print(f"[{time.strftime('%H:%M:%S')}] Sensor data updated - GPS: {self.sensor_data.gps.latitude:.6f}, {self.sensor_data.gps.longitude:.6f} (Position {prev_index + 1}/{len(self.gps_positions)} in sequence)")
@@ -176,6 +186,8 @@ class RobotSimulator:
         initial_lat, initial_lon = self.gps_positions[0]
         self.sensor_data.gps.latitude = initial_lat
         self.sensor_data.gps.longitude = initial_lon
+        self.snapshot_version += 1
+        self._record_telemetry(time.time())
         self.gps_changed = True
         print(f"[{time.strftime('%H:%M:%S')}] Robot reset to initial position: {initial_lat:.6f}, {initial_lon:.6f}")
 
@@ -0,0 +1,85 @@
+from bisect import bisect_left
+from collections import deque, namedtuple
+from itertools import islice
+from typing import Deque, Iterator, List, Optional
+
+HISTORY_MAX_POINTS = 100000
+HISTORY_EXPORT_CHUNK = 1000
+
+TelemetryPoint = namedtuple('TelemetryPoint', ['seq', 'timestamp', 'latitude', 'longitude', 'altitude', 'speed'])
+
+class TelemetryHistory:
+    def __init__(self, max_points: int = HISTORY_MAX_POINTS):
+        self._points: Deque[TelemetryPoint] = deque(maxlen=max_points)
+        self.next_seq = 1
+        self.dropped_count = 0
+
+    def append(self, timestamp: float, latitude: float, longitude: float, altitude: float, speed: float = 0.0) -> TelemetryPoint:
+        if len(self._points) == self._points.maxlen:
+            self.dropped_count += 1
+        point = TelemetryPoint(self.next_seq, timestamp, latitude, longitude, altitude, speed)
+        self._points.append(point)
+        self.next_seq += 1
+        return point
+
+    def since(self, seq: int) -> List[TelemetryPoint]:
+        newer = []
+        for point in reversed(self._points):
+            if point.seq <= seq:
+                break
+            newer.append(point)
+        newer.reverse()
+        return newer
+
+    def iter_points(self) -> Iterator[TelemetryPoint]:
+        return iter(list(self._points))
+
+    def _first_seq_at(self, timestamp: Optional[float]) -> int:
+        if not self._points:
+            return self.next_seq
+        if timestamp is None:
+            return self._points[0].seq
+        index = bisect_left(self._points, timestamp, key=lambda point: point.timestamp)
+        return self._points[index].seq if index < len(self._points) else self.next_seq
+
+    def has_points(self, start: Optional[float] = None, end: Optional[float] = None) -> bool:
+        seq = self._first_seq_at(start)
+        if seq >= self.next_seq:
+            return False
+        point = self._points[seq - self._points[0].seq]
+        return end is None or point.timestamp <= end
+
+    def iter_range(self, start: Optional[float] = None, end: Optional[float] = None,
+                   chunk_size: int = HISTORY_EXPORT_CHUNK) -> Iterator[List[TelemetryPoint]]:
+        next_seq = self._first_seq_at(start)
+        last_seq = self.next_seq - 1
+        while next_seq <= last_seq:
+            try:
+                if not self._points:
+                    return
+                offset = max(0, next_seq - self._points[0].seq)
+                chunk = list(islice(self._points, offset, offset + chunk_size))
+            except RuntimeError:
+                continue
+            chunk = [
+                point for point in chunk
+                if point.seq <= last_seq and (start is None or point.timestamp >= start)
+                and (end is None or point.timestamp <= end)
+            ]
+            if not chunk:
+                return
+            yield chunk
+            next_seq = chunk[-1].seq + 1
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def get_status(self) -> dict:
+        return {
+            "points": len(self._points),
+            "max_points": self._points.maxlen,
+            "last_seq": self.next_seq - 1,
+            "dropped": self.dropped_count,
+            "first_timestamp": self._points[0].timestamp if self._points else None,
+            "last_timestamp": self._points[-1].timestamp if self._points else None,
+        }
@@ -0,0 +1,25 @@
+import os
+import sys
+
+import pytest
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SERVER_DIR not in sys.path:
+    sys.path.insert(0, SERVER_DIR)
+
+@pytest.fixture
+def server_dir():
+    return SERVER_DIR
+
+@pytest.fixture
+def local_lg(tmp_path, monkeypatch, server_dir):
+    import LG.lg_data as lg_data
+
+    monkeypatch.chdir(server_dir)
+    monkeypatch.setattr(lg_data, "LG_TRANSPORT", "local")
+    monkeypatch.setattr(lg_data, "LG_LOCAL_ROOT", str(tmp_path))
+    monkeypatch.setattr(lg_data, "LG_LOCAL_LATENCY_S", 0.0)
+    monkeypatch.setattr(lg_data, "LG_LOCAL_FAILURE_RATE", 0.0)
+    for name in ("LG_HOST", "LG_USERNAME", "LG_PASSWORD", "LG_TOTAL_SCREENS"):
+        monkeypatch.setattr(lg_data, name, None)
+    return tmp_path
@@ -0,0 +1,75 @@
+import threading
+
+import pytest
+
+from LG.command_scheduler import (
+    LGCommandExpired, LGCommandScheduler, PRIORITY_HOUSEKEEPING, PRIORITY_NAVIGATION, PRIORITY_TELEMETRY,
+    deadline_in
+)
+
+WAIT_S = 5.0
+
+@pytest.fixture
+def scheduler():
+    scheduler = LGCommandScheduler("test", general_workers=1)
+    yield scheduler
+    scheduler.close()
+
+def block_general_lane(scheduler):
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocker():
+        started.set()
+        release.wait(WAIT_S)
+
+    future = scheduler.submit(PRIORITY_HOUSEKEEPING, blocker)
+    assert started.wait(WAIT_S)
+    return release, future
+
+def test_higher_priority_runs_first(scheduler):
+    release, blocker = block_general_lane(scheduler)
+    order = []
+
+    housekeeping = scheduler.submit(PRIORITY_HOUSEKEEPING, order.append, "housekeeping")
+    telemetry = scheduler.submit(PRIORITY_TELEMETRY, order.append, "telemetry")
+    release.set()
+
+    blocker.result(WAIT_S)
+    housekeeping.result(WAIT_S)
+    telemetry.result(WAIT_S)
+    assert order == ["telemetry", "housekeeping"]
+
+def test_navigation_lane_is_not_blocked_by_general_work(scheduler):
+    release, blocker = block_general_lane(scheduler)
+    try:
+        assert scheduler.submit(PRIORITY_NAVIGATION, lambda: "flown").result(WAIT_S) == "flown"
+    finally:
+        release.set()
+    blocker.result(WAIT_S)
+
+def test_commands_past_their_deadline_expire(scheduler):
+    release, blocker = block_general_lane(scheduler)
+    calls = []
+
+    expired = scheduler.submit(PRIORITY_TELEMETRY, calls.append, "late", deadline=deadline_in(-1))
+    fresh = scheduler.submit(PRIORITY_TELEMETRY, calls.append, "fresh", deadline=deadline_in(WAIT_S))
+    release.set()
+
+    with pytest.raises(LGCommandExpired):
+        expired.result(WAIT_S)
+    fresh.result(WAIT_S)
+    blocker.result(WAIT_S)
+    assert calls == ["fresh"]
+    assert scheduler.get_status()["classes"]["telemetry"]["expired"] == 1
+
+def test_close_cancels_queued_commands(scheduler):
+    release, blocker = block_general_lane(scheduler)
+    queued = scheduler.submit(PRIORITY_HOUSEKEEPING, lambda: None)
+
+    scheduler.close()
+    release.set()
+
+    assert queued.cancelled()
+    with pytest.raises(RuntimeError):
+        scheduler.submit(PRIORITY_TELEMETRY, lambda: None).result(WAIT_S)
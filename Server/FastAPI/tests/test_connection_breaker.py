@@ -0,0 +1,50 @@
+from LG.connection_breaker import BREAKER_CLOSED, BREAKER_HALF_OPEN, BREAKER_OPEN, ConnectionBreaker
+
+def make_breaker() -> ConnectionBreaker:
+    return ConnectionBreaker(failure_threshold=2, base_delay_s=1.0, max_delay_s=4.0, jitter=0.0)
+
+def test_opens_after_consecutive_failures():
+    breaker = make_breaker()
+
+    breaker.record_failure("refused", now=0.0)
+    assert breaker.state == BREAKER_CLOSED
+    assert breaker.allow_attempt(now=0.0)
+
+    breaker.record_failure("refused", now=0.0)
+    assert breaker.state == BREAKER_OPEN
+    assert not breaker.allow_attempt(now=0.5)
+    assert breaker.retry_in(now=0.5) == 0.5
+    assert breaker.rejected_count == 1
+
+def test_half_open_probe_reopens_with_longer_backoff():
+    breaker = make_breaker()
+    breaker.record_failure(now=0.0)
+    breaker.record_failure(now=0.0)
+
+    assert breaker.allow_attempt(now=1.0)
+    assert breaker.state == BREAKER_HALF_OPEN
+
+    breaker.record_failure("still down", now=1.0)
+    assert breaker.state == BREAKER_OPEN
+    assert breaker.retry_in(now=1.0) == 2.0
+
+    for _ in range(3):
+        now = breaker.retry_at
+        assert breaker.allow_attempt(now=now)
+        breaker.record_failure(now=now)
+    assert breaker.retry_in(now=breaker.retry_at - 4.0) == 4.0
+
+def test_success_closes_and_resets_backoff():
+    breaker = make_breaker()
+    breaker.record_failure(now=0.0)
+    breaker.record_failure(now=0.0)
+    assert breaker.allow_attempt(now=1.0)
+
+    breaker.record_success()
+    assert breaker.state == BREAKER_CLOSED
+    assert breaker.open_count == 0
+    assert breaker.last_error is None
+
+    breaker.record_failure(now=10.0)
+    breaker.record_failure(now=10.0)
+    assert breaker.retry_in(now=10.0) == 1.0
@@ -0,0 +1,55 @@
+import asyncio
+import time
+
+import pytest
+
+import LG.lg_data as lg_data
+from LG.lg_service import LGService
+from LG.sensor_items import SensorSnapshot
+from robot_simulator import RobotSimulator
+
+TRANSPORT_LATENCY_S = 0.1
+LAG_SAMPLE_INTERVAL_S = 0.005
+MAX_LOOP_LAG_S = 0.05
+
+async def sample_loop_lag(stop: asyncio.Event, samples: list):
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + LAG_SAMPLE_INTERVAL_S
+        await asyncio.sleep(LAG_SAMPLE_INTERVAL_S)
+        samples.append(loop.time() - expected)
+
+@pytest.fixture
+def local_rig(local_lg, monkeypatch):
+    monkeypatch.setattr(lg_data, "LG_LOCAL_LATENCY_S", TRANSPORT_LATENCY_S)
+    return local_lg
+
+def test_lg_operations_do_not_stall_event_loop(local_rig):
+    robot = RobotSimulator()
+    snapshot = SensorSnapshot(1, robot.sensor_data, robot.actuator_data)
+    gps = robot.sensor_data.gps
+
+    async def scenario():
+        service = LGService()
+        stop = asyncio.Event()
+        samples = []
+        sampler = asyncio.create_task(sample_loop_lag(stop, samples))
+
+        started = time.monotonic()
+        login = await service.login("lg1", "lg", "lg", 3)
+        assert login.success, login.message
+        assert await service.show_sensor_data(snapshot, ['GPS Position', 'IMU Sensors'])
+        assert await service.show_robot_location(gps.latitude + 0.01, gps.longitude + 0.01, gps.altitude)
+        assert await service.hide_robot_location()
+        assert await service.hide_sensor_data()
+        elapsed = time.monotonic() - started
+
+        stop.set()
+        await sampler
+        return elapsed, samples
+
+    elapsed, samples = asyncio.run(scenario())
+
+    assert elapsed > TRANSPORT_LATENCY_S * 5
+    assert samples
+    assert max(samples) < MAX_LOOP_LAG_S, f"event loop stalled for {max(samples) * 1000:.1f}ms"
@@ -0,0 +1,47 @@
+from LG.movement_filter import MovementFilter, haversine_m
+
+LAT, LON = 41.6063, 0.6071
+TEN_METRES = 10 / 111320
+
+def make_filter() -> MovementFilter:
+    return MovementFilter(min_distance_m=1.0, min_interval_s=0.5, force_refresh_s=30.0)
+
+def test_haversine_matches_known_distance():
+    assert abs(haversine_m(LAT, LON, LAT + TEN_METRES, LON) - 10.0) < 0.05
+
+def test_first_position_is_sent_and_jitter_is_suppressed():
+    movement_filter = make_filter()
+
+    assert movement_filter.should_send(LAT, LON, now=0.0)
+    assert not movement_filter.should_send(LAT + TEN_METRES / 100, LON, now=5.0)
+    assert movement_filter.suppressed_count == 1
+    assert movement_filter.flush_delay(now=5.0) == 25.0
+
+def test_fast_updates_hold_the_latest_position_until_due():
+    movement_filter = make_filter()
+    assert movement_filter.should_send(LAT, LON, now=0.0)
+
+    assert not movement_filter.should_send(LAT + TEN_METRES, LON, 1.0, now=0.1)
+    assert not movement_filter.should_send(LAT + 2 * TEN_METRES, LON, 2.0, now=0.2)
+    assert movement_filter.flush_delay(now=0.2) == 0.3
+    assert movement_filter.take_due(now=0.3) is None
+
+    assert movement_filter.take_due(now=0.5) == (LAT + 2 * TEN_METRES, LON, 2.0)
+    assert movement_filter.flushed_count == 1
+    assert movement_filter.flush_delay(now=0.5) is None
+    assert movement_filter.last_position == (LAT + 2 * TEN_METRES, LON)
+
+def test_stationary_robot_is_refreshed_periodically():
+    movement_filter = make_filter()
+    assert movement_filter.should_send(LAT, LON, now=0.0)
+    assert not movement_filter.should_send(LAT, LON, now=29.0)
+    assert movement_filter.should_send(LAT, LON, now=30.0)
+
+def test_reset_sends_the_next_position_immediately():
+    movement_filter = make_filter()
+    assert movement_filter.should_send(LAT, LON, now=0.0)
+    assert not movement_filter.should_send(LAT + TEN_METRES, LON, now=0.1)
+
+    movement_filter.reset()
+    assert movement_filter.flush_delay() is None
+    assert movement_filter.should_send(LAT, LON, now=0.2)
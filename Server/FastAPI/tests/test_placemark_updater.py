@@ -0,0 +1,61 @@
+import asyncio
+
+from LG.placemark_updater import PlacemarkUpdater
+
+class SlowPlacemark:
+    def __init__(self):
+        self.applied = []
+        self.release = asyncio.Event()
+
+    async def apply(self, latitude: float, longitude: float, altitude: float) -> bool:
+        await self.release.wait()
+        self.release.clear()
+        self.applied.append((latitude, longitude, altitude))
+        return True
+
+async def wait_for_apply(placemark: SlowPlacemark, count: int):
+    placemark.release.set()
+    while len(placemark.applied) < count:
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+def test_updates_queued_behind_a_push_collapse_to_the_latest():
+    async def scenario():
+        placemark = SlowPlacemark()
+        updater = PlacemarkUpdater(placemark.apply)
+        first = asyncio.create_task(updater.submit(1, 1, 0))
+        await asyncio.sleep(0)
+        queued = [asyncio.create_task(updater.submit(n, n, 0)) for n in (2, 3, 4)]
+        await asyncio.sleep(0)
+
+        await wait_for_apply(placemark, 1)
+        await wait_for_apply(placemark, 2)
+        return placemark, updater, await asyncio.gather(first, *queued)
+
+    placemark, updater, results = asyncio.run(scenario())
+    assert placemark.applied == [(1, 1, 0), (4, 4, 0)]
+    assert results == [True, True, True, True]
+    assert updater.coalesced_count == 2
+    assert updater.last_applied == (4, 4, 0)
+
+def test_cancel_drops_pending_and_in_flight_results():
+    async def scenario():
+        placemark = SlowPlacemark()
+        updater = PlacemarkUpdater(placemark.apply)
+        in_flight = asyncio.create_task(updater.submit(1, 1, 0))
+        await asyncio.sleep(0)
+        pending = asyncio.create_task(updater.submit(2, 2, 0))
+        await asyncio.sleep(0)
+
+        cancel = asyncio.create_task(updater.cancel())
+        await asyncio.sleep(0)
+        placemark.release.set()
+        await cancel
+        return placemark, updater, await in_flight, await pending
+
+    placemark, updater, in_flight_result, pending_result = asyncio.run(scenario())
+    assert placemark.applied == [(1, 1, 0)]
+    assert in_flight_result is False
+    assert pending_result is False
+    assert updater.last_applied is None
+    assert not updater.is_busy()
@@ -0,0 +1,65 @@
+import asyncio
+import os
+
+from LG.lg_service import LGService
+
+def read_remote(root, host: str, remote_path: str):
+    local_path = os.path.join(root, host, remote_path.lstrip('/'))
+    if not os.path.exists(local_path):
+        return None
+    with open(local_path, encoding='utf-8') as local_file:
+        return local_file.read()
+
+def remove_remote(root, host: str, remote_path: str):
+    os.remove(os.path.join(root, host, remote_path.lstrip('/')))
+
+def test_unchanged_slaves_are_skipped_until_forced(local_lg):
+    slave_path = '/var/www/html/kml/slave_2.kml'
+
+    async def scenario():
+        service = LGService()
+        assert (await service.login("lg1", "lg", "pw", 3)).success
+        manager = service.connection_manager
+        reconciler = manager.reconciler
+
+        reconciler.set_slave(2, "<kml>two</kml>")
+        assert await reconciler.reconcile()
+        assert read_remote(local_lg, "lg1", slave_path) == "<kml>two</kml>"
+        writes = reconciler.slave_write_count
+
+        remove_remote(local_lg, "lg1", slave_path)
+        assert await reconciler.reconcile()
+        assert reconciler.slave_write_count == writes
+        assert read_remote(local_lg, "lg1", slave_path) is None
+
+        success, report = await reconciler.reconcile_with_report(force=True)
+        assert success
+        assert report[2]["success"]
+        assert read_remote(local_lg, "lg1", slave_path) == "<kml>two</kml>"
+
+        reconciler.set_slave(2, "<kml>changed</kml>")
+        assert await reconciler.reconcile()
+        assert read_remote(local_lg, "lg1", slave_path) == "<kml>changed</kml>"
+
+    asyncio.run(scenario())
+
+def test_query_is_only_written_on_request_or_forced_resync(local_lg):
+    query_path = '/tmp/query.txt'
+
+    async def scenario():
+        service = LGService()
+        assert (await service.login("lg1", "lg", "pw", 3)).success
+        manager = service.connection_manager
+
+        assert await manager.write_query("flytoview=old")
+        assert read_remote(local_lg, "lg1", query_path) == "flytoview=old\n"
+        remove_remote(local_lg, "lg1", query_path)
+
+        manager.reconciler.invalidate()
+        assert await manager.reconciler.reconcile()
+        assert read_remote(local_lg, "lg1", query_path) is None
+
+        assert await manager.reconciler.reconcile(force=True)
+        assert read_remote(local_lg, "lg1", query_path) == "flytoview=old\n"
+
+    asyncio.run(scenario())
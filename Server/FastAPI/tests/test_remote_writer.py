@@ -0,0 +1,97 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from LG.remote_writer import RemoteFileWriter
+
+ROUND_TRIP_S = 0.2
+
+class FakeChannel:
+    def __init__(self, failing_paths=()):
+        self.failing_paths = set(failing_paths)
+        self.closed = False
+        self.written = {}
+        self._inbound = b""
+        self._replies = []
+        self._condition = threading.Condition()
+
+    def settimeout(self, timeout):
+        pass
+
+    def exec_command(self, command):
+        pass
+
+    def sendall(self, data: bytes):
+        with self._condition:
+            self._inbound += data
+            while b"\n" in self._inbound:
+                header, rest = self._inbound.split(b"\n", 1)
+                size, path = header.decode('utf-8').split(" ", 1)
+                if len(rest) < int(size):
+                    break
+                self.written[path] = rest[:int(size)]
+                self._inbound = rest[int(size):]
+                status = b"ERR\n" if path in self.failing_paths else b"OK\n"
+                self._replies.append((time.monotonic() + ROUND_TRIP_S, status))
+            self._condition.notify_all()
+
+    def recv(self, size: int) -> bytes:
+        with self._condition:
+            while not self._replies and not self.closed:
+                self._condition.wait()
+            if self.closed:
+                return b""
+            ready_at, status = self._replies.pop(0)
+        time.sleep(max(0.0, ready_at - time.monotonic()))
+        return status
+
+    def close(self):
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+class FakeSession:
+    def __init__(self, failing_paths=()):
+        self.failing_paths = failing_paths
+        self.channels = []
+
+    def get_client(self):
+        return self
+
+    def get_transport(self):
+        return self
+
+    def open_session(self):
+        channel = FakeChannel(self.failing_paths)
+        self.channels.append(channel)
+        return channel
+
+def test_concurrent_writes_share_one_round_trip():
+    session = FakeSession()
+    writer = RemoteFileWriter(session)
+    paths = [f"/var/www/html/kml/slave_{screen}.kml" for screen in range(1, 8)]
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+        list(pool.map(lambda path: writer.write(path, f"<kml>{path}</kml>"), paths))
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 2 * ROUND_TRIP_S
+    assert len(session.channels) == 1
+    assert session.channels[0].written == {path: f"<kml>{path}</kml>".encode('utf-8') for path in paths}
+    assert writer.write_count == len(paths)
+    assert writer.peak_in_flight > 1
+
+def test_failed_write_reopens_the_stream():
+    session = FakeSession(failing_paths={"/tmp/bad.kml"})
+    writer = RemoteFileWriter(session)
+
+    with pytest.raises(RuntimeError):
+        writer.write("/tmp/bad.kml", "x")
+    writer.write("/tmp/good.kml", "y")
+
+    assert len(session.channels) == 2
+    assert session.channels[0].closed
+    assert session.channels[1].written == {"/tmp/good.kml": b"y"}
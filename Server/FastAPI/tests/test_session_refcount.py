@@ -0,0 +1,49 @@
+import asyncio
+
+from LG.lg_service import LGService
+from LG.ssh_pool import ssh_pool
+from LG.transport import SSHTransport
+
+def test_relogin_and_reconnect_release_local_references(local_lg):
+    async def scenario():
+        service = LGService()
+        assert (await service.login("lg1", "lg", "pw", 3, rig_id="refs")).success
+        first_manager = service.rigs["refs"].manager
+        transport = first_manager.transport
+        assert transport.ref_count == 1
+
+        assert (await service.login("lg1", "lg", "pw", 3, rig_id="refs")).success
+        manager = service.rigs["refs"].manager
+        assert manager is not first_manager
+        assert first_manager.transport is None
+        assert first_manager.placemark_updater.generation == 1
+        assert transport.ref_count == 1
+
+        transport._alive = False
+        assert await manager.connect()
+        assert manager.transport is transport
+        assert transport.ref_count == 1
+
+        assert await service.remove_rig("refs")
+        return transport
+
+    transport = asyncio.run(scenario())
+    assert transport.ref_count == 0
+    assert not transport.is_alive()
+
+def test_pooled_ssh_session_closes_on_last_release():
+    first = SSHTransport("refcount-host", "lg", "pw")
+    second = SSHTransport("refcount-host", "lg", "pw")
+    session = first.session
+    assert second.session is session
+    assert session.ref_count == 2
+
+    first.close()
+    first.close()
+    assert session.ref_count == 1
+    assert session in ssh_pool._sessions.values()
+
+    second.close()
+    assert session.ref_count == 0
+    assert session not in ssh_pool._sessions.values()
+    assert session.scheduler.submit(0, lambda: None).exception() is not None
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from LG.single_flight import SingleFlight, single_flight
+
+class FakeService:
+    def __init__(self):
+        self.single_flight = SingleFlight()
+        self.calls = []
+        self.release = None
+
+    @single_flight
+    async def show(self, rig_id: str = "default") -> str:
+        self.calls.append(rig_id)
+        await self.release.wait()
+        return f"shown on {rig_id}"
+
+    @single_flight
+    async def fail(self) -> bool:
+        self.calls.append("fail")
+        await self.release.wait()
+        raise RuntimeError("boom")
+
+def test_identical_concurrent_calls_share_one_execution():
+    async def scenario():
+        service = FakeService()
+        service.release = asyncio.Event()
+        calls = [asyncio.create_task(service.show(rig_id="a")) for _ in range(3)]
+        other = asyncio.create_task(service.show(rig_id="b"))
+        await asyncio.sleep(0)
+        service.release.set()
+        results = await asyncio.gather(*calls, other)
+        return service, results
+
+    service, results = asyncio.run(scenario())
+    assert results == ["shown on a"] * 3 + ["shown on b"]
+    assert sorted(service.calls) == ["a", "b"]
+    assert service.single_flight.get_status() == {"in_flight": 0, "executed": 2, "shared": 2}
+
+def test_finished_calls_run_again():
+    async def scenario():
+        service = FakeService()
+        service.release = asyncio.Event()
+        service.release.set()
+        await service.show()
+        await service.show()
+        return service
+
+    assert asyncio.run(scenario()).calls == ["default", "default"]
+
+def test_callers_share_the_failure():
+    async def scenario():
+        service = FakeService()
+        service.release = asyncio.Event()
+        calls = [asyncio.create_task(service.fail()) for _ in range(2)]
+        await asyncio.sleep(0)
+        service.release.set()
+        return service, await asyncio.gather(*calls, return_exceptions=True)
+
+    service, results = asyncio.run(scenario())
+    assert service.calls == ["fail"]
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+def test_cancelled_caller_does_not_cancel_shared_execution():
+    async def scenario():
+        service = FakeService()
+        service.release = asyncio.Event()
+        first = asyncio.create_task(service.show())
+        second = asyncio.create_task(service.show())
+        await asyncio.sleep(0)
+        first.cancel()
+        service.release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(scenario()) == "shown on default"
@@ -0,0 +1,61 @@
+import io
+import zipfile
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from LG.track_export import KMZ_DOCUMENT_NAME, iter_track_kml, iter_track_kmz
+from telemetry_history import TelemetryHistory
+
+START = 1700000000
+
+@pytest.fixture
+def history(monkeypatch):
+    history = TelemetryHistory()
+    for offset in range(10):
+        history.append(START + offset * 10, 41.6 + offset * 1e-4, 0.6, 200.0)
+    monkeypatch.setattr(main.robot, "telemetry_history", history)
+    return history
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+def test_iter_range_is_inclusive_and_chunked(history):
+    chunks = list(history.iter_range(START + 20, START + 50, chunk_size=3))
+    assert [len(chunk) for chunk in chunks] == [3, 1]
+    assert [point.timestamp for chunk in chunks for point in chunk] == [START + 20, START + 30, START + 40, START + 50]
+
+def test_has_points_matches_the_recorded_span(history):
+    assert history.has_points()
+    assert history.has_points(START + 15, START + 25)
+    assert not history.has_points(START + 11, START + 19)
+    assert not history.has_points(START + 100)
+
+def test_kml_chunks_join_into_one_continuous_track(history):
+    kml = ''.join(iter_track_kml(history.iter_range(chunk_size=4)))
+    assert kml.count("<gx:Track>") == 3
+    assert kml.count("<gx:coord>") == 10 + 2
+
+def test_kmz_stream_is_a_valid_archive(history):
+    kml = ''.join(iter_track_kml(history.iter_range(chunk_size=3)))
+    kmz = b''.join(iter_track_kmz(iter_track_kml(history.iter_range(chunk_size=3))))
+    with zipfile.ZipFile(io.BytesIO(kmz)) as archive:
+        assert archive.namelist() == [KMZ_DOCUMENT_NAME]
+        assert archive.read(KMZ_DOCUMENT_NAME) == kml.encode('utf-8')
+
+def test_export_endpoint_filters_by_range(history, client):
+    response = client.get("/export/track.kml", params={"start": START + 20, "end": START + 40})
+    assert response.status_code == 200
+    assert response.text.count("<gx:coord>") == 3
+    assert 'filename="robot_track_20231114T221340Z_20231114T221400Z.kml"' in response.headers["content-disposition"]
+
+def test_export_range_treats_naive_times_as_utc(history, client):
+    response = client.get("/export/track.kml", params={"start": "2023-11-14T22:13:20", "end": "2023-11-14T22:13:30"})
+    assert response.status_code == 200
+    assert response.text.count("<gx:coord>") == 2
+
+def test_export_rejects_bad_or_empty_ranges(history, client):
+    assert client.get("/export/track.kml", params={"start": START + 50, "end": START}).status_code == 400
+    assert client.get("/export/track.kmz", params={"start": START + 1000}).status_code == 404
@@ -0,0 +1,52 @@
+from LG.track_trail import TrackTrail
+from telemetry_history import TelemetryHistory, TelemetryPoint
+
+def point(seq: int, latitude: float, longitude: float) -> TelemetryPoint:
+    return TelemetryPoint(seq, 1700000000 + seq, latitude, longitude, 0.0, 0.0)
+
+def coordinates(trail: TrackTrail):
+    return [(vertex.point.latitude, vertex.point.longitude) for vertex in trail.vertices()]
+
+def test_collinear_points_go_before_corners():
+    trail = TrackTrail(vertex_budget=3)
+    path = [(0.0, 0.0), (0.0, 0.001), (0.0, 0.002), (0.001, 0.002), (0.002, 0.002)]
+    for seq, (latitude, longitude) in enumerate(path, start=1):
+        trail.append(point(seq, latitude, longitude))
+
+    assert coordinates(trail) == [(0.0, 0.0), (0.0, 0.002), (0.002, 0.002)]
+    assert trail.simplified_count == 2
+
+def test_budget_is_kept_and_endpoints_survive():
+    trail = TrackTrail(vertex_budget=10)
+    for seq in range(1, 201):
+        trail.append(point(seq, 41.6 + seq * 1e-5, 0.6 + (seq % 7) * 1e-5))
+
+    vertices = trail.vertices()
+    assert trail.vertex_count == len(vertices) == 10
+    assert vertices[0].point.seq == 1
+    assert vertices[-1].point.seq == 200
+    assert [vertex.point.seq for vertex in vertices] == sorted(vertex.point.seq for vertex in vertices)
+
+def test_sync_only_appends_new_history():
+    history = TelemetryHistory()
+    trail = TrackTrail()
+    for seq in range(3):
+        history.append(1700000000 + seq, 41.6 + seq * 1e-4, 0.6, 0.0)
+
+    assert trail.sync(history) == 3
+    assert trail.sync(history) == 0
+    history.append(1700000010, 41.7, 0.6, 0.0)
+    assert trail.sync(history) == 1
+    assert trail.last_seq == 4
+
+def test_kml_is_cached_per_revision():
+    trail = TrackTrail()
+    trail.append(point(1, 41.6, 0.6))
+    trail.append(point(2, 41.7, 0.6))
+
+    kml = trail.to_kml()
+    assert trail.to_kml() is kml
+    assert kml.count("<gx:coord>") == 2
+
+    trail.append(point(3, 41.8, 0.6))
+    assert trail.to_kml().count("<gx:coord>") == 3